@@ -1,7 +1,15 @@
 import argparse
-from src.services.get_requirements import get_requirements
+import sys
+import time
+from src.services.get_requirements import (
+    iter_requirements, iter_requirements_concurrent, import_app_index
+)
 from src.services.get_system_specs import get_system_specs
-from src.services.analyze_game_compatibility import analyze_game_compatibility
+from src.services.analyze_game_compatibility import iter_analyses_concurrent, analyze_games_batched
+from src.services.local_compatibility_engine import ENGINES, analyze_with_engine
+from src.services.analysis_pipeline import AnalysisPipeline
+from src.shared.scraping import WebDriverPool, PoolDaemon, PoolClient
+from src.shared.utils import get_cpu_load_sampler
 
 def print_system_specs(specs):
     """Exibe as especificações do sistema de forma formatada para análise."""
@@ -68,69 +76,109 @@ def print_system_specs(specs):
         print(f"  Build: {specs.os_build}")
     if specs.directx_version:
         print(f"  DirectX: {specs.directx_version}")
-
-def print_game_analysis(game_name):
-    """Exibe análise completa do jogo incluindo requisitos e compatibilidade."""
-    print(f"\n=== Análise de '{game_name}' ===\n")
-    
-    # Obtém requisitos
-    print("Buscando requisitos...")
-    requirements = get_requirements(game_name)
-    if not requirements:
-        print("Não foi possível encontrar os requisitos do jogo.")
-        return
     
-    # Obtém especificações do sistema
-    print("\nAnalisando sistema...")
-    specs = get_system_specs()
-    
-    # Realiza análise de compatibilidade
-    print("\nAnalisando compatibilidade...")
-    try:
-        analysis = analyze_game_compatibility(specs, requirements)
-        
-        # Mostra resultado da análise
-        print("\n=== Resultado da Análise ===")
+    # Tempo de cada sonda da coleta (com o snapshot do cache, só as de atualização)
+    if specs.probe_timings:
+        slowest = sorted(specs.probe_timings.items(), key=lambda item: item[1], reverse=True)
+        print("\nColeta:")
+        print("  " + ", ".join(f"{name}: {seconds:.2f}s" for name, seconds in slowest))
+        if specs.probe_timeouts:
+            print(f"  Prazo esgotado (dados incompletos): {', '.join(specs.probe_timeouts)}")
+        if specs.probe_failures:
+            print(f"  Falharam (dados incompletos): {', '.join(specs.probe_failures)}")
+
+# Campos exibidos na seção "Análise Detalhada"
+DETAIL_FIELDS = ('cpu_analysis', 'gpu_analysis', 'ram_analysis', 'storage_impact', 'estimated_fps')
+
+def print_analysis_field(field, value, rendered):
+    """
+    Exibe um campo da análise de compatibilidade.
+
+    Usada tanto para a análise completa quanto para os campos recebidos em
+    streaming; `rendered` guarda os campos já exibidos para abrir a seção
+    "Análise Detalhada" apenas uma vez.
+    """
+    if field in DETAIL_FIELDS and not rendered.intersection(DETAIL_FIELDS):
+        print("\nAnálise Detalhada:")
         print("-" * 40)
-        print(f"Pode rodar o jogo? {'Sim' if analysis.can_run else 'Não'}")
-        print(f"Performance esperada: {analysis.performance_level}")
-        
-        if analysis.expected_issues:
+    rendered.add(field)
+    
+    if field == 'can_run':
+        print(f"Pode rodar o jogo? {'Sim' if value else 'Não'}")
+    elif field == 'performance_level':
+        print(f"Performance esperada: {value}")
+    elif field == 'expected_issues':
+        if value:
             print("\nPossíveis problemas:")
-            for issue in analysis.expected_issues:
+            for issue in value:
                 print(f"  - {issue}")
-        
-        print("\nAnálise Detalhada:")
-        print("-" * 40)
+    elif field == 'cpu_analysis':
         print("\nProcessador:")
-        print(analysis.performance_details.cpu_analysis)
-        
+        print(value)
+    elif field == 'gpu_analysis':
         print("\nPlaca de Vídeo:")
-        print(analysis.performance_details.gpu_analysis)
-        
+        print(value)
+    elif field == 'ram_analysis':
         print("\nMemória RAM:")
-        print(analysis.performance_details.ram_analysis)
-        
+        print(value)
+    elif field == 'storage_impact':
         print("\nArmazenamento:")
-        print(analysis.performance_details.storage_impact)
-        
+        print(value)
+    elif field == 'estimated_fps':
         print("\nEstimativas de FPS:")
-        for resolution, fps in analysis.performance_details.estimated_fps.items():
+        for resolution, fps in value.items():
             print(f"\n  {resolution}:")
             print(f"    Baixa: {fps.baixa}")
             print(f"    Média: {fps.media}")
             print(f"    Alta: {fps.alta}")
             print(f"    Ultra: {fps.ultra}")
-        
+    elif field == 'recommended_settings':
         print("\nConfigurações Recomendadas:")
-        print(analysis.recommended_settings)
-        
-        if analysis.upgrade_suggestions:
+        print(value)
+    elif field == 'upgrade_suggestions':
+        if value:
             print("\nSugestões de Upgrade:")
-            for suggestion in analysis.upgrade_suggestions:
+            for suggestion in value:
                 print(f"  - {suggestion}")
-    except Exception as e:
-        print(f"\nErro ao analisar compatibilidade: {str(e)}")
+    # Garante que cada campo apareça imediatamente, mesmo com a saída redirecionada
+    sys.stdout.flush()
+
+def print_game_analysis(game_name, use_cache=True, stream=True, engine='llm', refresh_specs=False):
+    """
+    Exibe análise completa do jogo incluindo requisitos e compatibilidade.
+
+    Com stream=True, os campos da análise do LLM aparecem à medida que o
+    modelo os gera. engine='local' responde sem chamar o LLM. Com
+    refresh_specs=True, o hardware é coletado de novo em vez de vir do cache.
+    """
+    print(f"\n=== Análise de '{game_name}' ===\n")
+    
+    # Busca os requisitos e coleta o sistema em paralelo
+    print("Buscando requisitos e analisando sistema...")
+    pipeline = AnalysisPipeline(game_name, use_cache=use_cache, engine=engine, refresh_specs=refresh_specs)
+    with pipeline:
+        requirements, specs = pipeline.inputs()
+        if not requirements:
+            print("Não foi possível encontrar os requisitos do jogo.")
+            return
+        
+        # Realiza análise de compatibilidade
+        print("\nAnalisando compatibilidade...")
+        try:
+            rendered = set()
+            for field, value in pipeline.analysis(stream=stream):
+                if field == 'reset':
+                    # Streaming interrompido: a análise é exibida de novo, completa
+                    print("\nResposta interrompida, exibindo a análise do próximo modelo...")
+                    rendered.clear()
+                    continue
+                if not rendered:
+                    # Mostra resultado da análise
+                    print("\n=== Resultado da Análise ===")
+                    print("-" * 40)
+                print_analysis_field(field, value, rendered)
+        except Exception as e:
+            print(f"\nErro ao analisar compatibilidade: {str(e)}")
     
     # Mostra requisitos detalhados
     print("\nRequisitos do Jogo:")
@@ -159,6 +207,129 @@ def print_game_analysis(game_name):
             print(f"  {key}: {value}")
     
     print(f"\nFonte: {requirements.source_url}")
+    print(f"\nTempos: {pipeline.report()}")
+
+def read_batch_titles(games, file_path):
+    """
+    Lê a lista de jogos para análise em lote.
+
+    Os títulos vêm dos argumentos, de um arquivo (um por linha) ou da entrada
+    padrão, quando o arquivo é '-' ou nenhum título foi informado.
+    """
+    titles = list(games)
+    if file_path and file_path != '-':
+        with open(file_path, encoding='utf-8') as f:
+            titles.extend(f.read().splitlines())
+    elif file_path == '-' or (not titles and not sys.stdin.isatty()):
+        titles.extend(sys.stdin.read().splitlines())
+    return [title.strip() for title in titles if title.strip() and not title.strip().startswith('#')]
+
+def iter_analyses(specs, requirements_iter, use_cache=True, engine='llm'):
+    """Analisa os jogos em sequência, no formato de iter_analyses_concurrent."""
+    for game_name, requirements in requirements_iter:
+        if not requirements:
+            yield game_name, None, None, None
+            continue
+        try:
+            analysis = analyze_with_engine(specs, requirements, engine=engine, use_cache=use_cache)
+            yield game_name, requirements, analysis, None
+        except Exception as e:
+            yield game_name, requirements, None, e
+
+def print_batch_analysis(game_names, use_cache=True, workers=1, requests_per_second=2.0, llm_concurrency=1,
+                         engine='llm', pack_size=1, refresh_specs=False):
+    """
+    Analisa vários jogos com uma única coleta do sistema.
+
+    Com um worker, reutiliza um único navegador em sequência; com mais,
+    busca os requisitos em paralelo. Com llm_concurrency > 1 (motor 'llm'),
+    várias análises ficam em andamento ao mesmo tempo; com pack_size > 1,
+    até pack_size jogos são analisados em uma única chamada. Cada jogo é
+    mostrado assim que termina, com o tempo desde o início da busca dos
+    seus requisitos (não desde o jogo anterior).
+    """
+    print(f"\n=== Análise em lote de {len(game_names)} jogos ===\n")
+    batch_start = time.perf_counter()
+    
+    # Coleta as especificações uma única vez
+    print("Analisando sistema...")
+    specs = get_system_specs(refresh=refresh_specs)
+    
+    results = []
+    # Início de cada jogo, registrado pelo worker que busca os requisitos
+    # (uma lista por nome: o mesmo jogo pode aparecer mais de uma vez)
+    started = {}
+    analysis_start = time.perf_counter()
+
+    def on_start(game_name):
+        started.setdefault(game_name, []).append(time.perf_counter())
+
+    if workers > 1:
+        requirements_iter = iter_requirements_concurrent(
+            game_names,
+            workers=workers,
+            requests_per_second=requests_per_second,
+            use_cache=use_cache,
+            on_start=on_start
+        )
+    else:
+        requirements_iter = iter_requirements(game_names, use_cache=use_cache, on_start=on_start)
+    if pack_size > 1 and engine == 'llm':
+        analyses_iter = analyze_games_batched(specs, requirements_iter, use_cache=use_cache, pack_size=pack_size)
+    elif llm_concurrency > 1 and engine == 'llm':
+        analyses_iter = iter_analyses_concurrent(
+            specs, requirements_iter, use_cache=use_cache, max_concurrency=llm_concurrency
+        )
+    else:
+        analyses_iter = iter_analyses(specs, requirements_iter, use_cache=use_cache, engine=engine)
+    for index, (game_name, requirements, analysis, error) in enumerate(analyses_iter, start=1):
+        if not requirements:
+            status = "Requisitos não encontrados"
+        elif error is not None:
+            status = f"Erro na análise: {str(error)}"
+        else:
+            status = (
+                f"Pode rodar: {'Sim' if analysis.can_run else 'Não'} | "
+                f"Performance: {analysis.performance_level}"
+            )
+        
+        title_start = started[game_name].pop(0) if started.get(game_name) else analysis_start
+        elapsed = time.perf_counter() - title_start
+        title = requirements.title if requirements and requirements.title else game_name
+        results.append((title, status, elapsed))
+        print(f"[{index}/{len(game_names)}] {title}: {status} ({elapsed:.1f}s)")
+    
+    total = time.perf_counter() - batch_start
+    print("\n=== Resumo do Lote ===")
+    print("-" * 40)
+    for title, status, elapsed in results:
+        print(f"  {title}: {status} ({elapsed:.1f}s)")
+    print(f"\nTempo total: {total:.1f}s")
+
+def add_engine_arguments(parser):
+    """Adiciona as opções de escolha do motor de análise."""
+    parser.add_argument(
+        '--engine',
+        help="Motor de análise: 'llm' (padrão), 'local' (regras, sem LLM) ou "
+             "'hybrid' (veredito local e textos do LLM)",
+        choices=ENGINES,
+        default='llm'
+    )
+    parser.add_argument(
+        '--offline',
+        help='Atalho para --engine local: responde na hora, sem chamar o LLM',
+        dest='engine',
+        action='store_const',
+        const='local'
+    )
+
+def add_specs_arguments(parser):
+    """Adiciona a opção de refazer a coleta do hardware."""
+    parser.add_argument(
+        '--refresh-specs',
+        help='Coleta o hardware novamente em vez de usar o snapshot em cache',
+        action='store_true'
+    )
 
 def main():
     # Configura o parser de argumentos
@@ -178,23 +349,163 @@ def main():
         type=str,
         nargs='+'
     )
+    analyze_parser.add_argument(
+        '--no-cache',
+        help='Ignora os caches (requisitos e análises) e busca tudo novamente',
+        action='store_true'
+    )
+    analyze_parser.add_argument(
+        '--no-stream',
+        help='Aguarda a análise completa em vez de exibir os campos à medida que chegam',
+        action='store_true'
+    )
+    add_engine_arguments(analyze_parser)
+    add_specs_arguments(analyze_parser)
+    
+    # Comando: análise em lote
+    batch_parser = subparsers.add_parser(
+        'analyze-batch',
+        help='Análise de vários jogos reutilizando o mesmo navegador'
+    )
+    batch_parser.add_argument(
+        'games',
+        help='Nomes dos jogos (use aspas para nomes com espaços)',
+        type=str,
+        nargs='*'
+    )
+    batch_parser.add_argument(
+        '-f', '--file',
+        help="Arquivo com um jogo por linha ('-' para ler da entrada padrão)",
+        type=str
+    )
+    batch_parser.add_argument(
+        '--no-cache',
+        help='Ignora os caches (requisitos e análises) e busca tudo novamente',
+        action='store_true'
+    )
+    batch_parser.add_argument(
+        '-w', '--workers',
+        help='Número de buscas simultâneas na Steam (padrão: 1)',
+        type=int,
+        default=1
+    )
+    batch_parser.add_argument(
+        '--rate',
+        help='Máximo de requisições por segundo à Steam, somando todos os workers (padrão: 2)',
+        type=float,
+        default=2.0
+    )
+    batch_parser.add_argument(
+        '--llm-concurrency',
+        help='Número de análises simultâneas no LLM (padrão: 1)',
+        type=int,
+        default=1
+    )
+    batch_parser.add_argument(
+        '--pack',
+        help='Jogos enviados ao LLM em cada chamada, compartilhando o prompt de sistema (padrão: 1)',
+        type=int,
+        default=1
+    )
+    add_engine_arguments(batch_parser)
+    add_specs_arguments(batch_parser)
+    
+    # Comando: daemon de navegadores
+    pool_parser = subparsers.add_parser(
+        'pool-daemon',
+        help='Mantém navegadores aquecidos para as próximas buscas'
+    )
+    pool_parser.add_argument('--size', help='Número de navegadores (padrão: 2)', type=int, default=2)
+    pool_parser.add_argument(
+        '--max-pages',
+        help='Jogos processados antes de reciclar um navegador (padrão: 50)',
+        type=int,
+        default=50
+    )
+    pool_parser.add_argument(
+        '--max-idle',
+        help='Segundos sem uso até o daemon encerrar (padrão: 900)',
+        type=float,
+        default=900
+    )
+    pool_parser.add_argument('--socket', help='Caminho do socket Unix', type=str)
+    pool_parser.add_argument('--stop', help='Encerra o daemon em execução', action='store_true')
+    pool_parser.add_argument('--status', help='Mostra o estado do daemon', action='store_true')
+    
+    # Comando: importar índice de appids
+    index_parser = subparsers.add_parser(
+        'index-import',
+        help='Importa a lista de apps da Steam para buscas sem passar pela busca da loja'
+    )
+    index_parser.add_argument(
+        'app_list',
+        help='Arquivo JSON no formato da API GetAppList',
+        type=str
+    )
     
     # Comando: verificar specs
     specs_parser = subparsers.add_parser('specs', help='Mostra especificações do sistema')
+    add_specs_arguments(specs_parser)
     
     # Parse os argumentos
     args = parser.parse_args()
     
+    # Amostra o uso da CPU em segundo plano enquanto os requisitos são buscados
+    if args.command in ('analyze', 'analyze-batch', 'specs'):
+        get_cpu_load_sampler()
+    
     try:
         if args.command == 'analyze':
             # Análise completa do jogo
             game_name = ' '.join(args.game)
-            print_game_analysis(game_name)
+            print_game_analysis(
+                game_name,
+                use_cache=not args.no_cache,
+                stream=not args.no_stream,
+                engine=args.engine,
+                refresh_specs=args.refresh_specs
+            )
                 
+        elif args.command == 'analyze-batch':
+            # Análise de vários jogos
+            game_names = read_batch_titles(args.games, args.file)
+            if not game_names:
+                batch_parser.error('informe ao menos um jogo')
+            print_batch_analysis(
+                game_names,
+                use_cache=not args.no_cache,
+                workers=args.workers,
+                requests_per_second=args.rate,
+                llm_concurrency=args.llm_concurrency,
+                engine=args.engine,
+                pack_size=args.pack,
+                refresh_specs=args.refresh_specs
+            )
+            
+        elif args.command == 'pool-daemon':
+            client = PoolClient(args.socket)
+            if args.stop or args.status:
+                if not client.is_available():
+                    print("\nNenhum daemon em execução.")
+                elif args.stop:
+                    client.shutdown()
+                    print("\n✓ Daemon encerrado")
+                else:
+                    for key, value in client.stats().items():
+                        print(f"  {key}: {value}")
+            else:
+                pool = WebDriverPool(size=args.size, max_pages=args.max_pages)
+                PoolDaemon(pool, socket_path=args.socket, max_idle=args.max_idle).serve_forever()
+            
+        elif args.command == 'index-import':
+            print("\nImportando lista de apps...")
+            index = import_app_index(args.app_list)
+            print(f"✓ {len(index)} apps indexados")
+            
         elif args.command == 'specs':
             # Mostra especificações do sistema
             print("\nColetando informações do sistema...")
-            specs = get_system_specs()
+            specs = get_system_specs(refresh=args.refresh_specs)
             print_system_specs(specs)
             
         else:
@@ -1,3 +1,3 @@
-from .get_requirements import get_requirements
+from .get_requirements import get_requirements, iter_requirements, iter_requirements_concurrent
 
-__all__ = ['get_requirements']
+__all__ = ['get_requirements', 'iter_requirements', 'iter_requirements_concurrent']
@@ -0,0 +1,169 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterator, Optional, Tuple
+import logging
+import time
+
+from src.shared.utils import PhaseTimer
+from src.services.get_requirements import get_requirements
+from src.services.get_system_specs import get_system_specs
+from src.services.analyze_game_compatibility import stream_game_compatibility, analysis_fields
+from src.services.local_compatibility_engine import analyze_with_engine
+
+logger = logging.getLogger(__name__)
+
+def collect_system_specs(refresh: bool = False):
+    """
+    Coleta as especificações do sistema em uma thread auxiliar.
+
+    O WMI usa COM, que precisa ser inicializado em cada thread que o acessa;
+    fora do Windows (sem pythoncom) a coleta é chamada diretamente.
+
+    Args:
+        refresh: Se True, ignora o snapshot em cache e refaz a coleta completa
+    """
+    try:
+        import pythoncom
+    except ImportError:
+        return get_system_specs(refresh=refresh)
+
+    pythoncom.CoInitialize()
+    try:
+        return get_system_specs(refresh=refresh)
+    finally:
+        pythoncom.CoUninitialize()
+
+class AnalysisPipeline:
+    """
+    Executa a análise de um jogo com a busca de requisitos e a coleta do
+    sistema em paralelo.
+
+    As duas etapas são independentes; a análise começa assim que ambas
+    terminam, então a latência fica max(requisitos, sistema) + análise em
+    vez da soma. Use como gerenciador de contexto:
+
+        with AnalysisPipeline("Cyberpunk 2077") as pipeline:
+            requirements, specs = pipeline.inputs()
+            for field, value in pipeline.analysis():
+                ...
+        print(pipeline.report())
+    """
+
+    def __init__(self, game_name: str, use_cache: bool = True, engine: str = 'llm',
+                 refresh_specs: bool = False):
+        """
+        Inicia a busca de requisitos e a coleta do sistema.
+
+        Args:
+            game_name: Nome do jogo
+            use_cache: Se True, reutiliza requisitos e análises em cache
+            engine: Motor de análise ('llm', 'local' ou 'hybrid')
+            refresh_specs: Se True, refaz a coleta completa do hardware em vez
+                de usar o snapshot em cache
+        """
+        self.game_name = game_name
+        self.use_cache = use_cache
+        self.engine = engine
+        self.timer = PhaseTimer()
+        self.first_field: Optional[float] = None   # segundos após o início da análise
+        self._start = time.perf_counter()
+        self._inputs_ready: Optional[float] = None
+        self._end: Optional[float] = None
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline")
+        self._requirements: Future = self._executor.submit(self._timed, "requisitos", get_requirements,
+                                                           game_name, use_cache=use_cache)
+        self._specs: Future = self._executor.submit(self._timed, "sistema", collect_system_specs,
+                                                    refresh=refresh_specs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Libera as threads; uma coleta em andamento termina em segundo plano."""
+        if self._end is None:
+            self._end = time.perf_counter()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _timed(self, phase: str, function, *args, **kwargs):
+        with self.timer.phase(phase):
+            return function(*args, **kwargs)
+
+    def inputs(self) -> Tuple[Any, Any]:
+        """
+        Aguarda a busca de requisitos e a coleta do sistema.
+
+        Returns:
+            Tupla (GameRequirements ou None, SystemSpecs); specs é None quando
+            os requisitos não foram encontrados, sem esperar pela coleta
+
+        Raises:
+            Exception: Erros da busca ou da coleta
+        """
+        requirements = self._requirements.result()
+        if not requirements:
+            return None, None
+        specs = self._specs.result()
+        if self._inputs_ready is None:
+            self._inputs_ready = time.perf_counter()
+        return requirements, specs
+
+    def analysis(self, stream: bool = True) -> Iterator[Tuple[str, Any]]:
+        """
+        Analisa a compatibilidade assim que requisitos e sistema estão prontos.
+
+        Args:
+            stream: Se True (motor 'llm'), entrega os campos à medida que o modelo os gera
+
+        Yields:
+            Tuplas (campo, valor) como as de stream_game_compatibility, sem o
+            ("analysis", ...) final; o ("reset", None) de um streaming
+            interrompido é repassado
+        """
+        requirements, specs = self.inputs()
+        if not requirements:
+            return
+        with self.timer.phase("analise"):
+            if stream and self.engine == 'llm':
+                fields = stream_game_compatibility(specs, requirements, use_cache=self.use_cache)
+            else:
+                fields = analysis_fields(
+                    analyze_with_engine(specs, requirements, engine=self.engine, use_cache=self.use_cache)
+                )
+            for field, value in fields:
+                if field == 'analysis':
+                    continue
+                if self.first_field is None:
+                    self.first_field = time.perf_counter() - self._inputs_ready
+                yield field, value
+        self._end = time.perf_counter()
+
+    def report(self) -> str:
+        """
+        Resumo do caminho crítico, ex:
+        'requisitos: 3.20s | sistema: 2.10s | análise: 5.00s (primeiro campo em 0.80s) |
+        total: 8.30s (caminho crítico: requisitos + análise; 2.10s a menos que em sequência)'
+        """
+        timings = self.timer.timings
+        scrape = timings.get("requisitos", 0.0)
+        specs = timings.get("sistema", 0.0)
+        analysis = timings.get("analise", 0.0)
+        total = (self._end or time.perf_counter()) - self._start
+
+        parts = [f"requisitos: {scrape:.2f}s"]
+        if "sistema" in timings:
+            parts.append(f"sistema: {specs:.2f}s")
+        if "analise" in timings:
+            first_field = f" (primeiro campo em {self.first_field:.2f}s)" if self.first_field is not None else ""
+            parts.append(f"análise: {analysis:.2f}s{first_field}")
+
+        critical = "requisitos" if scrape >= specs else "sistema"
+        if "analise" in timings:
+            critical += " + análise"
+        saved = scrape + specs + analysis - total if "sistema" in timings else 0.0
+        summary = f"total: {total:.2f}s (caminho crítico: {critical}"
+        if saved > 0.01:
+            summary += f"; {saved:.2f}s a menos que em sequência"
+        parts.append(summary + ")")
+        return " | ".join(parts)
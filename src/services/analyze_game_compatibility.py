@@ -1,6 +1,34 @@
-from dataclasses import dataclass
-from typing import List, Optional
-from src.shared.providers import LLMProvider
+from concurrent.futures import as_completed
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from src.shared.cache import DiskCache
+from src.shared.providers import LLMProvider, AsyncLLMProvider
+from src.shared.utils import IncrementalJsonParser
+
+logger = logging.getLogger(__name__)
+
+# Altere sempre que o prompt ou o formato da resposta mudar: invalida o cache
+PROMPT_VERSION = "1"
+ANALYSIS_TEMPERATURE = 0.1  # Temperatura baixa para maior consistência
+
+DEFAULT_ANALYSIS_CACHE_TTL = 30 * 24 * 3600  # 30 dias
+DEFAULT_ANALYSIS_CACHE_MAX_ENTRIES = 500
+DEFAULT_PACK_SIZE = 4  # jogos por chamada na análise em lote
+
+# Campos de SystemSpecs que entram no prompt (e, portanto, na chave do cache)
+CACHE_SPEC_FIELDS = (
+    'cpu_name', 'cpu_cores', 'cpu_threads', 'gpu_name', 'gpu_memory_total',
+    'ram_total', 'ram_type', 'ram_speed', 'os_name', 'os_version', 'directx_version'
+)
 
 @dataclass
 class PerformanceEstimates:
@@ -26,21 +54,21 @@ class CompatibilityAnalysis:
     upgrade_suggestions: List[str]
     performance_details: PerformanceDetails
 
-def analyze_game_compatibility(system_specs, game_requirements):
-    """
-    Analisa a compatibilidade entre as especificações do sistema e os requisitos do jogo.
-    
-    Args:
-        system_specs: Objeto contendo as especificações do sistema
-        game_requirements: Objeto contendo os requisitos do jogo
-        
-    Returns:
-        CompatibilityAnalysis: Resultado da análise
-    """
-    llm_provider = LLMProvider()
-    
-    # Constrói o prompt para a análise
-    system_prompt = """
+# Campos exibidos ao usuário (caminho no JSON -> nome), na ordem da análise completa
+ANALYSIS_FIELDS = {
+    ('can_run',): 'can_run',
+    ('performance_level',): 'performance_level',
+    ('expected_issues',): 'expected_issues',
+    ('performance_details', 'cpu_analysis'): 'cpu_analysis',
+    ('performance_details', 'gpu_analysis'): 'gpu_analysis',
+    ('performance_details', 'ram_analysis'): 'ram_analysis',
+    ('performance_details', 'storage_impact'): 'storage_impact',
+    ('performance_details', 'estimated_fps'): 'estimated_fps',
+    ('recommended_settings',): 'recommended_settings',
+    ('upgrade_suggestions',): 'upgrade_suggestions',
+}
+
+SYSTEM_PROMPT = """
     Você é um especialista altamente qualificado em análise de compatibilidade de hardware para jogos.
     Sua tarefa é realizar uma análise técnica extremamente detalhada e precisa comparando as especificações 
     do computador com os requisitos do jogo.
@@ -92,9 +120,18 @@ def analyze_game_compatibility(system_specs, game_requirements):
         }
     }
     """
-    
-    # Prepara as informações do sistema em um formato claro
-    system_info = f"""
+
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + """
+    ANÁLISE EM LOTE:
+    Quando o pedido trouxer vários jogos identificados por chaves ("g1", "g2", ...), retorne um único
+    objeto JSON com essas chaves, cada uma com a análise completa do jogo no formato acima:
+    {"g1": { ... }, "g2": { ... }}
+    Inclua todos os identificadores e não misture informações entre os jogos.
+    """
+
+def _system_info(system_specs) -> str:
+    """Descrição das especificações do sistema usada nos prompts."""
+    return f"""
     Especificações do Sistema:
     CPU: {system_specs.cpu_name} ({system_specs.cpu_cores} cores, {system_specs.cpu_threads} threads)
     GPU: {system_specs.gpu_name} ({system_specs.gpu_memory_total}GB VRAM)
@@ -102,8 +139,9 @@ def analyze_game_compatibility(system_specs, game_requirements):
     Sistema: {system_specs.os_name} {system_specs.os_version}
     DirectX: {system_specs.directx_version or 'Não especificado'}
     """
-    
-    # Prepara os requisitos do jogo
+
+def _requirements_info(game_requirements) -> str:
+    """Requisitos mínimos e recomendados de um jogo, um campo por linha."""
     game_info = "Requisitos do Jogo:\n"
     if game_requirements.minimum:
         game_info += "\nMínimos:\n"
@@ -116,6 +154,24 @@ def analyze_game_compatibility(system_specs, game_requirements):
         for key, value in game_requirements.recommended.items():
             if key != "status":
                 game_info += f"{key}: {value}\n"
+    return game_info
+
+def build_analysis_prompt(system_specs, game_requirements) -> str:
+    """
+    Monta o prompt de análise com as especificações do sistema e os requisitos do jogo.
+    
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        game_requirements: Objeto contendo os requisitos do jogo
+        
+    Returns:
+        str: Prompt do usuário para o LLM
+    """
+    # Prepara as informações do sistema em um formato claro
+    system_info = _system_info(system_specs)
+    
+    # Prepara os requisitos do jogo
+    game_info = _requirements_info(game_requirements)
     
     # Monta o prompt completo
     analysis_prompt = f"""
@@ -144,54 +200,644 @@ def analyze_game_compatibility(system_specs, game_requirements):
     Retorne a análise completa no formato JSON especificado.
     """
     
-    try:
-        # Obtém a análise do LLM
-        result = llm_provider.generate_response(
-            prompt=analysis_prompt,
-            system_prompt=system_prompt,
-            temperature=0.1  # Reduzindo ainda mais a temperatura para maior consistência
+    return analysis_prompt
+
+def batch_game_keys(count: int) -> List[str]:
+    """Identificadores dos jogos em um prompt em lote ("g1", "g2", ...)."""
+    return [f"g{index}" for index in range(1, count + 1)]
+
+def build_batch_prompt(system_specs, requirements_list: List[Any]) -> str:
+    """
+    Monta um único prompt com vários jogos para o mesmo sistema.
+    
+    O sistema é descrito uma só vez; cada jogo recebe um identificador de
+    batch_game_keys, usado como chave no JSON da resposta.
+    
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        requirements_list: Requisitos dos jogos, na ordem dos identificadores
+        
+    Returns:
+        str: Prompt do usuário para o LLM
+    """
+    games_info = ""
+    for key, game_requirements in zip(batch_game_keys(len(requirements_list)), requirements_list):
+        title = getattr(game_requirements, 'title', None) or 'sem título'
+        games_info += f"\n=== Jogo {key}: {title} ===\n{_requirements_info(game_requirements)}"
+    
+    return f"""
+    Realize uma análise técnica extremamente detalhada da compatibilidade entre o sistema e cada um
+    dos {len(requirements_list)} jogos abaixo, de forma independente.
+    LEMBRE-SE: Hardware mais recente é geralmente mais potente que hardware antigo, mesmo que tenha
+    especificações aparentemente menores. Compare as gerações e arquiteturas dos componentes.
+
+    {_system_info(system_specs)}
+    {games_info}
+    Retorne UM objeto JSON cujas chaves são os identificadores dos jogos
+    ({', '.join(batch_game_keys(len(requirements_list)))}) e cujos valores seguem o formato especificado.
+    """
+
+def fps_estimates_from_dict(estimated_fps: dict) -> dict[str, PerformanceEstimates]:
+    """Converte as estimativas de FPS por resolução em PerformanceEstimates."""
+    return {
+        resolution: PerformanceEstimates(
+            baixa=fps_data['baixa'],
+            media=fps_data['media'],
+            alta=fps_data['alta'],
+            ultra=fps_data['ultra']
         )
+        for resolution, fps_data in estimated_fps.items()
+    }
+
+def analysis_from_dict(analysis_dict: dict) -> CompatibilityAnalysis:
+    """
+    Converte o JSON da análise (do LLM ou do cache) em CompatibilityAnalysis.
+    
+    Args:
+        analysis_dict: Dicionário no formato definido em SYSTEM_PROMPT
         
-        # Remove possíveis caracteres especiais ou texto antes/depois do JSON
-        import re
-        json_match = re.search(r'\{.*\}', result, re.DOTALL)
-        if not json_match:
-            raise ValueError("Resposta não contém JSON válido")
-            
-        json_str = json_match.group()
-        
-        # Converte o resultado JSON em um objeto CompatibilityAnalysis
-        import json
-        analysis_dict = json.loads(json_str)
-        
-        # Criar objeto PerformanceEstimates para cada resolução
-        fps_estimates = {}
-        for resolution, fps_data in analysis_dict['performance_details']['estimated_fps'].items():
-            fps_estimates[resolution] = PerformanceEstimates(
-                baixa=fps_data['baixa'],
-                media=fps_data['media'],
-                alta=fps_data['alta'],
-                ultra=fps_data['ultra']
-            )
+    Returns:
+        CompatibilityAnalysis: Resultado da análise
+    """
+    # Criar objeto PerformanceEstimates para cada resolução
+    fps_estimates = fps_estimates_from_dict(analysis_dict['performance_details']['estimated_fps'])
+    
+    # Criar objeto PerformanceDetails
+    performance_details = PerformanceDetails(
+        cpu_analysis=analysis_dict['performance_details']['cpu_analysis'],
+        gpu_analysis=analysis_dict['performance_details']['gpu_analysis'],
+        ram_analysis=analysis_dict['performance_details']['ram_analysis'],
+        storage_impact=analysis_dict['performance_details']['storage_impact'],
+        estimated_fps=fps_estimates
+    )
+    
+    # Retornar análise completa
+    return CompatibilityAnalysis(
+        can_run=analysis_dict['can_run'],
+        performance_level=analysis_dict['performance_level'],
+        expected_issues=analysis_dict['expected_issues'],
+        recommended_settings=analysis_dict['recommended_settings'] or '',
+        upgrade_suggestions=analysis_dict.get('upgrade_suggestions', []),
+        performance_details=performance_details
+    )
+
+def parse_analysis_response(result: str) -> CompatibilityAnalysis:
+    """
+    Extrai o JSON da resposta do LLM e converte em CompatibilityAnalysis.
+    
+    Args:
+        result: Texto retornado pelo LLM
         
-        # Criar objeto PerformanceDetails
-        performance_details = PerformanceDetails(
-            cpu_analysis=analysis_dict['performance_details']['cpu_analysis'],
-            gpu_analysis=analysis_dict['performance_details']['gpu_analysis'],
-            ram_analysis=analysis_dict['performance_details']['ram_analysis'],
-            storage_impact=analysis_dict['performance_details']['storage_impact'],
-            estimated_fps=fps_estimates
-        )
+    Returns:
+        CompatibilityAnalysis: Resultado da análise
         
-        # Retornar análise completa
-        return CompatibilityAnalysis(
-            can_run=analysis_dict['can_run'],
-            performance_level=analysis_dict['performance_level'],
-            expected_issues=analysis_dict['expected_issues'],
-            recommended_settings=analysis_dict['recommended_settings'] or '',
-            upgrade_suggestions=analysis_dict.get('upgrade_suggestions', []),
-            performance_details=performance_details
-        )
+    Raises:
+        ValueError: Se a resposta não contiver JSON válido
+    """
+    # Remove possíveis caracteres especiais ou texto antes/depois do JSON
+    json_match = re.search(r'\{.*\}', result, re.DOTALL)
+    if not json_match:
+        raise ValueError("Resposta não contém JSON válido")
+    
+    # Converte o resultado JSON em um objeto CompatibilityAnalysis
+    return analysis_from_dict(json.loads(json_match.group()))
+
+def parse_batch_response(result: str, keys: List[str]) -> Dict[str, Any]:
+    """
+    Separa a resposta de um prompt em lote nas análises de cada jogo.
+    
+    A resposta é lida incrementalmente: se ela vier truncada ou com erro de
+    sintaxe no meio, as análises já completas continuam aproveitáveis.
+    
+    Args:
+        result: Texto retornado pelo LLM
+        keys: Identificadores dos jogos no prompt
+        
+    Returns:
+        Dicionário identificador -> CompatibilityAnalysis, ou a exceção
+        (ValueError) dos jogos ausentes ou malformados
+    """
+    parser = IncrementalJsonParser()
+    entries = {}
+    try:
+        for path, value in parser.feed(result):
+            if len(path) == 1 and path[0] in keys:
+                entries[path[0]] = value
+    except (ValueError, IndexError):
+        logger.warning(f"Resposta em lote malformada; {len(entries)} de {len(keys)} análises aproveitadas")
+    
+    analyses = {}
+    for key in keys:
+        if key not in entries:
+            analyses[key] = ValueError(f"Análise de {key} ausente na resposta em lote")
+            continue
+        try:
+            analyses[key] = analysis_from_dict(entries[key])
+        except (KeyError, TypeError, AttributeError) as e:
+            analyses[key] = ValueError(f"Análise de {key} incompleta na resposta em lote: {e!r}")
+    return analyses
+
+def analysis_fields(analysis: CompatibilityAnalysis) -> List[Tuple[str, Any]]:
+    """
+    Lista os campos exibíveis de uma análise, na ordem de ANALYSIS_FIELDS.
+    
+    Usado para exibir análises completas (ou do cache) com o mesmo código
+    que exibe os campos recebidos em streaming.
+    """
+    fields = []
+    for path, name in ANALYSIS_FIELDS.items():
+        value = analysis
+        for key in path:
+            value = getattr(value, key)
+        fields.append((name, value))
+    return fields
+
+def _field_value(name: str, value: Any) -> Any:
+    """Converte um campo recebido em streaming no tipo usado em CompatibilityAnalysis."""
+    if name == 'estimated_fps':
+        return fps_estimates_from_dict(value)
+    if name == 'recommended_settings':
+        return value or ''
+    return value
+
+@lru_cache(maxsize=1)
+def get_analysis_cache() -> DiskCache:
+    """Cache em disco das análises (namespace "analyses"), compartilhado pelo processo."""
+    return DiskCache(
+        "analyses",
+        max_entries=int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", DEFAULT_ANALYSIS_CACHE_MAX_ENTRIES))
+    )
+
+def analysis_cache_key(system_specs, game_requirements, model: str,
+                       temperature: float = ANALYSIS_TEMPERATURE, batch: bool = False) -> str:
+    """
+    Calcula a chave de conteúdo de uma análise.
+    
+    A chave é o SHA-256 de tudo que influencia a resposta: os campos de
+    SystemSpecs usados no prompt, os requisitos do jogo, o modelo, a
+    temperatura e a versão do prompt.
+    
+    Args:
+        model: Modelo (ou lista de níveis, separados por vírgula) da análise
+        batch: True para análises vindas de um prompt em lote, que não passam
+            pela validação por níveis e por isso não compartilham a chave
+            das análises individuais
+    
+    Returns:
+        str: Chave hexadecimal
+    """
+    payload = {
+        'specs': {field: getattr(system_specs, field, None) for field in CACHE_SPEC_FIELDS},
+        'minimum': game_requirements.minimum,
+        'recommended': game_requirements.recommended,
+        'model': model,
+        'temperature': temperature,
+        'prompt_version': PROMPT_VERSION,
+    }
+    if batch:
+        payload['batch'] = True
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+def analyze_game_compatibility(system_specs, game_requirements, use_cache: bool = True,
+                               llm_provider: Optional[LLMProvider] = None):
+    """
+    Analisa a compatibilidade entre as especificações do sistema e os requisitos do jogo.
+    
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        game_requirements: Objeto contendo os requisitos do jogo
+        use_cache: Se True, reutiliza análises idênticas já feitas (sem custo de tokens)
+        llm_provider: Provider a reutilizar (padrão: um novo LLMProvider)
+        
+    Returns:
+        CompatibilityAnalysis: Resultado da análise
+    """
+    llm_provider = llm_provider or LLMProvider()
+    
+    cache, cache_key, cached = _cached_analysis(system_specs, game_requirements, llm_provider, use_cache)
+    if cached is not None:
+        return cached
+    
+    try:
+        # Obtém a análise do LLM, do modelo mais rápido ao mais forte
+        analysis = _analyze_tiered(system_specs, game_requirements, llm_provider)
         
     except Exception as e:
         raise Exception(f"Erro ao analisar compatibilidade do jogo: {str(e)}")
+    
+    _store_analysis(cache, cache_key, analysis)
+    return analysis
+
+def stream_game_compatibility(system_specs, game_requirements,
+                              use_cache: bool = True) -> Iterator[Tuple[str, Any]]:
+    """
+    Analisa a compatibilidade em streaming, entregando cada campo assim que o
+    modelo termina de escrevê-lo.
+    
+    Com vários níveis (OPENROUTER_MODELS), os campos do primeiro nível ficam
+    retidos até o veredito (`can_run`) chegar: se ele for limítrofe, a
+    resposta é abandonada e o próximo nível responde sem streaming, sem que
+    nada da primeira tenha sido exibido. Como o veredito é o primeiro campo
+    da resposta, a retenção quase não atrasa a exibição.
+    
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        game_requirements: Objeto contendo os requisitos do jogo
+        use_cache: Se True, reutiliza análises idênticas já feitas (sem custo de tokens)
+        
+    Yields:
+        Tuplas (campo, valor) com os nomes de ANALYSIS_FIELDS, na ordem em que
+        chegam, e por fim ("analysis", CompatibilityAnalysis) com o resultado completo.
+        Se o streaming falhar depois de entregar campos, ("reset", None) indica
+        que eles devem ser descartados antes dos campos da nova análise.
+    """
+    llm_provider = LLMProvider()
+    
+    cache, cache_key, cached = _cached_analysis(system_specs, game_requirements, llm_provider, use_cache)
+    if cached is not None:
+        yield from analysis_fields(cached)
+        yield 'analysis', cached
+        return
+    
+    parser = IncrementalJsonParser()
+    chunks = []
+    held = []                                    # campos recebidos e ainda não entregues
+    verdict_pending = len(llm_provider.models) > 1
+    escalate = False
+    emitted = False
+    start = time.perf_counter()
+    try:
+        try:
+            stream = llm_provider.stream_response(
+                prompt=build_analysis_prompt(system_specs, game_requirements),
+                system_prompt=SYSTEM_PROMPT,
+                temperature=ANALYSIS_TEMPERATURE
+            )
+            try:
+                for chunk in stream:
+                    chunks.append(chunk)
+                    for path, value in parser.feed(chunk):
+                        name = ANALYSIS_FIELDS.get(path)
+                        if name is None:
+                            continue
+                        held.append((name, _field_value(name, value)))
+                        if verdict_pending and name == 'can_run':
+                            verdict_pending = False
+                            escalate = not _tier_accepts(system_specs, game_requirements, llm_provider,
+                                                         0, bool(value), start)
+                    if escalate:
+                        break
+                    if not verdict_pending and held:
+                        emitted = True
+                        yield from held
+                        held = []
+            finally:
+                # Encerra a conexão também quando a resposta é abandonada
+                stream.close()
+            
+            if not escalate:
+                if parser.done:
+                    analysis = analysis_from_dict(parser.value)
+                else:
+                    analysis = parse_analysis_response(''.join(chunks))
+                if verdict_pending:
+                    # O veredito não veio como campo isolado: decide com a análise completa
+                    escalate = not _tier_accepts(system_specs, game_requirements, llm_provider,
+                                                 0, analysis, start)
+            if escalate:
+                # Veredito limítrofe: nada do primeiro nível foi exibido
+                analysis = _analyze_tiered(system_specs, game_requirements, llm_provider, first_tier=1)
+                yield from analysis_fields(analysis)
+            else:
+                yield from held
+        
+        except Exception as e:
+            # Resposta inválida do primeiro nível: os próximos respondem sem streaming
+            _tier_accepts(system_specs, game_requirements, llm_provider, 0, e, start)
+            analysis = _analyze_tiered(system_specs, game_requirements, llm_provider, first_tier=1)
+            if emitted:
+                # Os campos já exibidos vieram da resposta descartada
+                yield 'reset', None
+            yield from analysis_fields(analysis)
+        
+    except Exception as e:
+        raise Exception(f"Erro ao analisar compatibilidade do jogo: {str(e)}")
+    
+    _store_analysis(cache, cache_key, analysis)
+    yield 'analysis', analysis
+
+async def analyze_game_compatibility_async(system_specs, game_requirements, use_cache: bool = True,
+                                           llm_provider: Optional[AsyncLLMProvider] = None):
+    """
+    Versão asyncio de analyze_game_compatibility.
+    
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        game_requirements: Objeto contendo os requisitos do jogo
+        use_cache: Se True, reutiliza análises idênticas já feitas (sem custo de tokens)
+        llm_provider: Provider compartilhado entre análises simultâneas; se
+            omitido, um provider próprio é criado e fechado ao final
+        
+    Returns:
+        CompatibilityAnalysis: Resultado da análise
+    """
+    owns_provider = llm_provider is None
+    if owns_provider:
+        llm_provider = AsyncLLMProvider()
+    
+    try:
+        # Consultas ao SQLite ficam fora do event loop
+        cache, cache_key, cached = await asyncio.to_thread(
+            _cached_analysis, system_specs, game_requirements, llm_provider, use_cache
+        )
+        if cached is not None:
+            return cached
+        
+        try:
+            prompt = build_analysis_prompt(system_specs, game_requirements)
+            for tier, model in enumerate(llm_provider.models):
+                start = time.perf_counter()
+                try:
+                    outcome = parse_analysis_response(await llm_provider.generate_response_async(
+                        prompt=prompt,
+                        system_prompt=SYSTEM_PROMPT,
+                        temperature=ANALYSIS_TEMPERATURE,
+                        model=model
+                    ))
+                except Exception as e:
+                    outcome = e
+                if _tier_accepts(system_specs, game_requirements, llm_provider, tier, outcome, start):
+                    analysis = outcome
+                    break
+            
+        except Exception as e:
+            raise Exception(f"Erro ao analisar compatibilidade do jogo: {str(e)}")
+        
+        await asyncio.to_thread(_store_analysis, cache, cache_key, analysis)
+        return analysis
+    finally:
+        if owns_provider:
+            await llm_provider.aclose()
+
+async def analyze_many_async(system_specs, requirements_list: Iterable, use_cache: bool = True,
+                             max_concurrency: Optional[int] = None) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Analisa vários jogos simultaneamente, entregando cada resultado assim que fica pronto.
+    
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        requirements_list: Requisitos dos jogos
+        use_cache: Se True, reutiliza análises idênticas já feitas
+        max_concurrency: Máximo de chamadas simultâneas ao LLM
+        
+    Yields:
+        Tuplas (requisitos, CompatibilityAnalysis ou a exceção da análise), em
+        ordem de conclusão
+    """
+    async with AsyncLLMProvider(max_concurrency=max_concurrency) as llm_provider:
+        async def run(requirements):
+            try:
+                return requirements, await analyze_game_compatibility_async(
+                    system_specs, requirements, use_cache=use_cache, llm_provider=llm_provider
+                )
+            except Exception as e:
+                return requirements, e
+        
+        for next_done in asyncio.as_completed([run(requirements) for requirements in requirements_list]):
+            yield await next_done
+
+def iter_analyses_concurrent(system_specs, requirements_iter: Iterable[Tuple[str, Any]], use_cache: bool = True,
+                             max_concurrency: Optional[int] = None) -> Iterator[Tuple[str, Any, Any, Any]]:
+    """
+    Analisa os jogos de `requirements_iter` com várias chamadas ao LLM em
+    andamento, para uso em código síncrono (ex: o CLI).
+    
+    As análises rodam em um event loop em segundo plano; cada jogo é enviado
+    assim que seus requisitos chegam, então a busca dos próximos requisitos
+    se sobrepõe às análises em andamento.
+    
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        requirements_iter: Pares (nome, GameRequirements ou None), como os de iter_requirements
+        use_cache: Se True, reutiliza análises idênticas já feitas
+        max_concurrency: Máximo de chamadas simultâneas ao LLM
+        
+    Yields:
+        Tuplas (nome, requisitos, análise, erro) em ordem de conclusão; análise
+        e erro são None quando os requisitos não foram encontrados
+    """
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    llm_provider = AsyncLLMProvider(max_concurrency=max_concurrency)
+    pending = {}
+    
+    def outcome(future):
+        game_name, requirements = pending.pop(future)
+        error = future.exception()
+        return game_name, requirements, None if error else future.result(), error
+    
+    try:
+        for game_name, requirements in requirements_iter:
+            if not requirements:
+                yield game_name, None, None, None
+                continue
+            future = asyncio.run_coroutine_threadsafe(
+                analyze_game_compatibility_async(
+                    system_specs, requirements, use_cache=use_cache, llm_provider=llm_provider
+                ),
+                loop
+            )
+            pending[future] = (game_name, requirements)
+            # Entrega o que já terminou sem esperar pelos próximos requisitos
+            for done in [future for future in pending if future.done()]:
+                yield outcome(done)
+        
+        for done in as_completed(list(pending)):
+            yield outcome(done)
+    finally:
+        for future in pending:
+            future.cancel()
+        asyncio.run_coroutine_threadsafe(llm_provider.aclose(), loop).result()
+        # Encerra as threads de asyncio.to_thread (consultas ao cache), que
+        # loop.close() deixaria para trás
+        asyncio.run_coroutine_threadsafe(loop.shutdown_default_executor(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        loop.close()
+
+def analyze_games_batched(system_specs, requirements_iter: Iterable[Tuple[str, Any]], use_cache: bool = True,
+                          pack_size: int = DEFAULT_PACK_SIZE) -> Iterator[Tuple[str, Any, Any, Any]]:
+    """
+    Analisa vários jogos agrupando até `pack_size` deles em cada chamada ao LLM.
+    
+    O prompt de sistema e a descrição do hardware são enviados uma vez por
+    grupo, não uma vez por jogo. Jogos já no cache não entram nos grupos.
+    As análises recebidas em lote não passam pela escalada de níveis, então
+    são gravadas em uma chave própria (batch=True, com o modelo que
+    respondeu): análises individuais nunca as reaproveitam. Jogos ausentes
+    ou malformados na resposta em lote são analisados de novo individualmente.
+    
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        requirements_iter: Pares (nome, GameRequirements ou None), como os de iter_requirements
+        use_cache: Se True, reutiliza análises idênticas já feitas
+        pack_size: Máximo de jogos por chamada
+        
+    Yields:
+        Tuplas (nome, requisitos, análise, erro), no formato de iter_analyses_concurrent
+    """
+    llm_provider = LLMProvider()
+    pack = []
+    for game_name, requirements in requirements_iter:
+        if not requirements:
+            yield game_name, None, None, None
+            continue
+        cache, _, cached = _cached_analysis(system_specs, requirements, llm_provider, use_cache)
+        if cached is None and cache is not None:
+            cached = _cached_batch_analysis(cache, system_specs, requirements, llm_provider.model)
+        if cached is not None:
+            yield game_name, requirements, cached, None
+            continue
+        pack.append((game_name, requirements, cache))
+        if len(pack) >= pack_size:
+            yield from _analyze_pack(system_specs, pack, llm_provider, use_cache)
+            pack = []
+    if pack:
+        yield from _analyze_pack(system_specs, pack, llm_provider, use_cache)
+
+def _analyze_pack(system_specs, pack: List[Tuple[str, Any, Any]], llm_provider: LLMProvider,
+                  use_cache: bool) -> Iterator[Tuple[str, Any, Any, Any]]:
+    """Analisa um grupo de jogos em uma chamada, refazendo individualmente os que falharem."""
+    keys = batch_game_keys(len(pack))
+    model = llm_provider.model
+    if len(pack) == 1:
+        analyses = {keys[0]: None}
+    else:
+        try:
+            result = llm_provider.generate_response(
+                prompt=build_batch_prompt(system_specs, [requirements for _, requirements, _ in pack]),
+                system_prompt=BATCH_SYSTEM_PROMPT,
+                temperature=ANALYSIS_TEMPERATURE
+            )
+            # Com hedge, quem respondeu pode ser o modelo de reserva
+            model = llm_provider.metrics[-1].model if llm_provider.metrics else model
+            analyses = parse_batch_response(result, keys)
+        except Exception as e:
+            logger.warning(f"Falha na análise em lote de {len(pack)} jogos: {str(e)}")
+            analyses = dict.fromkeys(keys)
+        failed = sum(not isinstance(analysis, CompatibilityAnalysis) for analysis in analyses.values())
+        logger.info(f"Lote de {len(pack)} jogos: {len(pack) - failed} análises, {failed} a refazer individualmente")
+    
+    for key, (game_name, requirements, cache) in zip(keys, pack):
+        analysis = analyses[key]
+        if isinstance(analysis, CompatibilityAnalysis):
+            if cache is not None:
+                _store_analysis(cache, analysis_cache_key(system_specs, requirements, model, batch=True), analysis)
+            yield game_name, requirements, analysis, None
+            continue
+        try:
+            analysis = analyze_game_compatibility(
+                system_specs, requirements, use_cache=use_cache, llm_provider=llm_provider
+            )
+            yield game_name, requirements, analysis, None
+        except Exception as e:
+            yield game_name, requirements, None, e
+
+def _analyze_tiered(system_specs, game_requirements, llm_provider: LLMProvider,
+                    first_tier: int = 0) -> CompatibilityAnalysis:
+    """Percorre os níveis de llm_provider.models a partir de `first_tier` até uma resposta ser aceita."""
+    prompt = build_analysis_prompt(system_specs, game_requirements)
+    for tier in range(first_tier, len(llm_provider.models)):
+        start = time.perf_counter()
+        try:
+            outcome = parse_analysis_response(llm_provider.generate_response(
+                prompt=prompt,
+                system_prompt=SYSTEM_PROMPT,
+                temperature=ANALYSIS_TEMPERATURE,
+                model=llm_provider.models[tier],
+                validate=parse_analysis_response
+            ))
+        except Exception as e:
+            outcome = e
+        if _tier_accepts(system_specs, game_requirements, llm_provider, tier, outcome, start):
+            return outcome
+
+def _tier_accepts(system_specs, game_requirements, llm_provider: LLMProvider, tier: int,
+                  outcome: Any, start: float) -> bool:
+    """
+    Decide se a resposta de um nível encerra a análise ou se ela sobe de nível.
+    
+    Sobe quando a resposta não é um JSON válido (ou a chamada falhou) e quando
+    o veredito é limítrofe segundo o motor local. No último nível, a resposta
+    válida é aceita de qualquer forma e a falha é propagada.
+    
+    Args:
+        tier: Posição do modelo em llm_provider.models
+        outcome: CompatibilityAnalysis, só o veredito (can_run, recebido em
+            streaming antes do restante) ou a exceção da tentativa
+        start: Início da tentativa (time.perf_counter)
+    
+    Raises:
+        Exception: A falha do último nível
+    """
+    models = llm_provider.models
+    model = models[tier]
+    elapsed = time.perf_counter() - start
+    last_tier = tier == len(models) - 1
+    
+    if isinstance(outcome, Exception):
+        if last_tier:
+            raise outcome
+        reason = f"sem resposta válida ({str(outcome)})"
+    elif last_tier:
+        reason = None
+    else:
+        # Importado aqui: o motor local depende deste módulo
+        from src.services.local_compatibility_engine import is_borderline_verdict
+        can_run = outcome.can_run if isinstance(outcome, CompatibilityAnalysis) else outcome
+        reason = "veredito limítrofe" if is_borderline_verdict(system_specs, game_requirements, can_run) else None
+    
+    if reason is None:
+        if len(models) > 1:
+            logger.info(f"Análise servida pelo nível {tier + 1}/{len(models)} ({model}) em {elapsed:.2f}s")
+        return True
+    logger.info(
+        f"Nível {tier + 1}/{len(models)} ({model}): {reason} em {elapsed:.2f}s; "
+        f"escalando para {models[tier + 1]}"
+    )
+    return False
+
+def _cached_analysis(system_specs, game_requirements, llm_provider: LLMProvider, use_cache: bool):
+    """
+    Consulta o cache de análises.
+    
+    Returns:
+        Tupla (cache, chave, análise); cache e chave são None sem use_cache,
+        e a análise é None quando não está no cache
+    """
+    if not use_cache:
+        return None, None, None
+    cache = get_analysis_cache()
+    # Com vários níveis, a resposta depende da lista inteira de modelos
+    cache_key = analysis_cache_key(system_specs, game_requirements, ','.join(llm_provider.models))
+    cached = cache.get(cache_key)
+    if cached is not None:
+        logger.info("Análise de compatibilidade obtida do cache")
+        return cache, cache_key, analysis_from_dict(cached)
+    return cache, cache_key, None
+
+def _cached_batch_analysis(cache: DiskCache, system_specs, game_requirements,
+                           model: str) -> Optional[CompatibilityAnalysis]:
+    """Análise gravada por uma análise em lote anterior do mesmo modelo, se houver."""
+    cached = cache.get(analysis_cache_key(system_specs, game_requirements, model, batch=True))
+    if cached is None:
+        return None
+    logger.info("Análise de compatibilidade (em lote) obtida do cache")
+    return analysis_from_dict(cached)
+
+def _store_analysis(cache: Optional[DiskCache], cache_key: Optional[str], analysis: CompatibilityAnalysis):
+    if cache is not None:
+        ttl = float(os.getenv("ANALYSIS_CACHE_TTL", DEFAULT_ANALYSIS_CACHE_TTL))
+        cache.set(cache_key, asdict(analysis), ttl=ttl)
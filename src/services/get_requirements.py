@@ -1,8 +1,75 @@
-from src.shared.scraping import GameSystemRequirements, GameRequirements
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+import logging
+import os
+import threading
 
-def get_requirements(game_name: str) -> GameRequirements:
+from src.shared.cache import RequirementsCache, default_cache_dir
+from src.shared.scraping import (
+    GameSystemRequirements, GameRequirements, SteamHttpFetcher, PoolClient, SteamAppIndex
+)
+from src.shared.utils import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Erros do daemon de pool (timeout do socket, daemon reiniciado, resposta de
+# erro ou malformada): a busca cai para um navegador próprio
+POOL_ERRORS = (OSError, RuntimeError, ValueError)
+
+def app_index_path() -> str:
+    """Caminho do índice local de appids (pode ser alterado via STEAM_APP_INDEX)."""
+    return os.getenv("STEAM_APP_INDEX") or os.path.join(default_cache_dir(), "steam_app_index.pickle")
+
+@lru_cache(maxsize=1)
+def get_app_index() -> Optional[SteamAppIndex]:
+    """Carrega o índice local de appids, se ele tiver sido importado."""
+    path = app_index_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        return SteamAppIndex.load(path)
+    except Exception as e:
+        logger.warning(f"Falha ao carregar índice de appids: {str(e)}")
+        return None
+
+def import_app_index(app_list_path: str) -> SteamAppIndex:
     """
-    Obtém os requisitos do jogo especificado.
+    Importa uma lista de apps da Steam (JSON) para o índice local.
+
+    Args:
+        app_list_path: Arquivo no formato da API GetAppList
+
+    Returns:
+        Índice criado
+    """
+    index = SteamAppIndex.from_app_list(app_list_path)
+    index.save(app_index_path())
+    get_app_index.cache_clear()
+    return index
+
+def resolve_app_id(game_name: str) -> Optional[int]:
+    """Resolve o appid pelo índice local, sem acessar a rede."""
+    index = get_app_index()
+    if index is None:
+        return None
+    match = index.lookup(game_name)
+    if match is None:
+        return None
+    logger.info(f"Appid resolvido pelo índice local: {game_name} -> {match[1]} ({match[0]})")
+    return match[0]
+
+def fetch_requirements(game_name: str) -> Optional[GameRequirements]:
+    """
+    Busca os requisitos do jogo na Steam, sem consultar o cache.
+
+    Se o índice local de appids conhecer o jogo, vai direto para a página do
+    app, sem passar pela busca da Steam.
+
+    Tenta primeiro a busca via HTTP, que não precisa do navegador. Quando ela
+    falha, usa um navegador do daemon de pool (se estiver rodando) e, por
+    último (ou se o daemon falhar), abre um Chrome próprio.
 
     Args:
         game_name: Nome do jogo para análise
@@ -10,5 +77,169 @@ def get_requirements(game_name: str) -> GameRequirements:
     Returns:
         GameRequirements se encontrado, None caso contrário
     """
+    app_id = resolve_app_id(game_name)
+    with SteamHttpFetcher() as fetcher:
+        requirements = fetcher.get_game_requirements(game_name, app_id=app_id)
+    if requirements:
+        return requirements
+
+    pool_client = PoolClient()
+    if pool_client.is_available():
+        try:
+            return pool_client.get_game_requirements(game_name, app_id=app_id)
+        except POOL_ERRORS as e:
+            logger.warning(f"Falha no daemon de pool, usando navegador próprio: {str(e)}")
+
     with GameSystemRequirements() as scraper:
-        return scraper.get_game_requirements(game_name)
+        return scraper.get_game_requirements(game_name, app_id=app_id)
+
+def get_requirements(game_name: str, use_cache: bool = True) -> Optional[GameRequirements]:
+    """
+    Obtém os requisitos do jogo especificado.
+
+    Args:
+        game_name: Nome do jogo para análise
+        use_cache: Se True, consulta e atualiza o cache em disco
+
+    Returns:
+        GameRequirements se encontrado, None caso contrário
+    """
+    if not use_cache:
+        return fetch_requirements(game_name)
+    return RequirementsCache().get_or_fetch(game_name, fetch_requirements)
+
+def iter_requirements(game_names: Iterable[str], use_cache: bool = True,
+                      on_start: Optional[Callable[[str], None]] = None
+                      ) -> Iterator[Tuple[str, Optional[GameRequirements]]]:
+    """
+    Obtém os requisitos de vários jogos reutilizando a mesma sessão HTTP e
+    um único navegador, aberto apenas na primeira vez que for necessário
+    (ou emprestado do daemon de pool, se estiver rodando).
+
+    Args:
+        game_names: Nomes dos jogos
+        use_cache: Se True, consulta e atualiza o cache em disco
+        on_start: Chamada com o nome do jogo quando a busca dele começa
+
+    Yields:
+        Tuplas (nome_do_jogo, GameRequirements ou None), na ordem recebida
+    """
+    # Sem stale-while-revalidate: a atualização em segundo plano usaria o
+    # navegador compartilhado depois que ele já tivesse sido fechado
+    cache = RequirementsCache(stale_while_revalidate=False) if use_cache else None
+
+    with ExitStack() as stack:
+        fetcher = stack.enter_context(SteamHttpFetcher())
+        pool_client = PoolClient()
+        scraper = pool_client if pool_client.is_available() else None
+
+        def fetch(game_name: str) -> Optional[GameRequirements]:
+            nonlocal scraper
+            app_id = resolve_app_id(game_name)
+            requirements = fetcher.get_game_requirements(game_name, app_id=app_id)
+            if requirements:
+                return requirements
+            if scraper is pool_client:
+                try:
+                    return scraper.get_game_requirements(game_name, app_id=app_id)
+                except POOL_ERRORS as e:
+                    # Daemon caiu: os jogos restantes usam um navegador próprio
+                    logger.warning(f"Falha no daemon de pool, usando navegador próprio: {str(e)}")
+                    scraper = None
+            if scraper is None:
+                scraper = stack.enter_context(GameSystemRequirements())
+            return scraper.get_game_requirements(game_name, app_id=app_id)
+
+        for game_name in game_names:
+            if on_start is not None:
+                on_start(game_name)
+            if cache is not None:
+                yield game_name, cache.get_or_fetch(game_name, fetch)
+            else:
+                yield game_name, fetch(game_name)
+
+def iter_requirements_concurrent(game_names: Iterable[str], workers: int = 4,
+                                 requests_per_second: float = 2.0, use_cache: bool = True,
+                                 on_start: Optional[Callable[[str], None]] = None
+                                 ) -> Iterator[Tuple[str, Optional[GameRequirements]]]:
+    """
+    Obtém os requisitos de vários jogos em paralelo.
+
+    Cada worker tem sua própria sessão HTTP e, se precisar, seu próprio
+    navegador. Todos compartilham um token bucket, de modo que o total de
+    requisições à Steam respeita `requests_per_second`.
+
+    Args:
+        game_names: Nomes dos jogos
+        workers: Número de buscas simultâneas
+        requests_per_second: Taxa máxima de requisições/navegações somando todos os workers
+        use_cache: Se True, consulta e atualiza o cache em disco
+        on_start: Chamada pelo worker com o nome do jogo quando a busca dele
+            começa (não quando ela entra na fila)
+
+    Yields:
+        Tuplas (nome_do_jogo, GameRequirements ou None), conforme cada busca termina
+    """
+    cache = RequirementsCache(stale_while_revalidate=False) if use_cache else None
+    rate_limiter = TokenBucket(requests_per_second, capacity=workers)
+    pool_client = PoolClient()
+    # Limpo na primeira falha do daemon: os workers passam a usar navegadores próprios
+    use_pool = threading.Event()
+    if pool_client.is_available():
+        use_pool.set()
+
+    local = threading.local()
+    opened: List = []
+    opened_lock = threading.Lock()
+
+    def open_resource(resource):
+        with opened_lock:
+            opened.append(resource)
+        return resource
+
+    def fetch(game_name: str) -> Optional[GameRequirements]:
+        if not hasattr(local, "fetcher"):
+            local.fetcher = open_resource(SteamHttpFetcher(rate_limiter=rate_limiter))
+        app_id = resolve_app_id(game_name)
+        requirements = local.fetcher.get_game_requirements(game_name, app_id=app_id)
+        if requirements:
+            return requirements
+
+        if use_pool.is_set():
+            rate_limiter.acquire()
+            try:
+                return pool_client.get_game_requirements(game_name, app_id=app_id)
+            except POOL_ERRORS as e:
+                logger.warning(f"Falha no daemon de pool, usando navegadores próprios: {str(e)}")
+                use_pool.clear()
+        if not hasattr(local, "scraper"):
+            local.scraper = open_resource(GameSystemRequirements(rate_limiter=rate_limiter).__enter__())
+        return local.scraper.get_game_requirements(game_name, app_id=app_id)
+
+    def resolve(game_name: str) -> Optional[GameRequirements]:
+        if on_start is not None:
+            on_start(game_name)
+        if cache is not None:
+            return cache.get_or_fetch(game_name, fetch)
+        return fetch(game_name)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper")
+    try:
+        futures = {executor.submit(resolve, game_name): game_name for game_name in game_names}
+        for future in as_completed(futures):
+            game_name = futures[future]
+            try:
+                yield game_name, future.result()
+            except Exception as e:
+                logger.error(f"Falha ao buscar requisitos de {game_name}: {str(e)}")
+                yield game_name, None
+    finally:
+        # Gerador abandonado (break, Ctrl+C): as buscas na fila são canceladas
+        # e só as já em andamento (no máximo `workers`) são aguardadas, pois
+        # usam os navegadores fechados logo abaixo
+        executor.shutdown(wait=True, cancel_futures=True)
+        for resource in opened:
+            try:
+                resource.__exit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"Erro ao fechar recurso de scraping: {str(e)}")
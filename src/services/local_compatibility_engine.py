@@ -0,0 +1,554 @@
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import re
+
+from src.shared.hardware import get_hardware_catalog
+from src.shared.scraping import (
+    NormalizedRequirements, normalize_game_requirements, extract_cpu_models, extract_gpu_models
+)
+from src.services.analyze_game_compatibility import (
+    CompatibilityAnalysis, PerformanceDetails, PerformanceEstimates, analyze_game_compatibility
+)
+
+# Motores de análise disponíveis no CLI
+ENGINES = ('llm', 'local', 'hybrid')
+
+# Abaixo desta fração do requisito mínimo, o jogo é considerado impossível de rodar
+HARD_FAIL_RATIO = 0.75
+# Até esta fração do requisito mínimo, o veredito é considerado limítrofe
+BORDERLINE_RATIO = 1.15
+
+# Referência para as estimativas de FPS em 1080p: o hardware recomendado roda a
+# ~60 FPS na qualidade alta e o mínimo a ~30 FPS na baixa
+RECOMMENDED_FPS_HIGH = 60.0
+MINIMUM_FPS_LOW = 30.0
+QUALITY_FPS_FACTORS = {'baixa': 1.8, 'media': 1.35, 'alta': 1.0, 'ultra': 0.75}
+
+STATUS_RECOMMENDED = 'recommended'
+STATUS_MINIMUM = 'minimum'
+STATUS_BELOW = 'below'
+STATUS_UNKNOWN = 'unknown'
+
+# Índices de desempenho aproximados (GTX 1060 / Ryzen 7 2700 ≈ 36 / 50).
+# São heurísticas por geração e faixa; modelos não reconhecidos ficam sem índice.
+_INTEL_GENERATION = {1: 20, 2: 28, 3: 31, 4: 34, 5: 35, 6: 40, 7: 42, 8: 52, 9: 56,
+                     10: 60, 11: 66, 12: 85, 13: 95, 14: 100}
+_INTEL_TIER = {'3': 0.6, '5': 0.8, '7': 1.0, '9': 1.15}
+_RYZEN_SERIES = {1: 45, 2: 50, 3: 60, 4: 60, 5: 78, 6: 80, 7: 92, 8: 92, 9: 105}
+_RYZEN_TIER = {'3': 0.7, '5': 0.85, '7': 1.0, '9': 1.15}
+_FX_SERIES = {4: 18, 6: 22, 8: 26, 9: 28}
+_PHENOM_CORES = {2: 12, 3: 14, 4: 18, 6: 22}
+_LEGACY_CPUS = {'pentium': 15, 'celeron': 10, 'xeon': 35, 'athlon': 12}
+
+# Índice da placa "60" de cada geração; as demais faixas usam _GPU_TIER
+_NVIDIA_SERIES = {4: 10, 5: 12, 6: 16, 7: 19, 9: 24, 10: 36, 16: 42, 20: 52, 30: 62, 40: 75, 50: 85}
+_AMD_SERIES = {5: 40, 6: 55, 7: 68, 9: 85}
+_GPU_TIER = {10: 0.15, 20: 0.2, 30: 0.3, 40: 0.4, 50: 0.7, 60: 1.0, 70: 1.35, 80: 1.7, 90: 2.1}
+_GPU_VARIANT = {'ti': 1.12, 'super': 1.08, 'xt': 1.1, 'xtx': 1.2, 'gre': 1.05}
+_POLARIS_TIER = {50: 0.4, 60: 0.55, 70: 0.9, 80: 1.0, 90: 1.05}
+_RADEON_HD_SERIES = {5: 8, 6: 11, 7: 18, 8: 18}
+_RADEON_HD_TIER = {30: 0.25, 40: 0.3, 50: 0.45, 60: 0.55, 70: 1.0, 80: 1.05, 90: 1.3}
+_RADEON_R_SERIES = {'r5': 7, 'r7': 14, 'r9': 30}
+_ARC_SERIES = {3: 20, 5: 40, 7: 55}
+_INTEGRATED_GPUS = {'uhd': 4, 'iris xe': 8, 'iris plus': 5, 'iris': 4}
+
+_MOBILE_GPU = re.compile(r"laptop|mobile|max-q|notebook")
+
+_INTEL_CORE = re.compile(r"^i([3579])-(\d{3,5})([a-z]{0,2})$")
+_INTEL_ULTRA = re.compile(r"^core ultra ([3579]) \d{3}([a-z]{0,2})$")
+_CORE_2 = re.compile(r"^core 2 (duo|quad)")
+_RYZEN = re.compile(r"^ryzen ([3579]) (\d)\d{3}([a-z0-9]*)$")
+_FX = re.compile(r"^fx-(\d)")
+_PHENOM = re.compile(r"^phenom .*x(\d)")
+_NVIDIA = re.compile(r"^(rtx|gtx|gts|gt) (\d{3,4})(?: (ti|super))?$")
+_RADEON_RX = re.compile(r"^rx (\d{3,4})(?: (xtx|xt|gre))?$")
+_RADEON_R = re.compile(r"^(r[579]) (\d)\d{2}$")
+_RADEON_HD = re.compile(r"^hd (\d{3,4})$")
+_VEGA = re.compile(r"^vega (\d{1,2})$")
+_ARC = re.compile(r"^arc a(\d)\d{2}(m?)$")
+
+
+def _mobile_cpu_factor(suffix: str) -> float:
+    if suffix.startswith('u'):
+        return 0.7
+    if suffix.startswith('y'):
+        return 0.5
+    if suffix.startswith('h') and suffix != 'hx':
+        return 0.9
+    return 1.0
+
+
+@lru_cache(maxsize=2048)
+def cpu_score(model: str) -> Optional[float]:
+    """
+    Índice de desempenho aproximado de um processador.
+
+    Args:
+        model: Modelo normalizado (ex: "i5-3570k", "ryzen 5 3600", "fx-8350")
+
+    Returns:
+        Índice relativo (maior é melhor) ou None se o modelo não for reconhecido
+    """
+    match = _INTEL_CORE.match(model)
+    if match:
+        tier, digits, suffix = match.groups()
+        generation = int(digits[:2]) if len(digits) == 5 else (int(digits[0]) if len(digits) == 4 else 1)
+        base = _INTEL_GENERATION.get(generation)
+        return base * _INTEL_TIER[tier] * _mobile_cpu_factor(suffix) if base else None
+
+    match = _INTEL_ULTRA.match(model)
+    if match:
+        return 95 * _INTEL_TIER[match.group(1)] * _mobile_cpu_factor(match.group(2))
+
+    match = _CORE_2.match(model)
+    if match:
+        return 16 if match.group(1) == 'quad' else 12
+
+    match = _RYZEN.match(model)
+    if match:
+        tier, series, suffix = match.groups()
+        base = _RYZEN_SERIES.get(int(series))
+        return base * _RYZEN_TIER[tier] * _mobile_cpu_factor(suffix) if base else None
+
+    match = _FX.match(model)
+    if match:
+        return _FX_SERIES.get(int(match.group(1)))
+
+    match = _PHENOM.match(model)
+    if match:
+        return _PHENOM_CORES.get(int(match.group(1)))
+
+    family = model.split(' ', 1)[0]
+    return _LEGACY_CPUS.get(family)
+
+
+@lru_cache(maxsize=2048)
+def gpu_score(model: str) -> Optional[float]:
+    """
+    Índice de desempenho aproximado de uma placa de vídeo (versão desktop).
+
+    Args:
+        model: Modelo normalizado (ex: "gtx 970", "rx 6700 xt", "uhd 620")
+
+    Returns:
+        Índice relativo (maior é melhor) ou None se o modelo não for reconhecido
+    """
+    match = _NVIDIA.match(model)
+    if match:
+        _, digits, variant = match.groups()
+        series, tier = (int(digits[:2]), int(digits[2:])) if len(digits) == 4 else (int(digits[0]), int(digits[1:]))
+        base = _NVIDIA_SERIES.get(series)
+        factor = _GPU_TIER.get(tier - tier % 10)
+        if not base or not factor:
+            return None
+        return base * factor * _GPU_VARIANT.get(variant, 1.0)
+
+    match = _RADEON_RX.match(model)
+    if match:
+        digits, variant = match.groups()
+        if len(digits) == 3:
+            factor = _POLARIS_TIER.get(int(digits[1:]) - int(digits[1:]) % 10)
+            return 36 * factor if factor else None
+        base = _AMD_SERIES.get(int(digits[0]))
+        tier = int(digits[1:3])
+        factor = _GPU_TIER.get(tier - tier % 10)
+        if not base or not factor:
+            return None
+        return base * factor * _GPU_VARIANT.get(variant, 1.0)
+
+    match = _RADEON_R.match(model)
+    if match:
+        return _RADEON_R_SERIES[match.group(1)] * (1.05 if match.group(2) == '3' else 1.0)
+
+    match = _RADEON_HD.match(model)
+    if match:
+        digits = match.group(1)
+        if len(digits) == 3 or digits.endswith('00'):
+            # Intel HD Graphics (ex: "hd 4000", "hd 530")
+            return 3
+        base = _RADEON_HD_SERIES.get(int(digits[0]))
+        factor = _RADEON_HD_TIER.get(int(digits[1:3]) - int(digits[1:3]) % 10)
+        return base * factor if base and factor else None
+
+    match = _VEGA.match(model)
+    if match:
+        return 0.9 * int(match.group(1))
+
+    match = _ARC.match(model)
+    if match:
+        base = _ARC_SERIES.get(int(match.group(1)))
+        return base * (0.7 if match.group(2) else 1.0) if base else None
+
+    if model.startswith('geforce '):
+        return 6
+    for name, score in _INTEGRATED_GPUS.items():
+        if model.startswith(name):
+            return score
+    return None
+
+
+# Separadores de alternativas em textos de requisitos sem modelo reconhecido
+_ALTERNATIVES = re.compile(r"\s*(?:/|\bor\b|\bou\b|,|;|\|)\s*", re.IGNORECASE)
+
+
+def _resolve(text: str, match, extract, score) -> Tuple[Optional[str], Optional[float]]:
+    """Nome e índice: catálogo de hardware primeiro, heurística como reserva."""
+    model = match(text)
+    if model is not None:
+        return model.name, model.score
+    scored = [(value, name) for name in extract(text) if (value := score(name)) is not None]
+    if not scored:
+        return None, None
+    value, name = max(scored)
+    return name.upper(), value
+
+
+@lru_cache(maxsize=4096)
+def resolve_cpu(text: str) -> Tuple[Optional[str], Optional[float]]:
+    """Nome e índice de um processador (nome do sistema, da Steam ou modelo normalizado)."""
+    return _resolve(text, get_hardware_catalog().match_cpu, extract_cpu_models, cpu_score)
+
+
+@lru_cache(maxsize=4096)
+def resolve_gpu(text: str) -> Tuple[Optional[str], Optional[float]]:
+    """Nome e índice de uma placa de vídeo (nome do sistema, da Steam ou modelo normalizado)."""
+    return _resolve(text, get_hardware_catalog().match_gpu, extract_gpu_models, gpu_score)
+
+
+def _lowest_requirement(models: Tuple[str, ...], text: Optional[str],
+                        resolve) -> Tuple[Optional[str], Optional[float]]:
+    """Alternativa reconhecida de menor índice: qualquer uma delas basta."""
+    candidates = models or tuple(_ALTERNATIVES.split(text or ''))
+    scored = [(value, name) for name, value in map(resolve, filter(None, candidates)) if value is not None]
+    if not scored:
+        return None, None
+    value, name = min(scored)
+    return name, value
+
+
+@lru_cache(maxsize=1024)
+def system_cpu_score(cpu_name: str) -> Tuple[Optional[str], Optional[float]]:
+    """Modelo e índice do processador do sistema, a partir do nome em SystemSpecs."""
+    return resolve_cpu(cpu_name or '')
+
+
+@lru_cache(maxsize=1024)
+def system_gpu_score(gpu_name: str) -> Tuple[Optional[str], Optional[float]]:
+    """Modelo e índice da placa de vídeo do sistema; versões laptop rendem menos."""
+    catalog_model = get_hardware_catalog().match_gpu(gpu_name or '')
+    model, score = resolve_gpu(gpu_name or '')
+    mobile_name = _MOBILE_GPU.search((gpu_name or '').lower())
+    if score is not None and mobile_name and not (catalog_model and catalog_model.mobile):
+        score *= 0.85
+    return model, score
+
+
+@lru_cache(maxsize=4096)
+def requirement_scores(requirements: NormalizedRequirements) -> Dict[str, Tuple[Optional[str], Optional[float]]]:
+    """Modelo e índice exigidos de CPU e GPU em uma seção de requisitos (memoizado)."""
+    return {
+        'cpu': _lowest_requirement(requirements.cpu_models, requirements.cpu_text, resolve_cpu),
+        'gpu': _lowest_requirement(requirements.gpu_models, requirements.gpu_text, resolve_gpu),
+    }
+
+
+@dataclass(frozen=True)
+class ComponentCheck:
+    """Comparação de um componente com os requisitos mínimos e recomendados."""
+    system_value: Optional[float]
+    minimum_value: Optional[float]
+    recommended_value: Optional[float]
+    status: str
+
+    @property
+    def minimum_ratio(self) -> Optional[float]:
+        if self.system_value is None or not self.minimum_value:
+            return None
+        return self.system_value / self.minimum_value
+
+    @property
+    def recommended_ratio(self) -> Optional[float]:
+        if self.system_value is None or not self.recommended_value:
+            return None
+        return self.system_value / self.recommended_value
+
+
+def _check(system_value: Optional[float], minimum: Optional[float], recommended: Optional[float],
+           tolerance: float = 1.0) -> ComponentCheck:
+    """Classifica o componente; `tolerance` absorve arredondamentos (ex: 15.8 GB de 16 GB)."""
+    if system_value is None or (minimum is None and recommended is None):
+        status = STATUS_UNKNOWN
+    elif recommended is not None and system_value >= recommended * tolerance:
+        status = STATUS_RECOMMENDED
+    elif minimum is None or system_value >= minimum * tolerance:
+        status = STATUS_MINIMUM
+    else:
+        status = STATUS_BELOW
+    return ComponentCheck(system_value, minimum, recommended, status)
+
+
+def _directx_version(value) -> Optional[int]:
+    match = re.search(r"(\d{1,2})", str(value or ''))
+    return int(match.group(1)) if match else None
+
+
+_STATUS_TEXT = {
+    STATUS_RECOMMENDED: "Atende aos requisitos recomendados.",
+    STATUS_MINIMUM: "Atende aos requisitos mínimos, mas fica abaixo dos recomendados.",
+    STATUS_BELOW: "Fica abaixo dos requisitos mínimos.",
+    STATUS_UNKNOWN: "Não foi possível comparar automaticamente com os requisitos.",
+}
+
+
+def _describe_model(label: str, model: Optional[str], score: Optional[float]) -> Optional[str]:
+    if model is None:
+        return None
+    return f"{label}: {model} (índice {score:.0f})"
+
+
+def _component_text(system_label: str, system_model: Optional[str], check: ComponentCheck,
+                    minimum_model: Optional[str], recommended_model: Optional[str]) -> str:
+    if system_model and check.system_value is not None:
+        system_label += f" (índice {check.system_value:.0f})"
+    parts = [system_label + "."]
+    references = [
+        text for text in (
+            _describe_model("mínimo", minimum_model, check.minimum_value),
+            _describe_model("recomendado", recommended_model, check.recommended_value),
+        ) if text
+    ]
+    if references:
+        parts.append("Requisitos - " + "; ".join(references) + ".")
+    parts.append(_STATUS_TEXT[check.status])
+    return " ".join(parts)
+
+
+def _fps_text(fps: Optional[float]) -> str:
+    if fps is None:
+        return "Não estimado"
+    if fps < 15:
+        return "< 15 FPS"
+    return f"~{min(fps, 240):.0f} FPS"
+
+
+def _estimate_fps(checks: List[ComponentCheck]) -> Dict[str, PerformanceEstimates]:
+    """Estimativa de FPS em 1080p a partir da folga em relação aos requisitos."""
+    recommended = [check.recommended_ratio for check in checks if check.recommended_ratio is not None]
+    minimum = [check.minimum_ratio for check in checks if check.minimum_ratio is not None]
+    if recommended:
+        high = RECOMMENDED_FPS_HIGH * min(recommended)
+    elif minimum:
+        high = MINIMUM_FPS_LOW / QUALITY_FPS_FACTORS['baixa'] * min(minimum)
+    else:
+        high = None
+    values = {
+        quality: _fps_text(high * factor if high is not None else None)
+        for quality, factor in QUALITY_FPS_FACTORS.items()
+    }
+    return {'1080p': PerformanceEstimates(**values)}
+
+
+def component_checks(system_specs, game_requirements) -> Dict[str, ComponentCheck]:
+    """Compara CPU, GPU e RAM com os requisitos, sem gerar os textos da análise."""
+    minimum, recommended = normalize_game_requirements(game_requirements)
+    min_scores = requirement_scores(minimum)
+    rec_scores = requirement_scores(recommended)
+    return {
+        'cpu': _check(system_cpu_score(system_specs.cpu_name)[1], min_scores['cpu'][1], rec_scores['cpu'][1]),
+        'gpu': _check(system_gpu_score(system_specs.gpu_name)[1], min_scores['gpu'][1], rec_scores['gpu'][1]),
+        'ram': _check(system_specs.ram_total, minimum.ram_gb, recommended.ram_gb, tolerance=0.95),
+    }
+
+
+def is_borderline(system_specs, game_requirements, analysis: CompatibilityAnalysis) -> bool:
+    """
+    Indica se o veredito de uma análise merece uma segunda opinião.
+
+    O veredito é limítrofe quando algum componente fica perto do requisito
+    mínimo (entre HARD_FAIL_RATIO e BORDERLINE_RATIO) ou quando `can_run`
+    contradiz a comparação local. Sem componentes comparáveis, não há como
+    julgar e o veredito é aceito.
+    """
+    return is_borderline_verdict(system_specs, game_requirements, analysis.can_run)
+
+
+def is_borderline_verdict(system_specs, game_requirements, can_run: bool) -> bool:
+    """
+    Como `is_borderline`, mas só com o veredito.
+
+    Permite decidir assim que `can_run` chega em streaming, antes do resto
+    da análise.
+    """
+    ratios = [
+        check.minimum_ratio for check in component_checks(system_specs, game_requirements).values()
+        if check.minimum_ratio is not None
+    ]
+    if not ratios:
+        return False
+    if can_run != all(ratio >= HARD_FAIL_RATIO for ratio in ratios):
+        return True
+    return any(HARD_FAIL_RATIO <= ratio < BORDERLINE_RATIO for ratio in ratios)
+
+
+def evaluate_compatibility(system_specs, game_requirements) -> CompatibilityAnalysis:
+    """
+    Analisa a compatibilidade localmente, sem chamar o LLM.
+
+    Compara índices de desempenho de CPU e GPU, RAM, VRAM, armazenamento e
+    DirectX com os requisitos normalizados. O resultado é determinístico e
+    leva microssegundos, o que permite verificações em massa.
+
+    Args:
+        system_specs: Objeto contendo as especificações do sistema
+        game_requirements: Objeto contendo os requisitos do jogo
+
+    Returns:
+        CompatibilityAnalysis: Resultado da análise, com textos gerados por regras
+    """
+    minimum, recommended = normalize_game_requirements(game_requirements)
+    min_scores = requirement_scores(minimum)
+    rec_scores = requirement_scores(recommended)
+
+    cpu_model = system_cpu_score(system_specs.cpu_name)[0]
+    gpu_model = system_gpu_score(system_specs.gpu_name)[0]
+    # VRAM e recursos ausentes na coleta vêm do catálogo
+    catalog_gpu = get_hardware_catalog().match_gpu(system_specs.gpu_name or '')
+    vram_total = system_specs.gpu_memory_total or (catalog_gpu.vram_gb if catalog_gpu else None)
+
+    checks = component_checks(system_specs, game_requirements)
+    cpu, gpu, ram = checks['cpu'], checks['gpu'], checks['ram']
+    vram = _check(vram_total, minimum.vram_gb, recommended.vram_gb, tolerance=0.95)
+
+    expected_issues = []
+    upgrade_suggestions = []
+    component_names = {'cpu': 'Processador', 'gpu': 'Placa de vídeo', 'ram': 'Memória RAM'}
+    targets = {
+        'cpu': rec_scores['cpu'][0] or min_scores['cpu'][0] or '',
+        'gpu': rec_scores['gpu'][0] or min_scores['gpu'][0] or '',
+        'ram': f"{recommended.ram_gb or minimum.ram_gb or 0:g}GB",
+    }
+    for key, check in checks.items():
+        name = component_names[key]
+        if check.status == STATUS_BELOW:
+            expected_issues.append(f"{name} abaixo dos requisitos mínimos.")
+            upgrade_suggestions.append(f"{name}: atualizar para {targets[key]} ou superior para atingir os requisitos.")
+        elif check.status == STATUS_MINIMUM and check.recommended_value is not None:
+            expected_issues.append(f"{name} abaixo dos requisitos recomendados; pode limitar a qualidade gráfica.")
+            upgrade_suggestions.append(f"{name}: {targets[key]} ou superior permite jogar com a qualidade recomendada.")
+        elif check.status == STATUS_UNKNOWN and (minimum.cpu_text or minimum.gpu_text or minimum.ram_gb):
+            expected_issues.append(f"{name}: comparação automática indisponível; verifique manualmente.")
+
+    if vram.status == STATUS_BELOW:
+        expected_issues.append(
+            f"VRAM de {vram_total:g}GB abaixo dos {vram.minimum_value:g}GB mínimos; "
+            "reduza a qualidade das texturas."
+        )
+
+    storage_devices = getattr(system_specs, 'storage_devices', None) or []
+    free_space = max((device.free for device in storage_devices), default=None)
+    has_ssd = any('ssd' in (device.type or '').lower() for device in storage_devices)
+    required_storage = recommended.storage_gb or minimum.storage_gb
+    if required_storage and free_space is not None and free_space < required_storage:
+        expected_issues.append(
+            f"Espaço livre insuficiente: o jogo requer {required_storage:g}GB e o maior espaço livre é {free_space}GB."
+        )
+    requires_ssd = minimum.storage_ssd or recommended.storage_ssd
+    if requires_ssd and not has_ssd:
+        expected_issues.append("O jogo requer SSD; em HDD os tempos de carregamento e o streaming de texturas sofrem.")
+
+    system_directx = _directx_version(getattr(system_specs, 'directx_version', None))
+    if minimum.directx and system_directx and system_directx < minimum.directx:
+        expected_issues.append(f"DirectX {system_directx} instalado; o jogo requer DirectX {minimum.directx}.")
+
+    known = [check for check in checks.values() if check.status != STATUS_UNKNOWN]
+    can_run = not any(
+        check.minimum_ratio is not None and check.minimum_ratio < HARD_FAIL_RATIO for check in known
+    )
+    if any(check.status == STATUS_BELOW for check in known):
+        performance_level = 'Baixo'
+    elif known and all(check.status == STATUS_RECOMMENDED for check in known):
+        performance_level = 'Alto'
+    else:
+        performance_level = 'Médio'
+
+    settings = {
+        'Alto': "1080p, qualidade alta a ultra, alvo de 60 FPS.",
+        'Médio': "1080p, qualidade média, alvo de 60 FPS; reduza sombras e efeitos volumétricos se necessário.",
+        'Baixo': "900p a 1080p, qualidade baixa, alvo de 30 FPS.",
+    }[performance_level]
+    tech = getattr(system_specs, 'gpu_tech_support', None) or (catalog_gpu.tech_support if catalog_gpu else {})
+    if tech.get('dlss'):
+        settings += " Ative o DLSS (modo Qualidade) se o jogo suportar."
+    elif tech.get('fsr') or performance_level == 'Baixo':
+        settings += " Use FSR se o jogo suportar."
+
+    ram_text = f"{system_specs.ram_total}GB {system_specs.ram_type or ''}".strip()
+    ram_reference = [
+        f"{label} {value:g}GB" for label, value in (('mínimo', minimum.ram_gb), ('recomendado', recommended.ram_gb))
+        if value
+    ]
+    if required_storage:
+        storage_impact = f"O jogo requer {required_storage:g}GB{' em SSD' if requires_ssd else ''}. "
+    else:
+        storage_impact = "Espaço de instalação não informado. "
+    storage_impact += (
+        "Há SSD no sistema: instale o jogo nele para carregamentos mais rápidos."
+        if has_ssd else "Sem SSD detectado: espere carregamentos mais longos."
+    )
+
+    performance_details = PerformanceDetails(
+        cpu_analysis=_component_text(
+            system_specs.cpu_name, cpu_model, cpu, min_scores['cpu'][0], rec_scores['cpu'][0]
+        ),
+        gpu_analysis=_component_text(
+            f"{system_specs.gpu_name}"
+            + (f" ({system_specs.gpu_memory_total}GB VRAM)" if system_specs.gpu_memory_total else ""),
+            gpu_model, gpu, min_scores['gpu'][0], rec_scores['gpu'][0]
+        ),
+        ram_analysis=(
+            f"{ram_text} instalados" + (f"; {', '.join(ram_reference)}" if ram_reference else "") + ". "
+            + _STATUS_TEXT[ram.status]
+        ),
+        storage_impact=storage_impact,
+        estimated_fps=_estimate_fps([check for check in (cpu, gpu) if check.status != STATUS_UNKNOWN])
+    )
+
+    return CompatibilityAnalysis(
+        can_run=can_run,
+        performance_level=performance_level,
+        expected_issues=expected_issues,
+        recommended_settings=settings,
+        upgrade_suggestions=upgrade_suggestions,
+        performance_details=performance_details
+    )
+
+
+def analyze_hybrid(system_specs, game_requirements, use_cache: bool = True) -> CompatibilityAnalysis:
+    """
+    Veredito local com a análise descritiva do LLM.
+
+    `can_run` e `performance_level` vêm do motor local, que é determinístico;
+    o LLM contribui apenas com os textos.
+    """
+    local = evaluate_compatibility(system_specs, game_requirements)
+    narrative = analyze_game_compatibility(system_specs, game_requirements, use_cache=use_cache)
+    return replace(narrative, can_run=local.can_run, performance_level=local.performance_level)
+
+
+def analyze_with_engine(system_specs, game_requirements, engine: str = 'llm',
+                        use_cache: bool = True) -> CompatibilityAnalysis:
+    """
+    Analisa a compatibilidade com o motor escolhido.
+
+    Args:
+        engine: 'llm' (análise completa pelo LLM), 'local' (regras, sem rede)
+            ou 'hybrid' (veredito local e textos do LLM)
+    """
+    if engine == 'local':
+        return evaluate_compatibility(system_specs, game_requirements)
+    if engine == 'hybrid':
+        return analyze_hybrid(system_specs, game_requirements, use_cache=use_cache)
+    if engine == 'llm':
+        return analyze_game_compatibility(system_specs, game_requirements, use_cache=use_cache)
+    raise ValueError(f"Motor de análise desconhecido: {engine}")
@@ -0,0 +1,29 @@
+import platform
+from typing import Optional
+
+from .base import SpecCollector, StorageDevice, SystemSpecs
+from .cache import SpecsSnapshotCache
+
+def get_collector(system: Optional[str] = None) -> SpecCollector:
+    """
+    Retorna o backend de coleta da plataforma.
+
+    O módulo do backend só é importado aqui, então dependências como wmi
+    não são carregadas em outras plataformas.
+
+    Args:
+        system: Nome da plataforma, como em platform.system() (padrão: a atual)
+
+    Raises:
+        NotImplementedError: Se não houver backend para a plataforma
+    """
+    system = system or platform.system()
+    if system == "Windows":
+        from .windows import WindowsSpecCollector
+        return WindowsSpecCollector()
+    if system == "Linux":
+        from .linux import LinuxSpecCollector
+        return LinuxSpecCollector()
+    raise NotImplementedError(f"Coleta de especificações não suportada em {system}")
+
+__all__ = ['SpecCollector', 'SpecsSnapshotCache', 'StorageDevice', 'SystemSpecs', 'get_collector']
@@ -0,0 +1,157 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import Any, Optional, Dict, List
+import platform
+
+import psutil
+
+from src.shared.utils import get_cpu_load_sampler
+
+from .probes import run_probes
+
+@dataclass
+class StorageDevice:
+    """Informações de um dispositivo de armazenamento."""
+    name: str
+    type: str          # SSD, HDD, NVMe
+    total: int         # GB
+    free: int          # GB
+    mount_point: str
+
+@dataclass
+class SystemSpecs:
+    """Especificações detalhadas do sistema."""
+    # Campos obrigatórios primeiro
+    cpu_name: str
+    cpu_cores: int
+    cpu_threads: int
+    cpu_freq_base: float
+    cpu_freq_max: float
+    ram_total: int          # GB
+    ram_free: int          # GB
+    ram_used: int          # GB
+    gpu_name: str
+    storage_devices: List[StorageDevice]  # Lista de dispositivos
+    os_name: str
+    os_version: str
+
+    # Campos opcionais depois
+    cpu_temp: Optional[float] = None     # °C
+    cpu_load: Optional[float] = None     # %
+    cpu_architecture: Optional[str] = None
+    ram_speed: Optional[int] = None  # MHz
+    ram_type: Optional[str] = None   # DDR4, DDR5, etc
+    gpu_memory_total: Optional[int] = None  # GB
+    gpu_memory_type: Optional[str] = None   # GDDR5, GDDR6, etc
+    gpu_driver: Optional[str] = None
+    gpu_driver_date: Optional[str] = None
+    gpu_resolution: Optional[str] = None     # Máxima resolução suportada
+    gpu_refresh_rate: Optional[int] = None   # Taxa de atualização máxima
+    gpu_architecture: Optional[str] = None   # Arquitetura (ex: Ampere, Ada Lovelace)
+    gpu_tech_support: Optional[Dict[str, bool]] = None  # Suporte a tecnologias (DLSS, Ray Tracing, etc)
+    os_build: Optional[str] = None
+    directx_version: Optional[str] = None
+
+    # Diagnóstico da coleta (com o snapshot do cache, das sondas de atualização)
+    probe_timings: Optional[Dict[str, float]] = None   # segundos por sonda
+    probe_timeouts: Optional[List[str]] = None          # sondas abandonadas; campos delas ficam vazios
+    probe_failures: Optional[List[str]] = None          # sondas que levantaram exceção; idem
+
+class SpecCollector(ABC):
+    """
+    Backend de coleta das especificações do sistema.
+
+    Cada plataforma tem sua implementação; dependências específicas (ex: wmi)
+    são importadas apenas pelo backend que as usa, no momento da coleta.
+    """
+
+    # Nome exibido em logs e mensagens de erro
+    name: str = "base"
+
+    @abstractmethod
+    def collect(self) -> SystemSpecs:
+        """
+        Coleta as especificações do sistema.
+
+        Returns:
+            SystemSpecs com todas as informações disponíveis na plataforma
+        """
+
+    def fingerprint(self) -> Dict[str, Any]:
+        """
+        Identificação barata do hardware, usada como chave do snapshot em cache.
+
+        Não consulta WMI nem roda heurísticas; se qualquer item mudar (troca
+        de placa, memória, sistema, partições), a coleta completa é refeita.
+        Os backends acrescentam a identificação das placas de vídeo.
+        """
+        uname = platform.uname()
+        return {
+            'collector': self.name,
+            'system': [uname.system, uname.node, uname.release, uname.version, uname.machine],
+            'cpu': [psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)],
+            'ram': round(psutil.virtual_memory().total / (1024**3)),
+            'partitions': sorted([p.device, p.mountpoint] for p in psutil.disk_partitions()),
+        }
+
+    def cpu_temperature(self) -> Optional[float]:
+        """Temperatura atual da CPU em °C, se houver sensor acessível."""
+        return None
+
+    def refresh(self, specs: SystemSpecs) -> SystemSpecs:
+        """
+        Atualiza apenas os campos que variam entre execuções.
+
+        Memória livre/em uso, carga e temperatura da CPU e espaço livre dos
+        discos; o restante do snapshot é mantido. Cada item é uma sonda com
+        prazo, como na coleta completa: um ponto de montagem travado (rede,
+        disco externo em repouso) não segura a execução. Memória e discos cujas
+        sondas falham ficam com o valor do snapshot; carga e temperatura
+        ficam vazias.
+
+        Args:
+            specs: Snapshot coletado anteriormente
+
+        Returns:
+            Cópia de specs com os valores atuais e o diagnóstico das sondas
+        """
+        probes = {
+            'memory': psutil.virtual_memory,
+            'cpu_load': get_cpu_load_sampler().current,
+            'cpu_temp': self.cpu_temperature,
+        }
+        for device in specs.storage_devices:
+            probes[f"disk:{device.mount_point}"] = (
+                lambda mount_point=device.mount_point: psutil.disk_usage(mount_point)
+            )
+        results = run_probes(probes)
+
+        storage_devices = []
+        for device in specs.storage_devices:
+            usage = results.get(f"disk:{device.mount_point}")
+            free = round(usage.free / (1024**3)) if usage is not None else device.free
+            storage_devices.append(replace(device, free=free))
+
+        ram = results.get('memory')
+        return replace(
+            specs,
+            ram_free=round(ram.available / (1024**3)) if ram is not None else specs.ram_free,
+            ram_used=round((ram.total - ram.available) / (1024**3)) if ram is not None else specs.ram_used,
+            cpu_load=results.get('cpu_load'),
+            cpu_temp=results.get('cpu_temp'),
+            storage_devices=storage_devices,
+            probe_timings=results.timings,
+            probe_timeouts=results.timeouts,
+            probe_failures=results.failures
+        )
+
+def format_cpu_arch(arch: str) -> str:
+    """Formata a arquitetura da CPU de forma mais amigável."""
+    arch = arch.lower()
+    if arch in ['amd64', 'x86_64']:
+        return 'x64'
+    elif arch == 'x86':
+        return 'x86'
+    elif 'arm' in arch:
+        return arch.upper()
+    return arch
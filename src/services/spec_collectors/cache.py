@@ -0,0 +1,81 @@
+from dataclasses import asdict, replace
+from typing import Optional
+import hashlib
+import json
+import logging
+import os
+
+from src.shared.cache import DiskCache
+
+from .base import SpecCollector, StorageDevice, SystemSpecs
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 7 * 24 * 3600  # 7 dias
+
+
+class SpecsSnapshotCache:
+    """
+    Cache em disco do snapshot de SystemSpecs.
+
+    A coleta completa (WMI, heurísticas de GPU, SMBIOS) só roda quando a
+    identificação barata do hardware muda ou a entrada expira; nas demais
+    execuções o snapshot é lido do disco e apenas os campos dinâmicos
+    (memória livre, carga e temperatura da CPU, espaço livre) são atualizados.
+    """
+
+    def __init__(self, cache: Optional[DiskCache] = None, ttl: Optional[float] = None):
+        """
+        Inicializa o cache.
+
+        Args:
+            cache: DiskCache de armazenamento (padrão: namespace "system_specs")
+            ttl: Tempo de vida do snapshot em segundos (padrão: SYSTEM_SPECS_CACHE_TTL)
+        """
+        self.cache = cache or DiskCache("system_specs", max_entries=20)
+        self.ttl = ttl if ttl is not None else float(os.getenv("SYSTEM_SPECS_CACHE_TTL", DEFAULT_TTL))
+
+    @staticmethod
+    def key(collector: SpecCollector) -> str:
+        """Chave do snapshot: hash da identificação do hardware."""
+        fingerprint = json.dumps(collector.fingerprint(), sort_keys=True, ensure_ascii=False)
+        return "specs:" + hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def get_specs(self, collector: SpecCollector, refresh: bool = False) -> SystemSpecs:
+        """
+        Retorna as especificações, reaproveitando o snapshot quando possível.
+
+        Args:
+            collector: Backend de coleta da plataforma
+            refresh: Se True, ignora o snapshot e refaz a coleta completa
+
+        Returns:
+            SystemSpecs com os campos dinâmicos atualizados
+        """
+        key = self.key(collector)
+        if not refresh:
+            value = self.cache.get(key)
+            if value is not None:
+                try:
+                    specs = self._from_dict(value)
+                except TypeError as e:
+                    logger.warning(f"Snapshot do sistema inválido, coletando novamente: {e}")
+                else:
+                    logger.info("Especificações do sistema lidas do cache")
+                    return collector.refresh(specs)
+
+        specs = collector.collect()
+        incomplete = (specs.probe_failures or []) + (specs.probe_timeouts or [])
+        if incomplete:
+            # Snapshot parcial: não fica em cache, a próxima execução tenta de novo
+            logger.warning(f"Coleta incompleta ({', '.join(incomplete)}), snapshot não gravado")
+            return specs
+        snapshot = replace(specs, probe_timings=None, probe_timeouts=None, probe_failures=None)
+        self.cache.set(key, asdict(snapshot), ttl=self.ttl)
+        return specs
+
+    @staticmethod
+    def _from_dict(value: dict) -> SystemSpecs:
+        value = dict(value)
+        value['storage_devices'] = [StorageDevice(**device) for device in value['storage_devices']]
+        return SystemSpecs(**value)
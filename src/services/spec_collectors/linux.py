@@ -0,0 +1,386 @@
+import glob
+import os
+import platform
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+
+from src.shared.utils import get_cpu_load_sampler
+
+from .base import SpecCollector, StorageDevice, SystemSpecs, format_cpu_arch
+from .probes import run_probes
+
+# Fabricantes PCI das placas de vídeo
+PCI_VENDORS = {0x10de: "NVIDIA", 0x1002: "AMD", 0x8086: "Intel"}
+PCI_IDS_PATHS = ("/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids")
+
+# Tipos de memória da tabela SMBIOS 17 (Memory Device)
+_SMBIOS_MEMORY_TYPES = {
+    0x12: "DDR", 0x13: "DDR2", 0x18: "DDR3", 0x1A: "DDR4", 0x1B: "LPDDR", 0x1C: "LPDDR2",
+    0x1D: "LPDDR3", 0x1E: "LPDDR4", 0x22: "DDR5", 0x23: "LPDDR5",
+}
+# Sensores de temperatura do pacote da CPU em /sys/class/hwmon
+_CPU_HWMON = ("coretemp", "k10temp", "zenpower", "cpu_thermal")
+
+SMBIOS_MEMORY_ENTRIES = "/sys/firmware/dmi/entries/17-*/raw"
+SYS_CLASS_BLOCK = "/sys/class/block"
+
+def _read(path: str) -> Optional[str]:
+    """Conteúdo de um arquivo de procfs/sysfs, ou None se não existir ou não puder ser lido."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _read_int(path: str, base: int = 10) -> Optional[int]:
+    value = _read(path)
+    try:
+        return int(value, base) if value else None
+    except ValueError:
+        return None
+
+def _key_values(text: Optional[str], separator: str = ":") -> Dict[str, str]:
+    """Linhas 'chave: valor' (ex: /proc/meminfo, /etc/os-release com '=')."""
+    values = {}
+    for line in (text or "").splitlines():
+        key, found, value = line.partition(separator)
+        if found:
+            values.setdefault(key.strip(), value.strip().strip('"'))
+    return values
+
+def _pci_device_name(vendor_id: int, device_id: int) -> Optional[str]:
+    """
+    Nome comercial do dispositivo em pci.ids.
+
+    O nome entre colchetes é o comercial ("GA107M [GeForce RTX 3050 Mobile]");
+    a leitura para no fim da seção do fabricante.
+    """
+    vendor_prefix = f"{vendor_id:04x}  "
+    device_prefix = f"\t{device_id:04x}  "
+    for path in PCI_IDS_PATHS:
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                in_vendor = False
+                for line in f:
+                    if in_vendor:
+                        if line.startswith(device_prefix):
+                            name = line[len(device_prefix):].strip()
+                            match = re.search(r"\[(.+)\]", name)
+                            return match.group(1) if match else name
+                        if line[:1] not in ("\t", "#", "\n"):
+                            return None
+                    elif line.startswith(vendor_prefix):
+                        in_vendor = True
+        except OSError:
+            continue
+    return None
+
+def _parse_cpuinfo(text: str) -> Tuple[Optional[str], int, int]:
+    """
+    Modelo, núcleos físicos e threads de /proc/cpuinfo.
+
+    Núcleos são pares (physical id, core id) distintos; sem essas chaves
+    (ex: ARM), o número de núcleos é 0 e fica a cargo do chamador.
+    """
+    name = None
+    processors = 0
+    cores = set()
+    physical_id = core_id = None
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        key, value = key.strip(), value.strip()
+        if key == "processor":
+            processors += 1
+        elif key in ("model name", "Hardware", "Model") and not name:
+            name = value
+        elif key == "physical id":
+            physical_id = value
+        elif key == "core id":
+            core_id = value
+        elif not line.strip() and core_id is not None:
+            cores.add((physical_id, core_id))
+            physical_id = core_id = None
+    if core_id is not None:
+        cores.add((physical_id, core_id))
+    return name, len(cores), processors
+
+def _parse_meminfo(text: str) -> Tuple[int, int, int]:
+    """Total, disponível e em uso, em GB, de /proc/meminfo (valores em kB)."""
+    meminfo = _key_values(text)
+
+    def kib(key: str) -> int:
+        return int(meminfo.get(key, "0").split()[0])
+
+    total = kib("MemTotal")
+    # Kernels anteriores ao 3.14 não têm MemAvailable
+    available = kib("MemAvailable") or kib("MemFree") + kib("Buffers") + kib("Cached")
+    to_gb = lambda value: round(value / (1024**2))
+    return to_gb(total), to_gb(available), to_gb(total - available)
+
+def _parse_smbios_memory_device(raw: bytes) -> Optional[Tuple[Optional[str], Optional[int]]]:
+    """
+    Tipo e velocidade (MHz) de uma entrada SMBIOS 17 (Memory Device).
+
+    Returns:
+        Tupla (tipo, velocidade), ou None se a entrada for um slot vazio
+    """
+    # O arquivo traz a tabela de strings depois da estrutura: o tamanho da
+    # parte formatada (e os campos que a versão do SMBIOS tem) vem no byte 1
+    length = min(len(raw), raw[1]) if len(raw) > 1 else 0
+    if length < 0x17 or int.from_bytes(raw[0x0C:0x0E], "little") in (0, 0xFFFF):
+        return None
+    memory_type = _SMBIOS_MEMORY_TYPES.get(raw[0x12])
+    speed = int.from_bytes(raw[0x15:0x17], "little") or None
+    if length >= 0x22:
+        speed = int.from_bytes(raw[0x20:0x22], "little") or speed  # velocidade configurada
+    return memory_type, speed
+
+class LinuxSpecCollector(SpecCollector):
+    """
+    Coleta lendo diretamente procfs e sysfs (/proc/cpuinfo, /proc/meminfo,
+    /sys/class/drm, /sys/block), sem processos externos nem privilégios.
+    """
+
+    name = "linux"
+
+    def collect(self) -> SystemSpecs:
+        """
+        Coleta especificações detalhadas do sistema.
+
+        Cada seção é uma sonda independente, executada em paralelo com prazo
+        próprio; seções que falham ou estouram o prazo ficam com valores
+        padrão e são listadas em probe_failures ou probe_timeouts.
+
+        Returns:
+            SystemSpecs com todas as informações coletadas
+        """
+        probes = run_probes({
+            'cpu': self._cpu_info,
+            'cpu_freq': self._cpu_frequencies,
+            'cpu_temp': self.cpu_temperature,
+            'memory': self._memory,
+            'memory_modules': self._memory_modules,
+            'gpu': self._gpu,
+            'storage': self._storage_devices,
+            'os': self._os,
+        })
+        cpu_name, cpu_cores, cpu_threads = probes.get('cpu') or (
+            platform.processor() or "CPU não detectada", psutil.cpu_count(logical=False) or 1, os.cpu_count() or 1
+        )
+        cpu_freq_base, cpu_freq_max = probes.get('cpu_freq', (0, 0))
+        ram_total, ram_free, ram_used = probes.get('memory') or self._psutil_memory()
+        ram_type, ram_speed = probes.get('memory_modules', (None, None))
+        gpu = probes.get('gpu', {})
+        os_name, os_version, os_build = probes.get('os') or (platform.system(), platform.release(), None)
+
+        return SystemSpecs(
+            # Campos obrigatórios
+            cpu_name=cpu_name,
+            cpu_cores=cpu_cores,
+            cpu_threads=cpu_threads,
+            cpu_freq_base=cpu_freq_base,
+            cpu_freq_max=cpu_freq_max,
+            ram_total=ram_total,
+            ram_free=ram_free,
+            ram_used=ram_used,
+            gpu_name=gpu.get('name') or "GPU não detectada",
+            storage_devices=probes.get('storage', []),
+            os_name=os_name,
+            os_version=os_version,
+
+            # Campos opcionais
+            cpu_temp=probes.get('cpu_temp'),
+            cpu_load=get_cpu_load_sampler().current(),
+            cpu_architecture=format_cpu_arch(platform.machine()),
+            ram_speed=ram_speed,
+            ram_type=ram_type,
+            gpu_memory_total=gpu.get('memory'),
+            gpu_memory_type=gpu.get('memory_type'),
+            gpu_driver=gpu.get('driver'),
+            gpu_resolution=gpu.get('resolution'),
+            gpu_architecture=gpu.get('architecture'),
+            gpu_tech_support=gpu.get('tech_support'),
+            os_build=os_build,
+            probe_timings=probes.timings,
+            probe_timeouts=probes.timeouts,
+            probe_failures=probes.failures
+        )
+
+    def fingerprint(self) -> Dict[str, Any]:
+        """Identificação do sistema mais os ids PCI e a versão do driver de cada placa de vídeo."""
+        fingerprint = super().fingerprint()
+        fingerprint['gpus'] = [
+            [_read(f"{card}/device/vendor"), _read(f"{card}/device/device"),
+             self._driver_version(self._driver(f"{card}/device"))]
+            for card in self._cards()
+        ]
+        return fingerprint
+
+    def _cpu_info(self) -> Tuple[str, int, int]:
+        """Modelo, núcleos físicos e threads a partir de /proc/cpuinfo."""
+        name, cores, processors = _parse_cpuinfo(_read("/proc/cpuinfo") or "")
+        threads = processors or os.cpu_count() or 1
+        physical = cores or psutil.cpu_count(logical=False) or threads
+        return name or platform.processor() or "CPU não detectada", physical, threads
+
+    def _cpu_frequencies(self) -> Tuple[float, float]:
+        """Frequências base e máxima em GHz (cpufreq informa kHz)."""
+        cpufreq = "/sys/devices/system/cpu/cpu0/cpufreq"
+        base = _read_int(f"{cpufreq}/base_frequency") or _read_int(f"{cpufreq}/scaling_cur_freq")
+        maximum = _read_int(f"{cpufreq}/cpuinfo_max_freq")
+        if base is None:
+            mhz = _key_values(_read("/proc/cpuinfo")).get("cpu MHz")
+            base = float(mhz) * 1000 if mhz else None
+        freq_base = round(base / 1e6, 2) if base else 0
+        freq_max = round(maximum / 1e6, 2) if maximum else freq_base
+        return freq_base, freq_max
+
+    def cpu_temperature(self) -> Optional[float]:
+        for hwmon in glob.glob("/sys/class/hwmon/hwmon*"):
+            if _read(f"{hwmon}/name") in _CPU_HWMON:
+                value = _read_int(f"{hwmon}/temp1_input")
+                if value is not None:
+                    return value / 1000
+        return None
+
+    def _memory(self) -> Tuple[int, int, int]:
+        """Total, disponível e em uso, em GB, a partir de /proc/meminfo."""
+        return _parse_meminfo(_read("/proc/meminfo") or "")
+
+    def _psutil_memory(self) -> Tuple[int, int, int]:
+        ram = psutil.virtual_memory()
+        to_gb = lambda value: round(value / (1024**3))
+        return to_gb(ram.total), to_gb(ram.available), to_gb(ram.total - ram.available)
+
+    def _memory_modules(self) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Tipo e velocidade da RAM pelas entradas SMBIOS 17 do firmware.
+
+        Os arquivos costumam exigir root; sem acesso, os campos ficam vazios.
+        """
+        for entry in sorted(glob.glob(SMBIOS_MEMORY_ENTRIES)):
+            try:
+                with open(entry, "rb") as f:
+                    module = _parse_smbios_memory_device(f.read())
+            except OSError:
+                return None, None
+            if module is not None:  # None: slot vazio
+                return module
+        return None, None
+
+    def _gpu(self) -> Dict[str, object]:
+        """
+        Placa de vídeo principal a partir de /sys/class/drm.
+
+        Prefere NVIDIA e AMD às integradas; nome, VRAM e recursos ausentes no
+        sysfs são completados pelo catálogo de hardware.
+        """
+        gpus = []
+        for card in self._cards():
+            device = f"{card}/device"
+            vendor_id = _read_int(f"{device}/vendor", 16)
+            device_id = _read_int(f"{device}/device", 16)
+            if vendor_id is None:
+                continue
+            vendor = PCI_VENDORS.get(vendor_id)
+            driver = self._driver(device)
+            name = self._nvidia_model(device) if driver == "nvidia" else None
+            if not name:
+                product = _pci_device_name(vendor_id, device_id) if device_id is not None else None
+                name = f"{vendor} {product}" if vendor and product else product or vendor
+            vram = _read_int(f"{device}/mem_info_vram_total")
+            gpus.append({
+                'name': name,
+                'vendor': vendor,
+                'memory': round(vram / (1024**3)) if vram else None,
+                'driver': self._driver_version(driver),
+                'resolution': self._resolution(card),
+            })
+        if not gpus:
+            return {}
+
+        gpus.sort(key=lambda gpu: (gpu['vendor'] in ("NVIDIA", "AMD"), gpu['memory'] or 0), reverse=True)
+        gpu = gpus[0]
+        self._complete_from_catalog(gpu)
+        return gpu
+
+    def _cards(self) -> List[str]:
+        """Placas em /sys/class/drm, sem os conectores (card0-HDMI-A-1)."""
+        return [card for card in sorted(glob.glob("/sys/class/drm/card[0-9]*"))
+                if "-" not in os.path.basename(card)]
+
+    def _driver(self, device: str) -> Optional[str]:
+        driver_link = f"{device}/driver"
+        return os.path.basename(os.path.realpath(driver_link)) if os.path.exists(driver_link) else None
+
+    def _nvidia_model(self, device: str) -> Optional[str]:
+        """Nome informado pelo driver proprietário da NVIDIA."""
+        bus_id = os.path.basename(os.path.realpath(device))
+        information = _read(f"/proc/driver/nvidia/gpus/{bus_id}/information")
+        return _key_values(information).get("Model")
+
+    def _driver_version(self, driver: Optional[str]) -> Optional[str]:
+        if not driver:
+            return None
+        version = _read(f"/sys/module/{driver}/version")
+        return f"{driver} {version}" if version else driver
+
+    def _resolution(self, card: str) -> Optional[str]:
+        """Primeiro modo (o preferido) de um conector conectado."""
+        for connector in sorted(glob.glob(f"{card}-*")):
+            if _read(f"{connector}/status") == "connected":
+                modes = _read(f"{connector}/modes")
+                if modes:
+                    return modes.splitlines()[0]
+        return None
+
+    def _complete_from_catalog(self, gpu: Dict[str, object]):
+        from src.shared.hardware import get_hardware_catalog
+
+        model = get_hardware_catalog().match_gpu(gpu['name'] or "")
+        if model is None:
+            return
+        if not gpu['memory'] and model.vram_gb:
+            gpu['memory'] = round(model.vram_gb)
+        gpu['memory_type'] = model.memory_type
+        gpu['architecture'] = model.architecture
+        gpu['tech_support'] = model.tech_support
+
+    def _storage_devices(self) -> List[StorageDevice]:
+        """Partições montadas, com o tipo do disco por /sys/block/*/queue/rotational."""
+        devices = []
+        for partition in psutil.disk_partitions():
+            if not partition.device.startswith("/dev/"):
+                continue
+            try:
+                usage = os.statvfs(partition.mountpoint)
+            except OSError:
+                continue
+            devices.append(StorageDevice(
+                name=partition.device,
+                type=self._disk_type(partition.device),
+                total=round(usage.f_blocks * usage.f_frsize / (1024**3)),
+                free=round(usage.f_bavail * usage.f_frsize / (1024**3)),
+                mount_point=partition.mountpoint
+            ))
+        return devices
+
+    def _disk_type(self, device: str) -> str:
+        block = os.path.realpath(os.path.join(SYS_CLASS_BLOCK, os.path.basename(os.path.realpath(device))))
+        if os.path.exists(f"{block}/partition"):
+            block = os.path.dirname(block)
+        disk = os.path.basename(block)
+        rotational = _read(f"{block}/queue/rotational")
+        if rotational is None:
+            return "Unknown"
+        if rotational == "1":
+            return "HDD"
+        return "NVMe SSD" if disk.startswith("nvme") else "SSD"
+
+    def _os(self) -> Tuple[str, str, str]:
+        """Sistema, distribuição e versão do kernel."""
+        release = _key_values(_read("/etc/os-release"), "=")
+        version = release.get("PRETTY_NAME") or platform.release()
+        return platform.system(), version, platform.release()
@@ -0,0 +1,108 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_TIMEOUT = 10.0  # segundos
+
+
+@dataclass
+class ProbeResults:
+    """Resultado das sondas de uma coleta."""
+    values: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)   # segundos por sonda
+    timeouts: List[str] = field(default_factory=list)          # sondas abandonadas pelo prazo
+    failures: List[str] = field(default_factory=list)          # sondas que levantaram exceção
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Valor da sonda, ou default se ela falhou ou estourou o prazo."""
+        return self.values.get(name, default)
+
+    @property
+    def complete(self) -> bool:
+        """True se todas as sondas retornaram um valor."""
+        return not self.timeouts and not self.failures
+
+    def report(self) -> str:
+        """Resumo legível, da sonda mais lenta para a mais rápida."""
+        parts = [
+            f"{name}: {seconds:.2f}s" + (" (prazo esgotado)" if name in self.timeouts else "")
+            + (" (falhou)" if name in self.failures else "")
+            for name, seconds in sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+        ]
+        return ", ".join(parts)
+
+
+def default_probe_timeout() -> float:
+    """Prazo padrão de cada sonda (pode ser alterado via SYSTEM_SPECS_PROBE_TIMEOUT)."""
+    return float(os.getenv("SYSTEM_SPECS_PROBE_TIMEOUT", DEFAULT_PROBE_TIMEOUT))
+
+
+def run_probes(probes: Dict[str, Callable[[], Any]],
+               timeouts: Optional[Dict[str, float]] = None,
+               default_timeout: Optional[float] = None) -> ProbeResults:
+    """
+    Executa sondas independentes em paralelo, cada uma com seu prazo.
+
+    Cada sonda roda em uma thread daemon: uma consulta travada (WMI, driver,
+    ponto de montagem de rede) é abandonada ao fim do prazo sem segurar a
+    coleta nem o encerramento do processo. Sondas que levantam exceção ficam
+    sem valor, como as que estouram o prazo, e são listadas em `failures`.
+
+    Args:
+        probes: Funções sem argumentos, por nome
+        timeouts: Prazos próprios, em segundos, por nome de sonda
+        default_timeout: Prazo das demais sondas (padrão: default_probe_timeout())
+
+    Returns:
+        ProbeResults com os valores obtidos, os tempos e as sondas que falharam
+        ou estouraram o prazo
+    """
+    timeouts = timeouts or {}
+    default_timeout = default_timeout if default_timeout is not None else default_probe_timeout()
+    outcomes: queue.Queue = queue.Queue()
+    start = time.perf_counter()
+
+    def probe(name: str, function: Callable[[], Any]):
+        try:
+            outcomes.put((name, True, function()))
+        except Exception as e:
+            outcomes.put((name, False, e))
+
+    deadlines = {}
+    for name, function in probes.items():
+        deadlines[name] = start + timeouts.get(name, default_timeout)
+        threading.Thread(target=probe, args=(name, function), daemon=True,
+                         name=f"probe-{name}").start()
+
+    results = ProbeResults()
+    while deadlines:
+        wait = min(deadlines.values()) - time.perf_counter()
+        try:
+            name, ok, value = outcomes.get(timeout=max(0.0, wait))
+        except queue.Empty:
+            now = time.perf_counter()
+            for name in [name for name, deadline in deadlines.items() if deadline <= now]:
+                del deadlines[name]
+                results.timings[name] = now - start
+                results.timeouts.append(name)
+                logger.warning(f"Sonda '{name}' abandonada após {now - start:.1f}s")
+            continue
+
+        if name not in deadlines:
+            continue  # já abandonada
+        del deadlines[name]
+        results.timings[name] = time.perf_counter() - start
+        if ok:
+            results.values[name] = value
+        else:
+            results.failures.append(name)
+            logger.warning(f"Sonda '{name}' falhou: {value}")
+
+    logger.debug(f"Coleta do sistema: {results.report()}")
+    return results
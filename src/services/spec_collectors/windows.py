@@ -0,0 +1,447 @@
+import psutil
+import platform
+import ctypes
+from typing import TYPE_CHECKING, Any, Callable, Optional, Dict, List
+from ctypes import c_void_p, Structure, c_uint, POINTER, sizeof
+from datetime import datetime
+import logging
+
+from src.shared.hardware import get_hardware_catalog
+from src.shared.utils import get_cpu_load_sampler
+
+from .base import SpecCollector, StorageDevice, SystemSpecs, format_cpu_arch
+from .probes import default_probe_timeout, run_probes
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    import wmi
+
+# Estruturas para DXGI
+class DXGI_ADAPTER_DESC(Structure):
+    _fields_ = [
+        ("Description", ctypes.c_wchar * 128),
+        ("VendorId", ctypes.c_uint),
+        ("DeviceId", ctypes.c_uint),
+        ("SubSysId", ctypes.c_uint),
+        ("Revision", ctypes.c_uint),
+        ("DedicatedVideoMemory", ctypes.c_size_t),
+        ("DedicatedSystemMemory", ctypes.c_size_t),
+        ("SharedSystemMemory", ctypes.c_size_t),
+        ("AdapterLuid", ctypes.c_int64)
+    ]
+
+# Classe de dispositivos de vídeo no registro
+DISPLAY_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+
+def format_driver_date(date_str: Optional[str]) -> Optional[str]:
+    """Formata a data do driver para um formato mais legível."""
+    if not date_str:
+        return None
+    try:
+        # Converte string '20250506000000.000000-000' para datetime
+        date = datetime.strptime(date_str.split('.')[0], '%Y%m%d%H%M%S')
+        return date.strftime('%d/%m/%Y')
+    except:
+        return date_str
+
+def get_gpu_memory_dxgi() -> Optional[int]:
+    """
+    Tenta obter a memória da GPU usando DXGI.
+    """
+    try:
+        from ctypes import windll
+
+        # Carrega as DLLs necessárias
+        dxgi = windll.dxgi
+        d3d11 = windll.d3d11
+
+        # Cria o device D3D
+        device = c_void_p()
+        dxgi_device = c_void_p()
+        dxgi_adapter = c_void_p()
+        adapter_desc = DXGI_ADAPTER_DESC()
+
+        # Tenta criar o device e obter o adaptador
+        if d3d11.D3D11CreateDevice(None, 0, None, 0, None, 0, 0, ctypes.byref(device), None, None) == 0:
+            device = device.value
+            device.QueryInterface(dxgi_device)
+            dxgi_device = dxgi_device.value
+            dxgi_device.GetParent(dxgi_adapter)
+            dxgi_adapter = dxgi_adapter.value
+            dxgi_adapter.GetDesc(ctypes.byref(adapter_desc))
+
+            # Converte para GB
+            memory_gb = adapter_desc.DedicatedVideoMemory / (1024**3)
+            return round(memory_gb)
+    except Exception as e:
+        logger.debug(f"Erro ao obter memória via DXGI: {e}")
+    return None
+
+def get_dedicated_gpu(w: "wmi.WMI") -> tuple[str, Optional[int], Optional[str], Dict[str, any]]:
+    """
+    Busca a GPU dedicada do sistema e suas capacidades.
+    
+    Returns:
+        Tupla com (nome_gpu, memoria_gpu, driver, detalhes_adicionais)
+
+    Raises:
+        Exception: Se a consulta WMI falhar; a sonda registra a falha em vez
+            de informar "GPU não detectada" como se não houvesse placa
+    """
+    gpus = w.Win32_VideoController()
+    try:
+        # Filtra e ordena as GPUs por memória
+        gpu_list = []
+        for gpu in gpus:
+            try:
+                name = gpu.Name
+                # Tenta obter a memória de diferentes formas
+                memory = None
+                
+                # 1. Tenta via DXGI primeiro
+                if "nvidia" in name.lower() or "amd" in name.lower():
+                    memory = get_gpu_memory_dxgi()
+                    logger.debug(f"DXGI Memory for {name}: {memory}GB")
+
+                # 2. Tenta AdapterRAM
+                if not memory:
+                    try:
+                        memory = int(gpu.AdapterRAM)
+                        logger.debug(f"AdapterRAM for {name}: {memory} bytes")
+                    except Exception as e:
+                        logger.debug(f"Erro AdapterRAM for {name}: {e}")
+
+                # 3. Tenta VideoMemoryType
+                if not memory:
+                    try:
+                        memory = int(gpu.VideoMemory)
+                        logger.debug(f"VideoMemory for {name}: {memory} bytes")
+                    except Exception as e:
+                        logger.debug(f"Erro VideoMemory for {name}: {e}")
+                        
+                # 4. Se não conseguiu ou o valor é inválido, usa o catálogo de hardware
+                model = get_hardware_catalog().match_gpu(name)
+                if (not memory or memory < 0) and model and model.vram_gb:
+                    logger.debug(f"Detectando memória pelo modelo: {model.name}")
+                    memory = int(model.vram_gb * 1024**3)
+
+                logger.debug(f"Memória final para {name}: {memory/(1024**3) if memory else 'N/A'}GB")
+                
+                driver = gpu.DriverVersion
+                driver_date = format_driver_date(gpu.DriverDate)
+                
+                # Coleta informações adicionais
+                details = {
+                    'memory_type': None,
+                    'driver_date': driver_date,
+                    'resolution': f"{gpu.CurrentHorizontalResolution}x{gpu.CurrentVerticalResolution}" if gpu.CurrentHorizontalResolution else None,
+                    'refresh_rate': gpu.CurrentRefreshRate,
+                    'architecture': None,
+                    'tech_support': {
+                        'dlss': False,
+                        'ray_tracing': False,
+                        'dx12_ultimate': False,
+                        'fsr': False
+                    }
+                }
+                
+                # Tipo de memória, arquitetura e tecnologias suportadas vêm do catálogo
+                if model:
+                    details['memory_type'] = model.memory_type
+                    details['architecture'] = model.architecture
+                    details['tech_support'] = model.tech_support
+                
+                gpu_list.append((name, memory, driver, details))
+            except Exception as e:
+                logger.warning(f"Erro ao coletar detalhes da GPU '{name}': {e}")
+                continue
+        
+        # Ordena por quantidade de memória
+        gpu_list.sort(key=lambda x: x[1] if x[1] else 0, reverse=True)
+        
+        # Procura primeiro por NVIDIA ou AMD
+        for name, memory, driver, details in gpu_list:
+            if "nvidia" in name.lower() or "amd" in name.lower() or "radeon" in name.lower():
+                return (
+                    name,
+                    round(memory / (1024**3)) if memory else None,
+                    driver,
+                    details
+                )
+        
+        # Se não encontrou, retorna a primeira da lista
+        if gpu_list:
+            name, memory, driver, details = gpu_list[0]
+            return (
+                name,
+                round(memory / (1024**3)) if memory else None,
+                driver,
+                details
+            )
+            
+    except Exception as e:
+        logger.warning(f"Erro ao detectar GPU: {e}")
+    
+    return "GPU não detectada", None, None, {}
+
+def get_storage_devices(w: "wmi.WMI") -> List[StorageDevice]:
+    """
+    Obtém informações de todos os dispositivos de armazenamento.
+    
+    Returns:
+        Lista de StorageDevice
+    """
+    devices = []
+    
+    # Mapeia os discos físicos
+    physical_disks = {}
+    for disk in w.Win32_DiskDrive():
+        try:
+            model = disk.Model.lower()
+            if "nvme" in model:
+                disk_type = "NVMe SSD"
+            elif "ssd" in model:
+                disk_type = "SSD"
+            else:
+                disk_type = "HDD"
+            physical_disks[disk.DeviceID] = disk_type
+        except:
+            continue
+
+    # Obtém as partições montadas
+    partitions = psutil.disk_partitions()
+    for partition in partitions:
+        try:
+            if partition.device and partition.mountpoint:
+                # Encontra o tipo do disco físico correspondente
+                disk_type = "Unknown"
+                for physical_id, physical_type in physical_disks.items():
+                    if partition.device.replace('\\', '').startswith(physical_id.replace('\\', '')):
+                        disk_type = physical_type
+                        break
+
+                usage = psutil.disk_usage(partition.mountpoint)
+                devices.append(StorageDevice(
+                    name=partition.device,
+                    type=disk_type,
+                    total=round(usage.total / (1024**3)),
+                    free=round(usage.free / (1024**3)),
+                    mount_point=partition.mountpoint
+                ))
+        except:
+            continue
+            
+    return devices
+
+def get_cpu_stats() -> tuple[float, float, Optional[float]]:
+    """
+    Obtém estatísticas da CPU.
+    
+    Returns:
+        Tupla com (freq_base, freq_max, temperatura)
+    """
+    # Frequências (converte MHz para GHz)
+    freq = psutil.cpu_freq()
+    freq_base = round(freq.current / 1000, 2) if freq else 0
+    freq_max = round((freq.max or freq.current) / 1000, 2) if freq else freq_base
+    
+    return freq_base, freq_max, get_cpu_temperature()
+
+def get_cpu_temperature() -> Optional[float]:
+    """Temperatura da CPU pelos sensores do psutil (tenta diferentes métodos)."""
+    try:
+        temps = psutil.sensors_temperatures()
+        if 'coretemp' in temps:
+            return temps['coretemp'][0].current
+        elif 'k10temp' in temps:
+            return temps['k10temp'][0].current
+    except:
+        pass
+    return None
+
+def get_display_adapters() -> List[List[Optional[str]]]:
+    """
+    Placas de vídeo instaladas e versões de driver, lidas do registro.
+
+    Bem mais rápido que consultar Win32_VideoController; usado apenas para
+    identificar o hardware.
+    """
+    import winreg
+
+    adapters = []
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, DISPLAY_CLASS_KEY) as key:
+            index = 0
+            while True:
+                try:
+                    subkey_name = winreg.EnumKey(key, index)
+                except OSError:
+                    break
+                index += 1
+                try:
+                    with winreg.OpenKey(key, subkey_name) as subkey:
+                        adapters.append([
+                            winreg.QueryValueEx(subkey, "DriverDesc")[0],
+                            winreg.QueryValueEx(subkey, "DriverVersion")[0]
+                        ])
+                except OSError:
+                    continue  # "Properties" e entradas sem driver
+    except OSError:
+        pass
+    return sorted(adapters)
+
+def get_memory_modules(w: "wmi.WMI") -> tuple[Optional[int], Optional[int]]:
+    """
+    Obtém velocidade e tipo do primeiro módulo de memória.
+
+    Returns:
+        Tupla com (velocidade, tipo), ou (None, None) se indisponível
+    """
+    try:
+        ram_info = w.Win32_PhysicalMemory()[0]
+        return ram_info.Speed, ram_info.MemoryType
+    except:
+        return None, None
+
+def get_directx_version() -> Optional[str]:
+    """Versão do DirectX registrada no sistema."""
+    try:
+        import winreg
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\DirectX") as key:
+            return winreg.QueryValueEx(key, "Version")[0]
+    except:
+        return None
+
+def wmi_probe(function: Callable[["wmi.WMI"], Any]) -> Callable[[], Any]:
+    """
+    Adapta uma consulta WMI para rodar em uma thread de sonda.
+
+    O COM precisa ser inicializado em cada thread, e os objetos WMI não
+    podem ser compartilhados entre threads; cada sonda abre sua conexão.
+    """
+    def probe():
+        import pythoncom
+        import wmi
+
+        pythoncom.CoInitialize()
+        try:
+            return function(wmi.WMI())
+        finally:
+            pythoncom.CoUninitialize()
+    return probe
+
+class WindowsSpecCollector(SpecCollector):
+    """Coleta via WMI, DXGI e registro do Windows."""
+
+    name = "windows"
+
+    def fingerprint(self) -> Dict[str, Any]:
+        """Identificação do sistema mais as placas de vídeo e drivers do registro."""
+        fingerprint = super().fingerprint()
+        fingerprint['gpus'] = get_display_adapters()
+        return fingerprint
+
+    def cpu_temperature(self) -> Optional[float]:
+        return get_cpu_temperature()
+
+    def collect(self) -> SystemSpecs:
+        """
+        Coleta especificações detalhadas do sistema.
+
+        As consultas WMI, DXGI e de registro rodam em paralelo, cada uma com
+        prazo próprio (a GPU, que tenta DXGI por adaptador, tem o dobro); uma
+        consulta travada não segura as demais. Seções que falham ou estouram
+        o prazo ficam com valores padrão e são listadas em probe_failures ou
+        probe_timeouts.
+        
+        Returns:
+            SystemSpecs com todas as informações coletadas
+        """
+        try:
+            probes = run_probes(
+                {
+                    'cpu': wmi_probe(lambda w: w.Win32_Processor()[0].Name),
+                    'cpu_stats': get_cpu_stats,
+                    'ram': wmi_probe(get_memory_modules),
+                    'gpu': wmi_probe(get_dedicated_gpu),
+                    'storage': wmi_probe(get_storage_devices),
+                    'directx': get_directx_version,
+                },
+                timeouts={'gpu': 2 * default_probe_timeout()}
+            )
+
+            # CPU
+            cpu_name = probes.get('cpu') or platform.processor() or "CPU não detectada"
+            cpu_cores = psutil.cpu_count(logical=False)
+            cpu_threads = psutil.cpu_count(logical=True)
+            cpu_freq_base, cpu_freq_max, cpu_temp = probes.get('cpu_stats', (0, 0, None))
+            cpu_arch = format_cpu_arch(platform.machine())
+            cpu_load = get_cpu_load_sampler().current()
+        
+            # RAM
+            ram = psutil.virtual_memory()
+            ram_total = round(ram.total / (1024**3))
+            ram_free = round(ram.available / (1024**3))
+            ram_used = round(ram.used / (1024**3))
+            ram_speed, ram_type = probes.get('ram', (None, None))
+        
+            # GPU
+            gpu_name, gpu_memory, gpu_driver, gpu_details = probes.get(
+                'gpu', ("GPU não detectada", None, None, {})
+            )
+            logger.debug(f"GPU Final: {gpu_name}")
+            logger.debug(f"Memória Final: {gpu_memory}GB")
+            logger.debug(f"Detalhes: {gpu_details}")
+        
+            # Storage
+            storage_devices = probes.get('storage', [])
+        
+            # Sistema
+            os_info = platform.uname()
+            os_name = os_info.system
+            os_version = os_info.release
+            os_build = os_info.version
+        
+            # DirectX
+            directx_version = probes.get('directx')
+        
+            return SystemSpecs(
+                # Campos obrigatórios
+                cpu_name=cpu_name,
+                cpu_cores=cpu_cores,
+                cpu_threads=cpu_threads,
+                cpu_freq_base=cpu_freq_base,
+                cpu_freq_max=cpu_freq_max,
+                ram_total=ram_total,
+                ram_free=ram_free,
+                ram_used=ram_used,
+                gpu_name=gpu_name,
+                storage_devices=storage_devices,
+                os_name=os_name,
+                os_version=os_version,
+        
+                # Campos opcionais
+                cpu_temp=cpu_temp,
+                cpu_load=cpu_load,
+                cpu_architecture=cpu_arch,
+                ram_speed=ram_speed,
+                ram_type=ram_type,
+                gpu_memory_total=gpu_memory,
+                gpu_memory_type=gpu_details.get('memory_type'),
+                gpu_driver=gpu_driver,
+                gpu_driver_date=gpu_details.get('driver_date'),
+                gpu_resolution=gpu_details.get('resolution'),
+                gpu_refresh_rate=gpu_details.get('refresh_rate'),
+                gpu_architecture=gpu_details.get('architecture'),
+                gpu_tech_support=gpu_details.get('tech_support'),
+                os_build=os_build,
+                directx_version=directx_version,
+                probe_timings=probes.timings,
+                probe_timeouts=probes.timeouts,
+                probe_failures=probes.failures
+            )
+        
+        except Exception as e:
+            print(f"Erro ao coletar especificações: {str(e)}")
+            raise
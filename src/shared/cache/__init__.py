@@ -0,0 +1,8 @@
+from .disk_cache import DiskCache, default_cache_dir
+from .requirements_cache import RequirementsCache
+
+__all__ = [
+    'DiskCache',
+    'default_cache_dir',
+    'RequirementsCache'
+]
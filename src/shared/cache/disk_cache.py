@@ -0,0 +1,143 @@
+from typing import Any, Optional, Tuple
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "game-spec-analyzer")
+
+
+def default_cache_dir() -> str:
+    """Diretório base dos caches (pode ser alterado via GAME_SPEC_CACHE_DIR)."""
+    return os.getenv("GAME_SPEC_CACHE_DIR") or DEFAULT_CACHE_DIR
+
+
+class DiskCache:
+    """
+    Cache chave/valor persistido em SQLite, com TTL por entrada e despejo LRU.
+
+    Os valores são serializados como JSON. Entradas expiradas continuam no
+    disco até serem despejadas, para permitir o modo stale-while-revalidate.
+    """
+
+    def __init__(self, namespace: str, cache_dir: Optional[str] = None,
+                 max_entries: int = 1000, max_bytes: Optional[int] = None):
+        """
+        Inicializa o cache.
+
+        Args:
+            namespace: Nome do arquivo de cache dentro do diretório base
+            cache_dir: Diretório base (padrão: default_cache_dir())
+            max_entries: Número máximo de entradas antes do despejo LRU
+            max_bytes: Tamanho máximo somado dos valores (opcional)
+        """
+        cache_dir = cache_dir or default_cache_dir()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, f"{namespace}.sqlite3")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " expires_at REAL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON entries(last_access)")
+
+    def close(self):
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conn.close()
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, bool]]:
+        """
+        Busca uma entrada, mesmo que expirada.
+
+        Args:
+            key: Chave da entrada
+
+        Returns:
+            Tupla (valor, expirado) ou None se não existir
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+
+        value, expires_at = row
+        expired = expires_at is not None and expires_at <= now
+        return json.loads(value), expired
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retorna o valor se existir e não estiver expirado."""
+        entry = self.get_entry(key)
+        if entry is None or entry[1]:
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Grava uma entrada.
+
+        Args:
+            key: Chave da entrada
+            value: Valor serializável em JSON
+            ttl: Tempo de vida em segundos (None = não expira)
+        """
+        now = time.time()
+        data = json.dumps(value, ensure_ascii=False)
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, data, len(data), now, expires_at, now)
+            )
+            self._evict()
+
+    def delete(self, key: str):
+        """Remove uma entrada."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        """Remove todas as entradas."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def _evict(self):
+        """Despeja as entradas menos usadas até respeitar os limites."""
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+
+        excess = max(0, count - self.max_entries)
+        if excess:
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                " SELECT key FROM entries ORDER BY last_access ASC LIMIT ?)",
+                (excess,)
+            )
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+        if self.max_bytes is None:
+            return
+        while total > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access ASC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (row[0],))
+            total -= row[1]
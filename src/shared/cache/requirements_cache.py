@@ -0,0 +1,163 @@
+from dataclasses import asdict
+from typing import Callable, Optional, Set, Tuple
+import logging
+import os
+import threading
+
+from src.shared.scraping import GameRequirements, normalize_game_name
+from .disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 7 * 24 * 3600  # 7 dias
+DEFAULT_MAX_ENTRIES = 2000
+
+
+class RequirementsCache:
+    """
+    Cache em disco de GameRequirements.
+
+    Os requisitos são gravados pelo appid da Steam (`app:<id>`), e o nome
+    normalizado do jogo (`name:<nome>`) aponta para o appid. Assim, buscas
+    diferentes que levam ao mesmo jogo compartilham a mesma entrada.
+    """
+
+    def __init__(self, cache: Optional[DiskCache] = None, ttl: Optional[float] = None,
+                 stale_while_revalidate: Optional[bool] = None):
+        """
+        Inicializa o cache.
+
+        Args:
+            cache: DiskCache de armazenamento (padrão: namespace "requirements")
+            ttl: Tempo de vida das entradas em segundos (padrão: REQUIREMENTS_CACHE_TTL)
+            stale_while_revalidate: Se True, entradas expiradas são retornadas na
+                hora enquanto uma atualização roda em segundo plano
+        """
+        self.cache = cache or DiskCache(
+            "requirements",
+            max_entries=int(os.getenv("REQUIREMENTS_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        )
+        self.ttl = ttl if ttl is not None else float(os.getenv("REQUIREMENTS_CACHE_TTL", DEFAULT_TTL))
+        if stale_while_revalidate is None:
+            stale_while_revalidate = os.getenv("REQUIREMENTS_CACHE_SWR", "1") != "0"
+        self.stale_while_revalidate = stale_while_revalidate
+        self._refreshing: Set[str] = set()
+        self._refresh_lock = threading.Lock()
+
+    def lookup(self, game_name: str) -> Optional[Tuple[GameRequirements, bool]]:
+        """
+        Busca os requisitos de um jogo pelo nome.
+
+        Args:
+            game_name: Nome do jogo como digitado pelo usuário
+
+        Returns:
+            Tupla (requisitos, expirado) ou None se não estiver em cache (ou se
+            a entrada foi gravada com um formato antigo de GameRequirements)
+        """
+        alias = self.cache.get_entry(self._name_key(game_name))
+        if alias is None:
+            return None
+
+        alias_value, alias_expired = alias
+        if "app_id" not in alias_value:
+            return self._requirements(alias_value, alias_expired)
+
+        entry = self.cache.get_entry(self._app_key(alias_value["app_id"]))
+        if entry is None:
+            return None
+        return self._requirements(*entry)
+
+    @staticmethod
+    def _requirements(value: dict, expired: bool) -> Optional[Tuple[GameRequirements, bool]]:
+        try:
+            return GameRequirements(**value), expired
+        except TypeError as e:
+            # Campos renomeados ou removidos: a entrada é refeita como se não existisse
+            logger.debug(f"Requisitos em cache com formato antigo, ignorados: {str(e)}")
+            return None
+
+    def store(self, game_name: str, requirements: GameRequirements, ttl: Optional[float] = None):
+        """
+        Grava os requisitos de um jogo.
+
+        Args:
+            game_name: Nome do jogo usado na busca
+            requirements: Requisitos obtidos
+            ttl: Tempo de vida em segundos (padrão: self.ttl)
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        if requirements.app_id is None:
+            self.cache.set(self._name_key(game_name), asdict(requirements), ttl=ttl)
+            return
+
+        self.cache.set(self._app_key(requirements.app_id), asdict(requirements), ttl=ttl)
+        self.cache.set(self._name_key(game_name), {"app_id": requirements.app_id})
+        if requirements.title:
+            self.cache.set(self._name_key(requirements.title), {"app_id": requirements.app_id})
+
+    def get_or_fetch(self, game_name: str,
+                     fetch: Callable[[str], Optional[GameRequirements]]) -> Optional[GameRequirements]:
+        """
+        Retorna os requisitos do cache ou busca com `fetch` e grava o resultado.
+
+        Args:
+            game_name: Nome do jogo
+            fetch: Função que busca os requisitos quando não há entrada válida
+
+        Returns:
+            GameRequirements se encontrado, None caso contrário
+        """
+        cached = self.lookup(game_name)
+        if cached is not None:
+            requirements, expired = cached
+            if not expired:
+                logger.info(f"Requisitos em cache para: {game_name}")
+                return requirements
+            if self.stale_while_revalidate:
+                logger.info(f"Requisitos expirados em cache, atualizando em segundo plano: {game_name}")
+                self._refresh_in_background(game_name, fetch)
+                return requirements
+
+        requirements = self._fetch_and_store(game_name, fetch)
+        if requirements is None and cached is not None:
+            # Melhor um resultado antigo do que nenhum
+            return cached[0]
+        return requirements
+
+    def _fetch_and_store(self, game_name: str,
+                         fetch: Callable[[str], Optional[GameRequirements]]) -> Optional[GameRequirements]:
+        requirements = fetch(game_name)
+        if requirements is not None:
+            self.store(game_name, requirements)
+        return requirements
+
+    def _refresh_in_background(self, game_name: str,
+                               fetch: Callable[[str], Optional[GameRequirements]]):
+        key = normalize_game_name(game_name)
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._fetch_and_store(game_name, fetch)
+            except Exception as e:
+                logger.warning(f"Falha ao atualizar requisitos em segundo plano: {str(e)}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        # Thread daemon: uma execução única do CLI não espera a busca na Steam
+        # para encerrar; se ela não terminar a tempo, a entrada continua
+        # expirada e a próxima execução tenta de novo
+        threading.Thread(target=refresh, name=f"refresh-{key}", daemon=True).start()
+
+    @staticmethod
+    def _name_key(game_name: str) -> str:
+        return f"name:{normalize_game_name(game_name)}"
+
+    @staticmethod
+    def _app_key(app_id: int) -> str:
+        return f"app:{app_id}"
@@ -0,0 +1,9 @@
+from .hardware_catalog import (
+    HardwareCatalog, HardwareModel, detect_vendor, expand_variants, get_hardware_catalog, memory_size_gb,
+    tokenize_model_name
+)
+
+__all__ = [
+    'HardwareCatalog', 'HardwareModel', 'detect_vendor', 'expand_variants', 'get_hardware_catalog',
+    'memory_size_gb', 'tokenize_model_name'
+]
@@ -0,0 +1,446 @@
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import glob
+import hashlib
+import json
+import logging
+import math
+import os
+import pickle
+import re
+import unicodedata
+
+from src.shared.cache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(__file__), "data", "hardware_catalog.json")
+CATALOG_FORMAT_VERSIONS = (1, 2)   # 2 acrescenta "vendor" e "variants"
+INDEX_FORMAT_VERSION = 2           # índice compilado (pickle); 2 acrescenta as variantes de memória
+MIN_MATCH_SCORE = 0.6
+
+# Recursos de GPU, na ordem dos bits de `features` (mesmas chaves de SystemSpecs.gpu_tech_support)
+FEATURES = ('dlss', 'ray_tracing', 'dx12_ultimate', 'fsr')
+
+# Palavras que não identificam o modelo: fabricante, marca e termos genéricos
+_NOISE_TOKENS = {
+    'nvidia', 'geforce', 'amd', 'ati', 'radeon', 'intel', 'core', 'tm', 'r', 'c',
+    'graphics', 'gpu', 'cpu', 'processor', 'processador', 'series', 'with', 'de', 'e',
+    'gen', 'th', 'nd', 'rd', 'st', 'quad', 'duo', 'card', 'video', 'placa', 'design',
+}
+# Marcadores de versão para notebook; não fazem parte da chave do modelo
+_MOBILE_TOKENS = {'laptop', 'mobile', 'notebook', 'maxq', 'max', 'q'}
+# Tamanhos, frequências e afins ("4gb", "3.40ghz", "64bit")
+# Tamanho da memória de vídeo no nome ("GTX 1060 3GB", "RTX 4060 Ti 16 GB")
+_MEMORY_SIZE = re.compile(r"(?<![\d.])(\d{1,2}(?:\.\d)?)\s*(?:gb|gib|go)\b")
+_UNIT_TOKEN = re.compile(r"^\d+(?:gb|mb|tb|ghz|mhz|bit|w)$")
+# Sufixos colados ao número ("6700xt" -> "6700 xt")
+_GLUED_SUFFIX = re.compile(r"^(\d{3,4})(ti|xtx|xt|gre|super)$")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# Palavras que identificam o fabricante ("gtx 970" é NVIDIA, "rx 580" é AMD)
+_VENDOR_TOKENS = {
+    'nvidia': 'nvidia', 'geforce': 'nvidia', 'quadro': 'nvidia', 'gtx': 'nvidia', 'rtx': 'nvidia',
+    'gt': 'nvidia', 'mx': 'nvidia',
+    'amd': 'amd', 'ati': 'amd', 'radeon': 'amd', 'rx': 'amd', 'firepro': 'amd', 'ryzen': 'amd',
+    'athlon': 'amd', 'phenom': 'amd', 'fx': 'amd',
+    'intel': 'intel', 'arc': 'intel', 'iris': 'intel', 'uhd': 'intel', 'xeon': 'intel',
+    'pentium': 'intel', 'celeron': 'intel',
+}
+# Prefixos de modelo colados ao número ("mx450", "rx6600")
+_VENDOR_PREFIX = re.compile(r"^(mx|rx)\d")
+
+# Exceções: "core 2 duo" e "core 2 quad" precisam das palavras que em geral são ruído
+_KEPT_PHRASES = (("core 2 duo", "core2duo"), ("core 2 quad", "core2quad"))
+
+
+def _fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c))
+    folded = folded.replace("®", " ").replace("™", " ").replace("(tm)", " ").replace("(r)", " ")
+    # Descarta a frequência no fim do nome ("@ 3.40GHz")
+    return folded.split("@", 1)[0]
+
+
+def tokenize_model_name(text: str) -> Tuple[Tuple[str, ...], bool]:
+    """
+    Converte um nome de hardware em tokens comparáveis.
+
+    Args:
+        text: Nome como aparece no sistema ou na Steam
+
+    Returns:
+        Tupla (tokens do modelo, indica versão para notebook)
+    """
+    folded = _MEMORY_SIZE.sub(" ", _fold(text))   # a memória é tratada à parte (memory_size_gb)
+    for phrase, token in _KEPT_PHRASES:
+        folded = folded.replace(phrase, token)
+
+    tokens: List[str] = []
+    mobile = False
+    for token in _NON_ALNUM.split(folded):
+        if not token or token in _NOISE_TOKENS or _UNIT_TOKEN.match(token):
+            continue
+        if token in _MOBILE_TOKENS:
+            mobile = True
+            continue
+        glued = _GLUED_SUFFIX.match(token)
+        if glued:
+            tokens.extend(glued.groups())
+        else:
+            tokens.append(token)
+    return tuple(tokens), mobile
+
+
+def memory_size_gb(text: str) -> Optional[float]:
+    """Memória indicada no nome ("RTX 3080 12GB" -> 12.0), ou None."""
+    match = _MEMORY_SIZE.search(_fold(text))
+    return float(match.group(1)) if match else None
+
+
+def detect_vendor(text: str) -> Optional[str]:
+    """
+    Fabricante indicado no nome ('nvidia', 'amd' ou 'intel'), pela primeira
+    palavra que o identifica, ou None.
+    """
+    for token in _NON_ALNUM.split(_fold(text)):
+        vendor = _VENDOR_TOKENS.get(token)
+        if vendor is None:
+            prefix = _VENDOR_PREFIX.match(token)
+            vendor = prefix and _VENDOR_TOKENS[prefix.group(1)]
+        if vendor:
+            return vendor
+    return None
+
+
+def _is_model_number(token: str) -> bool:
+    """Tokens com dois ou mais dígitos identificam o modelo ("970", "3570k", "i7" não)."""
+    return sum(c.isdigit() for c in token) >= 2
+
+
+@dataclass(frozen=True)
+class HardwareModel:
+    """Modelo de CPU ou GPU do catálogo."""
+    kind: str                        # "cpu" ou "gpu"
+    name: str
+    score: float                     # índice de desempenho relativo (maior é melhor)
+    architecture: Optional[str] = None
+    year: Optional[int] = None
+    mobile: bool = False
+    cores: Optional[int] = None      # apenas CPU
+    threads: Optional[int] = None    # apenas CPU
+    vram_gb: Optional[float] = None  # apenas GPU
+    memory_type: Optional[str] = None
+    features: Tuple[str, ...] = ()   # apenas GPU, valores de FEATURES
+    vendor: Optional[str] = None     # 'nvidia', 'amd' ou 'intel'
+
+    @property
+    def tech_support(self) -> Dict[str, bool]:
+        """Recursos no formato de SystemSpecs.gpu_tech_support."""
+        return {feature: feature in self.features for feature in FEATURES}
+
+
+def expand_variants(entries: Iterable[dict]) -> Iterator[dict]:
+    """
+    Expande as variantes declaradas em cada entrada do catálogo.
+
+    Uma variante (ex: a versão para notebook ou com outra quantidade de
+    memória) herda os campos da entrada base e sobrescreve os que declara; o
+    nome é o da base mais "suffix" ou o "name" informado:
+
+        {"name": "NVIDIA GeForce RTX 4070", "score": 115, ...,
+         "variants": [{"suffix": "Laptop GPU", "mobile": true, "score": 80, "vram_gb": 8},
+                      {"suffix": "10GB", "score": 105, "vram_gb": 10}]}
+    """
+    for entry in entries:
+        variants = entry.get("variants", ())
+        base = {key: value for key, value in entry.items() if key != "variants"}
+        yield base
+        for variant in variants:
+            expanded = dict(base)
+            expanded.update((key, value) for key, value in variant.items() if key != "suffix")
+            if "name" not in variant:
+                expanded["name"] = f"{base['name']} {variant['suffix']}"
+            yield expanded
+
+
+class _ModelTable:
+    """
+    Modelos de uma categoria em arrays paralelos, com índice exato pela
+    chave de tokens, índice das variantes de memória, índice por fabricante
+    e número do modelo e índice invertido de tokens para a busca aproximada.
+    """
+
+    def __init__(self, kind: str, entries: Iterable[dict]):
+        self.kind = kind
+        self.names: List[str] = []
+        self.keys: List[Tuple[str, ...]] = []
+        self.scores = array('f')
+        self.years = array('H')
+        self.mobile = array('B')
+        self.cores = array('B')
+        self.threads = array('B')
+        self.vram = array('f')             # 0 = desconhecida
+        self.features = array('B')         # bits na ordem de FEATURES
+        self.architectures = array('H')    # índice em self._strings
+        self.memory_types = array('H')
+        self.vendors = array('H')
+        self._strings: List[Optional[str]] = [None]
+        self._string_ids: Dict[Optional[str], int] = {None: 0}
+        self._exact: Dict[Tuple[Tuple[str, ...], bool], int] = {}
+        # (chave, notebook, memória em GB) -> posição; "3GB" não entra na chave de tokens
+        self._by_memory: Dict[Tuple[Tuple[str, ...], bool, float], int] = {}
+        # (fabricante ou None, número do modelo) -> posições; None reúne todos os fabricantes
+        self._by_number: Dict[Tuple[Optional[str], str], array] = defaultdict(lambda: array('I'))
+        self._token_index: Dict[str, array] = defaultdict(lambda: array('I'))
+
+        for entry in expand_variants(entries):
+            position = len(self.names)
+            key, _ = tokenize_model_name(entry["name"])
+            mobile = bool(entry.get("mobile"))
+            vendor = entry.get("vendor") or detect_vendor(entry["name"])
+            self.names.append(entry["name"])
+            self.keys.append(key)
+            self.scores.append(float(entry["score"]))
+            self.years.append(int(entry.get("year") or 0))
+            self.mobile.append(mobile)
+            self.cores.append(int(entry.get("cores") or 0))
+            self.threads.append(int(entry.get("threads") or 0))
+            self.vram.append(float(entry.get("vram_gb") or 0))
+            self.features.append(sum(1 << bit for bit, name in enumerate(FEATURES)
+                                     if name in entry.get("features", ())))
+            self.architectures.append(self._intern(entry.get("architecture")))
+            self.memory_types.append(self._intern(entry.get("memory_type")))
+            self.vendors.append(self._intern(vendor))
+            self._exact.setdefault((key, mobile), position)
+            if entry.get("vram_gb"):
+                self._by_memory.setdefault((key, mobile, float(entry["vram_gb"])), position)
+            for token in set(key):
+                self._token_index[token].append(position)
+                if _is_model_number(token):
+                    self._by_number[(vendor, token)].append(position)
+                    if vendor is not None:
+                        self._by_number[(None, token)].append(position)
+
+        self._by_number = dict(self._by_number)
+        self._token_index = dict(self._token_index)
+        total = len(self.names) + 1
+        self._weights = {
+            token: math.log(total / (len(positions) + 1)) + 1.0
+            for token, positions in self._token_index.items()
+        }
+
+    def _intern(self, value: Optional[str]) -> int:
+        if value not in self._string_ids:
+            self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return self._string_ids[value]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def model(self, position: int) -> HardwareModel:
+        """Materializa a posição como HardwareModel."""
+        features = self.features[position]
+        return HardwareModel(
+            kind=self.kind,
+            name=self.names[position],
+            score=round(self.scores[position], 2),
+            architecture=self._strings[self.architectures[position]],
+            year=self.years[position] or None,
+            mobile=bool(self.mobile[position]),
+            cores=self.cores[position] or None,
+            threads=self.threads[position] or None,
+            vram_gb=self.vram[position] or None,
+            memory_type=self._strings[self.memory_types[position]],
+            features=tuple(name for bit, name in enumerate(FEATURES) if features & (1 << bit)),
+            vendor=self._strings[self.vendors[position]]
+        )
+
+    def find(self, tokens: Tuple[str, ...], mobile: bool, vendor: Optional[str] = None,
+             memory_gb: Optional[float] = None) -> Optional[int]:
+        """
+        Posição do modelo correspondente aos tokens, ou None.
+
+        A chave exata resolve em um acesso a dicionário; se não bater, os
+        candidatos vêm do índice (fabricante, número do modelo), que tem
+        poucas entradas por chave independentemente do tamanho do catálogo.
+        Com `memory_gb`, a variante do modelo com essa memória é preferida.
+        """
+        position = self._exact.get((tokens, mobile))
+        if position is None:
+            position = self._exact.get((tokens, not mobile))
+        if position is None:
+            position = self._fuzzy(tokens, mobile, vendor)
+        if position is not None and memory_gb is not None:
+            key = (self.keys[position], bool(self.mobile[position]), memory_gb)
+            position = self._by_memory.get(key, position)
+        return position
+
+    def _candidates(self, query: set, vendor: Optional[str]) -> set:
+        numbers = [token for token in query if _is_model_number(token)]
+        candidates = set()
+        for token in numbers:
+            candidates.update(self._by_number.get((vendor, token)) or self._by_number.get((None, token), ()))
+        if numbers:
+            return candidates
+        # Sem número de modelo ("Iris Xe", "Radeon VII"): índice invertido de tokens
+        for token in query:
+            candidates.update(self._token_index.get(token, ()))
+        return candidates
+
+    def _fuzzy(self, tokens: Tuple[str, ...], mobile: bool, vendor: Optional[str]) -> Optional[int]:
+        query = set(tokens)
+        candidates = self._candidates(query, vendor)
+
+        best, best_score = None, 0.0
+        for position in candidates:
+            key = set(self.keys[position])
+            # O número do modelo do catálogo precisa aparecer na consulta
+            if any(_is_model_number(token) and token not in query for token in key):
+                continue
+            shared = sum(self._weights[token] for token in key & query)
+            missing = sum(self._weights[token] for token in key - query)
+            extra = sum(self._weights.get(token, 1.0) for token in query - key)
+            score = shared / (shared + missing + 0.5 * extra)
+            if self.mobile[position] == mobile:
+                score += 0.01
+            if score > best_score:
+                best, best_score = position, score
+        return best if best_score >= MIN_MATCH_SCORE else None
+
+
+class HardwareCatalog:
+    """
+    Catálogo de CPUs e GPUs com índices de desempenho, VRAM, arquitetura e
+    recursos, usado para comparar o hardware do sistema com os requisitos.
+
+    Os nomes podem vir de SystemSpecs ("13th Gen Intel(R) Core(TM) i7-13620H")
+    ou dos requisitos da Steam ("GeForce GTX 970 4GB"); a chave de tokens
+    ignora fabricante, marca e tamanhos de memória.
+    """
+
+    def __init__(self, cpus: Iterable[dict], gpus: Iterable[dict]):
+        """
+        Inicializa o catálogo.
+
+        Args:
+            cpus: Entradas de CPU no formato do arquivo JSON
+            gpus: Entradas de GPU no formato do arquivo JSON
+        """
+        self.cpus = _ModelTable("cpu", cpus)
+        self.gpus = _ModelTable("gpu", gpus)
+        self._matches: Dict[Tuple[str, str], Optional[HardwareModel]] = {}
+
+    def __len__(self) -> int:
+        return len(self.cpus) + len(self.gpus)
+
+    @classmethod
+    def from_json(cls, path: str) -> "HardwareCatalog":
+        """
+        Cria o catálogo a partir do arquivo JSON, montando os índices.
+
+        Args:
+            path: Caminho do arquivo
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") not in CATALOG_FORMAT_VERSIONS:
+            raise ValueError(f"Versão de catálogo incompatível: {data.get('version')}")
+        return cls(data.get("cpus", []), data.get("gpus", []))
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "HardwareCatalog":
+        """
+        Carrega o catálogo, reaproveitando o índice compilado quando existir.
+
+        O índice montado a partir do JSON é salvo no diretório de cache,
+        identificado pelo caminho, tamanho e data do arquivo e pela versão
+        do formato do índice; editar o catálogo ou mudar a estrutura das
+        classes gera um novo índice na próxima carga. Um índice ilegível é
+        descartado e remontado a partir do JSON.
+
+        Args:
+            path: Caminho do arquivo (padrão: HARDWARE_CATALOG ou o catálogo embutido)
+        """
+        path = path or os.getenv("HARDWARE_CATALOG") or DEFAULT_CATALOG_PATH
+        index_path = _index_path(path)
+        if index_path is None:
+            return cls.from_json(path)   # arquivo inacessível: from_json informa o erro
+        try:
+            with open(index_path, "rb") as f:
+                version, catalog = pickle.load(f)
+            if version == INDEX_FORMAT_VERSION and isinstance(catalog, cls):
+                return catalog
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # Índice corrompido ou de outra versão do código (classes renomeadas, etc.)
+            logger.debug(f"Índice do catálogo descartado: {e}")
+
+        catalog = cls.from_json(path)
+        catalog._save_index(index_path)
+        return catalog
+
+    def _save_index(self, index_path: str):
+        """Salva o catálogo indexado, removendo índices de versões anteriores do arquivo."""
+        self._matches.clear()
+        prefix = index_path.rsplit(".", 2)[0]
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            for stale in glob.glob(f"{glob.escape(prefix)}.*.pickle"):
+                os.remove(stale)
+            temporary = f"{index_path}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as f:
+                pickle.dump((INDEX_FORMAT_VERSION, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, index_path)
+        except OSError as e:
+            logger.debug(f"Índice do catálogo não salvo: {e}")
+
+    def match_cpu(self, name: str) -> Optional[HardwareModel]:
+        """Resolve o nome de um processador para o modelo do catálogo."""
+        return self._match(self.cpus, name)
+
+    def match_gpu(self, name: str) -> Optional[HardwareModel]:
+        """Resolve o nome de uma placa de vídeo para o modelo do catálogo."""
+        return self._match(self.gpus, name)
+
+    def _match(self, table: _ModelTable, name: str) -> Optional[HardwareModel]:
+        cache_key = (table.kind, name)
+        if cache_key in self._matches:
+            return self._matches[cache_key]
+
+        tokens, mobile = tokenize_model_name(name or "")
+        memory_gb = memory_size_gb(name or "") if table.kind == "gpu" else None
+        position = table.find(tokens, mobile, detect_vendor(name or ""), memory_gb) if tokens else None
+        model = table.model(position) if position is not None else None
+        if model is not None and memory_gb is not None and model.vram_gb != memory_gb:
+            # Variante ausente do catálogo: a memória declarada no nome prevalece
+            model = replace(model, vram_gb=memory_gb)
+
+        if len(self._matches) >= 8192:
+            self._matches.clear()
+        self._matches[cache_key] = model
+        return model
+
+
+def _index_path(path: str) -> Optional[str]:
+    """Arquivo do índice compilado de um catálogo, no diretório de cache (None se o catálogo não existe)."""
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    version = f"{stat.st_size}:{stat.st_mtime_ns}"
+    name = hashlib.sha1(path.encode("utf-8")).hexdigest()[:12]
+    digest = hashlib.sha1(f"{path}:{version}:{INDEX_FORMAT_VERSION}".encode("utf-8")).hexdigest()[:12]
+    return os.path.join(default_cache_dir(), f"hardware_catalog_{name}.{digest}.pickle")
+
+
+@lru_cache(maxsize=1)
+def get_hardware_catalog() -> HardwareCatalog:
+    """Catálogo padrão, carregado uma única vez por processo."""
+    return HardwareCatalog.load()
@@ -1,3 +1,4 @@
-from .llm_provider import LLMProvider
+from .llm_provider import LLMProvider, CallMetrics
+from .async_llm_provider import AsyncLLMProvider, get_model_rate_limiter
 
-__all__ = ['LLMProvider']
+__all__ = ['LLMProvider', 'CallMetrics', 'AsyncLLMProvider', 'get_model_rate_limiter']
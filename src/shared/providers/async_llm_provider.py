@@ -0,0 +1,149 @@
+from typing import Dict, Optional
+import asyncio
+import logging
+import os
+import threading
+import time
+
+import aiohttp
+
+from src.shared.utils import TokenBucket
+from .llm_provider import LLMProvider, RETRY_STATUS_CODES, parse_model_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_model_rate_limiter(model: str) -> TokenBucket:
+    """
+    Retorna o limitador de taxa do modelo, compartilhado por todo o processo.
+
+    Modelos sem limite próprio em OPENROUTER_RATE_LIMITS usam
+    OPENROUTER_RATE_LIMIT (padrão: 2 requisições por segundo).
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(model)
+        if limiter is None:
+            rate = parse_model_settings("OPENROUTER_RATE_LIMITS").get(
+                model, float(os.getenv("OPENROUTER_RATE_LIMIT", DEFAULT_REQUESTS_PER_SECOND))
+            )
+            limiter = TokenBucket(rate, capacity=max(1.0, rate))
+            _rate_limiters[model] = limiter
+        return limiter
+
+class AsyncLLMProvider(LLMProvider):
+    """
+    Versão asyncio do LLMProvider, para manter várias análises em andamento.
+
+    As chamadas simultâneas são limitadas por um semáforo e cada modelo tem
+    um token bucket próprio. Use como gerenciador de contexto assíncrono para
+    fechar as conexões ao final:
+
+        async with AsyncLLMProvider() as llm:
+            texto = await llm.generate_response_async(prompt)
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, **kwargs):
+        """
+        Inicializa o provider.
+
+        Args:
+            max_concurrency: Máximo de chamadas simultâneas
+                (padrão: OPENROUTER_MAX_CONCURRENCY ou 4)
+            **kwargs: Timeouts e retentativas, como no LLMProvider
+        """
+        super().__init__(**kwargs)
+        self.max_concurrency = max_concurrency or int(
+            os.getenv('OPENROUTER_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY)
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Fecha as conexões abertas."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Criados sob demanda: precisam do event loop em execução
+        if self._session is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout)
+            )
+        return self._session
+
+    async def _post_async(self, data: dict):
+        """
+        Envia a requisição com retentativas em 429/5xx e falhas de rede.
+
+        Returns:
+            Tupla (status, JSON da resposta, tentativas)
+        """
+        session = self._get_session()
+        limiter = get_model_rate_limiter(data["model"])
+        attempt = 0
+        while True:
+            await limiter.acquire_async()
+            try:
+                timeout = aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout, sock_read=self.read_timeout_for(data["model"])
+                )
+                async with session.post(self.api_url, headers=self._headers(), json=data,
+                                        timeout=timeout) as response:
+                    if response.status not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                        if response.status >= 400:
+                            text = await response.text()
+                            raise Exception(
+                                f"Erro ao chamar OpenRouter API: {response.status} {response.reason}"
+                                f"\nResponse: {text}"
+                            )
+                        return response.status, await response.json(content_type=None), attempt + 1
+                    delay = self._retry_delay(attempt, response)
+                    status = response.status
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise Exception(f"Erro ao chamar OpenRouter API: {str(e) or type(e).__name__}")
+                delay = self._retry_delay(attempt, None)
+                status = "falha de rede"
+
+            logger.warning(f"OpenRouter indisponível ({status}), nova tentativa em {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def generate_response_async(self, prompt, system_prompt=None, temperature=0.7, model=None):
+        """
+        Gera uma resposta sem bloquear o event loop.
+
+        Args:
+            prompt (str): O prompt principal para o modelo
+            system_prompt (str, optional): Prompt de sistema que define o comportamento do modelo
+            temperature (float, default=0.7): Controla a aleatoriedade das respostas
+            model (str, optional): Modelo a usar no lugar de `self.model`
+
+        Returns:
+            str: A resposta gerada pelo modelo
+
+        Raises:
+            Exception: Se houver erro na chamada da API
+        """
+        data = self._build_payload(prompt, system_prompt, temperature, model)
+        self._get_session()
+        async with self._semaphore:
+            start = time.perf_counter()
+            status, result, attempts = await self._post_async(data)
+        self._record_metrics(data["model"], start, attempts, status, result.get('usage'))
+        return result['choices'][0]['message']['content']
@@ -1,62 +1,518 @@
 import os
+import queue
+import random
+import threading
+import time
+import json
+import logging
+import sqlite3
+from collections import deque
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from src.shared.cache import DiskCache
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRY_DELAY = 30.0
+
+# Requisições de reserva (hedge): espera padrão e amostras mínimas para usar o percentil
+DEFAULT_HEDGE_DELAY = 10.0
+MIN_HEDGE_SAMPLES = 20
+LATENCY_HISTORY_SIZE = 200
+LATENCY_HISTORY_TTL = 7 * 24 * 3600  # histórico em disco: latências de uma semana atrás já não valem
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_latency_history: Dict[str, Deque[float]] = {}
+_latency_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """
+    Retorna a sessão HTTP compartilhada por todos os LLMProvider do processo.
+
+    A sessão mantém conexões keep-alive, evitando um novo handshake TLS a
+    cada chamada. As retentativas são feitas pelo LLMProvider, não pelo adapter.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+@lru_cache(maxsize=1)
+def get_latency_store() -> DiskCache:
+    """Histórico de latências em disco (namespace "llm_latency"), compartilhado entre execuções."""
+    return DiskCache("llm_latency", max_entries=100)
+
+def _latency_samples(model: str) -> Deque[float]:
+    """Histórico do modelo em memória, carregado do disco no primeiro uso (chamar com _latency_lock)."""
+    history = _latency_history.get(model)
+    if history is None:
+        try:
+            stored = get_latency_store().get(f"latency:{model}") or []
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Histórico de latências indisponível: {e}")
+            stored = []
+        history = _latency_history[model] = deque(stored, maxlen=LATENCY_HISTORY_SIZE)
+    return history
+
+def record_latency(model: str, latency: float):
+    """
+    Registra a latência de uma chamada bem-sucedida no histórico do modelo.
+
+    O histórico é salvo em disco: execuções curtas do CLI, que sozinhas nunca
+    chegam a MIN_HEDGE_SAMPLES chamadas, somam amostras para o percentil.
+    """
+    with _latency_lock:
+        history = _latency_samples(model)
+        history.append(latency)
+        samples = list(history)
+    try:
+        get_latency_store().set(f"latency:{model}", samples, ttl=LATENCY_HISTORY_TTL)
+    except (OSError, sqlite3.Error) as e:
+        logger.debug(f"Histórico de latências não salvo: {e}")
+
+def latency_percentile(model: str, percentile: float) -> Optional[float]:
+    """
+    Percentil das latências recentes do modelo, nesta e em execuções anteriores.
+
+    Returns:
+        Latência em segundos, ou None com menos de MIN_HEDGE_SAMPLES amostras
+    """
+    with _latency_lock:
+        samples = sorted(_latency_samples(model))
+    if len(samples) < MIN_HEDGE_SAMPLES:
+        return None
+    return samples[min(len(samples) - 1, int(percentile / 100 * len(samples)))]
+
+def parse_model_settings(variable: str) -> Dict[str, float]:
+    """
+    Lê valores numéricos por modelo de uma variável de ambiente.
+
+    Formato: "modelo=valor,modelo=valor" (ex: "openai/gpt-4o-mini=5,anthropic/claude-3-haiku=1").
+    """
+    settings = {}
+    for item in (os.getenv(variable) or "").split(","):
+        if "=" in item:
+            model, value = item.rsplit("=", 1)
+            settings[model.strip()] = float(value)
+    return settings
+
+@dataclass
+class CallMetrics:
+    """Métricas de uma chamada ao LLM."""
+    model: str
+    latency: float                  # segundos, incluindo retentativas
+    attempts: int
+    status_code: Optional[int] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    first_token_latency: Optional[float] = None  # apenas em streaming
+    tier: Optional[int] = None                   # posição do modelo em OPENROUTER_MODELS (0 = primeiro)
+
+def _optional_float(variable: str) -> Optional[float]:
+    value = os.getenv(variable)
+    return float(value) if value else None
+
 class LLMProvider:
-    def __init__(self):
+    """
+    Cliente da API do OpenRouter.
+
+    Com OPENROUTER_MODELS ("rapido,forte,...") o provider conhece uma lista
+    ordenada de modelos (níveis); `model` é o primeiro, usado por padrão, e
+    cada chamada pode escolher outro nível. OPENROUTER_MODEL_TIMEOUTS define
+    o prazo de leitura de cada modelo ("modelo=segundos,...").
+
+    No modo hedge, se a requisição principal não responder dentro da espera
+    configurada (fixa ou um percentil das latências recentes), uma segunda
+    requisição é enviada ao mesmo modelo ou a um modelo alternativo; vale a
+    primeira resposta válida e a outra é cancelada. O prazo total (deadline)
+    limita a chamada inteira, incluindo retentativas.
+    """
+
+    def __init__(self, connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None, hedge_delay: Optional[float] = None,
+                 hedge_percentile: Optional[float] = None, hedge_model: Optional[str] = None,
+                 deadline: Optional[float] = None):
+        """
+        Inicializa o provider.
+
+        Args:
+            connect_timeout: Prazo para abrir a conexão (padrão: OPENROUTER_CONNECT_TIMEOUT ou 5s)
+            read_timeout: Prazo de leitura da resposta (padrão: OPENROUTER_READ_TIMEOUT ou 120s)
+            max_retries: Retentativas em 429/5xx e falhas de rede (padrão: OPENROUTER_MAX_RETRIES ou 3)
+            hedge_delay: Segundos sem resposta até a requisição de reserva (padrão: OPENROUTER_HEDGE_DELAY)
+            hedge_percentile: Percentil das latências recentes usado como espera, ex: 95
+                (padrão: OPENROUTER_HEDGE_PERCENTILE); sem histórico, vale hedge_delay ou 10s
+            hedge_model: Modelo da requisição de reserva (padrão: OPENROUTER_HEDGE_MODEL ou o mesmo)
+            deadline: Prazo total de cada chamada, em segundos (padrão: OPENROUTER_DEADLINE, sem prazo)
+        """
         self.api_key = os.getenv('OPENROUTER_API_KEY')
-        self.model = os.getenv('OPENROUTER_MODEL')
-        self.api_url = "https://openrouter.ai/api/v1/chat/completions"
-        
+        self.models = [
+            model.strip() for model in (os.getenv('OPENROUTER_MODELS') or '').split(',') if model.strip()
+        ]
+        self.model = self.models[0] if self.models else os.getenv('OPENROUTER_MODEL')
+        if not self.models and self.model:
+            self.models = [self.model]
+        self.api_url = os.getenv('OPENROUTER_API_URL') or DEFAULT_API_URL
+        self.connect_timeout = connect_timeout if connect_timeout is not None else float(
+            os.getenv('OPENROUTER_CONNECT_TIMEOUT', 5)
+        )
+        self.read_timeout = read_timeout if read_timeout is not None else float(
+            os.getenv('OPENROUTER_READ_TIMEOUT', 120)
+        )
+        self.max_retries = max_retries if max_retries is not None else int(
+            os.getenv('OPENROUTER_MAX_RETRIES', 3)
+        )
+        self.model_timeouts = parse_model_settings('OPENROUTER_MODEL_TIMEOUTS')
+        self.hedge_delay = hedge_delay if hedge_delay is not None else _optional_float('OPENROUTER_HEDGE_DELAY')
+        self.hedge_percentile = hedge_percentile if hedge_percentile is not None else _optional_float(
+            'OPENROUTER_HEDGE_PERCENTILE'
+        )
+        self.hedge_model = hedge_model or os.getenv('OPENROUTER_HEDGE_MODEL')
+        self.deadline = deadline if deadline is not None else _optional_float('OPENROUTER_DEADLINE')
+        self.session = get_session()
+        self.metrics: List[CallMetrics] = []
+
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY não encontrada no .env")
         if not self.model:
-            raise ValueError("OPENROUTER_MODEL não encontrado no .env")
+            raise ValueError("OPENROUTER_MODEL (ou OPENROUTER_MODELS) não encontrado no .env")
 
-    def generate_response(self, prompt, system_prompt=None, temperature=0.7):
-        """
-        Gera uma resposta usando o modelo LLM configurado via OpenRouter.
-        
-        Args:
-            prompt (str): O prompt principal para o modelo
-            system_prompt (str, optional): Prompt de sistema que define o comportamento do modelo
-            temperature (float, default=0.7): Controla a aleatoriedade das respostas
-            
-        Returns:
-            str: A resposta gerada pelo modelo
-            
-        Raises:
-            Exception: Se houver erro na chamada da API
-        """
-        headers = {
+    def read_timeout_for(self, model: str) -> float:
+        """Prazo de leitura do modelo (OPENROUTER_MODEL_TIMEOUTS ou o prazo padrão)."""
+        return self.model_timeouts.get(model, self.read_timeout)
+
+    def tier_of(self, model: str) -> Optional[int]:
+        """Posição do modelo na lista de níveis, ou None se não fizer parte dela."""
+        return self.models.index(model) if model in self.models else None
+
+    @property
+    def hedging(self) -> bool:
+        """Indica se o modo hedge está ativo."""
+        return self.hedge_delay is not None or self.hedge_percentile is not None
+
+    def hedge_delay_for(self, model: str) -> float:
+        """Espera até a requisição de reserva: percentil das latências do modelo ou a espera fixa."""
+        if self.hedge_percentile is not None:
+            delay = latency_percentile(model, self.hedge_percentile)
+            if delay is not None:
+                return delay
+        return self.hedge_delay if self.hedge_delay is not None else DEFAULT_HEDGE_DELAY
+
+    def _headers(self) -> dict:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/pedro/game-spec-analyzer-ia",
             "X-Title": "Game Spec Analyzer IA"
         }
-        
+
+    def _build_payload(self, prompt, system_prompt, temperature, model=None) -> dict:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
-        
-        data = {
-            "model": self.model,
+
+        return {
+            "model": model or self.model,
             "messages": messages,
             "temperature": temperature
         }
-        
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """
+        Calcula a espera antes da próxima tentativa.
+
+        Respeita o cabeçalho Retry-After (segundos ou data HTTP); caso contrário
+        usa backoff exponencial com jitter completo.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                    return min(MAX_RETRY_DELAY, max(0.0, delay))
+                except (TypeError, ValueError):
+                    pass
+        return random.uniform(0, min(MAX_RETRY_DELAY, 0.5 * 2 ** attempt))
+
+    def _post(self, data: dict, stream: bool = False, cancel: Optional[threading.Event] = None,
+              deadline: Optional[float] = None):
+        """
+        Envia a requisição com retentativas em 429/5xx e falhas de rede.
+
+        Args:
+            data: Payload da requisição
+            stream: Repassado ao requests (corpo lido sob demanda)
+            cancel: Evento que interrompe as retentativas (requisições de reserva)
+            deadline: Instante limite (time.perf_counter); encurta o prazo de
+                leitura e impede retentativas que não caberiam nele
+
+        Returns:
+            Tupla (response, tentativas)
+        """
+        attempt = 0
+        while True:
+            response = None
+            read_timeout = self.read_timeout_for(data["model"])
+            if deadline is not None:
+                read_timeout = max(0.001, min(read_timeout, deadline - time.perf_counter()))
+            try:
+                response = self.session.post(
+                    self.api_url,
+                    headers=self._headers(),
+                    json=data,
+                    timeout=(self.connect_timeout, read_timeout),
+                    stream=stream
+                )
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response, attempt + 1
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+
+            delay = self._retry_delay(attempt, response)
+            status = response.status_code if response is not None else "falha de rede"
+            if deadline is not None and time.perf_counter() + delay >= deadline:
+                if response is not None:
+                    response.raise_for_status()
+                raise requests.exceptions.Timeout(f"prazo esgotado após {attempt + 1} tentativa(s) ({status})")
+            logger.warning(f"OpenRouter indisponível ({status}), nova tentativa em {delay:.1f}s")
+            if response is not None:
+                response.close()
+            if cancel is not None:
+                if cancel.wait(delay):
+                    raise requests.exceptions.ConnectionError("requisição cancelada")
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def _record_metrics(self, model: str, start: float, attempts: int, status_code: Optional[int],
+                        usage=None, first_token: Optional[float] = None) -> CallMetrics:
+        usage = usage or {}
+        metrics = CallMetrics(
+            model=model,
+            latency=time.perf_counter() - start,
+            attempts=attempts,
+            status_code=status_code,
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+            first_token_latency=first_token - start if first_token is not None else None,
+            tier=self.tier_of(model)
+        )
+        self.metrics.append(metrics)
+        record_latency(model, metrics.latency)
+        first_token_info = (
+            f", primeiro token em {metrics.first_token_latency:.2f}s"
+            if metrics.first_token_latency is not None else ""
+        )
+        tier_info = (
+            f", nível {metrics.tier + 1}/{len(self.models)}"
+            if len(self.models) > 1 and metrics.tier is not None else ""
+        )
+        logger.info(
+            f"OpenRouter ({model}{tier_info}): {metrics.latency:.2f}s{first_token_info}, {attempts} tentativa(s), "
+            f"tokens {metrics.prompt_tokens}/{metrics.completion_tokens}"
+        )
+        return metrics
+
+    def generate_response(self, prompt, system_prompt=None, temperature=0.7, model=None,
+                          validate: Optional[Callable[[str], object]] = None):
+        """
+        Gera uma resposta usando o modelo LLM configurado via OpenRouter.
+
+        Args:
+            prompt (str): O prompt principal para o modelo
+            system_prompt (str, optional): Prompt de sistema que define o comportamento do modelo
+            temperature (float, default=0.7): Controla a aleatoriedade das respostas
+            model (str, optional): Modelo a usar no lugar de `self.model` (ex: um nível de `self.models`)
+            validate (callable, optional): No modo hedge, recebe o texto e levanta
+                exceção se ele for inválido; respostas inválidas não vencem a disputa
+
+        Returns:
+            str: A resposta gerada pelo modelo
+
+        Raises:
+            Exception: Se houver erro na chamada da API
+        """
+        data = self._build_payload(prompt, system_prompt, temperature, model)
+        if self.hedging or self.deadline is not None:
+            return self._generate_hedged(data, validate)
+        start = time.perf_counter()
+
         try:
-            response = requests.post(self.api_url, headers=headers, json=data)
-            response.raise_for_status()
-            
+            response, attempts = self._post(data)
             result = response.json()
+            self._record_metrics(data["model"], start, attempts, response.status_code, result.get('usage'))
             return result['choices'][0]['message']['content']
-            
+
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Erro ao chamar OpenRouter API: {str(e)}"
+            if (response := getattr(e, 'response', None)) is not None:
+                error_msg += f"\nResponse: {response.text}"
+            raise Exception(error_msg)
+
+    def _generate_hedged(self, data: dict, validate: Optional[Callable[[str], object]]) -> str:
+        """
+        Executa a chamada com requisição de reserva e prazo total.
+
+        Cada requisição roda em uma thread daemon; a perdedora é cancelada:
+        suas retentativas são interrompidas e a resposta aberta é fechada.
+        """
+        start = time.perf_counter()
+        deadline = start + self.deadline if self.deadline is not None else None
+        hedge_at = start + self.hedge_delay_for(data["model"]) if self.hedging else None
+        cancel = threading.Event()
+        outcomes: queue.Queue = queue.Queue()
+        open_responses = []
+
+        def attempt(label: str, payload: dict):
+            # A latência registrada é a desta requisição, não a da chamada inteira
+            attempt_start = time.perf_counter()
+            try:
+                response, attempts = self._post(payload, stream=True, cancel=cancel, deadline=deadline)
+                open_responses.append(response)
+                if cancel.is_set():
+                    response.close()
+                    return
+                result = response.json()
+                content = result['choices'][0]['message']['content']
+                if validate is not None:
+                    validate(content)
+                outcomes.put((label, payload["model"],
+                              (attempt_start, response.status_code, attempts, result, content)))
+            except Exception as e:
+                outcomes.put((label, payload["model"], e))
+
+        def launch(label: str, payload: dict):
+            threading.Thread(target=attempt, args=(label, payload), daemon=True,
+                             name=f"llm-{label}").start()
+
+        launch("principal", data)
+        running = 1
+        errors = []
+        try:
+            while True:
+                now = time.perf_counter()
+                if running == 0 and hedge_at is not None:
+                    # A principal falhou antes da espera: a reserva sai imediatamente
+                    hedge_at = now
+                if hedge_at is not None and now >= hedge_at:
+                    hedge_at = None
+                    hedge_data = {**data, "model": self.hedge_model or data["model"]}
+                    logger.info(
+                        f"Sem resposta válida de {data['model']} em {now - start:.2f}s; "
+                        f"requisição de reserva para {hedge_data['model']}"
+                    )
+                    launch("reserva", hedge_data)
+                    running += 1
+                if running == 0:
+                    break
+                waits = [moment - now for moment in (hedge_at, deadline) if moment is not None]
+                try:
+                    label, model, outcome = outcomes.get(timeout=max(0.0, min(waits)) if waits else None)
+                except queue.Empty:
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        raise Exception(f"Erro ao chamar OpenRouter API: prazo de {self.deadline:g}s esgotado")
+                    continue
+
+                running -= 1
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Requisição {label} ({model}) falhou: {str(outcome)}")
+                    errors.append(outcome)
+                    continue
+                attempt_start, status_code, attempts, result, content = outcome
+                self._record_metrics(model, attempt_start, attempts, status_code, result.get('usage'))
+                if label == "reserva":
+                    logger.info(f"Requisição de reserva ({model}) respondeu primeiro")
+                return content
+
+            error = errors[-1]
+            error_msg = f"Erro ao chamar OpenRouter API: {str(error)}"
+            if (response := getattr(error, 'response', None)) is not None:
+                error_msg += f"\nResponse: {response.text}"
+            raise Exception(error_msg)
+        finally:
+            cancel.set()
+            for response in open_responses:
+                response.close()
+
+    def stream_response(self, prompt, system_prompt=None, temperature=0.7, model=None) -> Iterator[str]:
+        """
+        Gera uma resposta em streaming (Server-Sent Events), entregando o texto
+        à medida que o modelo produz os tokens.
+
+        O prazo total (deadline) vale para a resposta inteira, não só para a
+        conexão; não há requisição de reserva, pois o texto já entregue não
+        pode ser trocado pelo de outra resposta.
+
+        Args:
+            prompt (str): O prompt principal para o modelo
+            system_prompt (str, optional): Prompt de sistema que define o comportamento do modelo
+            temperature (float, default=0.7): Controla a aleatoriedade das respostas
+            model (str, optional): Modelo a usar no lugar de `self.model`
+
+        Yields:
+            str: Trechos consecutivos da resposta
+
+        Raises:
+            Exception: Se houver erro na chamada da API
+        """
+        data = self._build_payload(prompt, system_prompt, temperature, model)
+        data["stream"] = True
+        start = time.perf_counter()
+        deadline = start + self.deadline if self.deadline is not None else None
+        first_token = None
+        usage = None
+
+        try:
+            response, attempts = self._post(data, stream=True, deadline=deadline)
+            # text/event-stream costuma vir sem charset; o padrão do requests seria ISO-8859-1
+            response.encoding = "utf-8"
+            with response:
+                for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        raise Exception(f"Erro ao chamar OpenRouter API: prazo de {self.deadline:g}s esgotado")
+                    # Linhas vazias separam eventos; ":" inicia comentários de keep-alive
+                    if not line or line.startswith(":") or not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == "[DONE]":
+                        break
+                    event = json.loads(payload)
+                    if "error" in event:
+                        raise Exception(f"Erro ao chamar OpenRouter API: {event['error']}")
+                    usage = event.get("usage") or usage
+                    for choice in event.get("choices", []):
+                        content = (choice.get("delta") or {}).get("content")
+                        if content:
+                            if first_token is None:
+                                first_token = time.perf_counter()
+                            yield content
+            self._record_metrics(data["model"], start, attempts, response.status_code, usage, first_token)
+
         except requests.exceptions.RequestException as e:
             error_msg = f"Erro ao chamar OpenRouter API: {str(e)}"
-            if response := getattr(e, 'response', None):
+            if (response := getattr(e, 'response', None)) is not None:
                 error_msg += f"\nResponse: {response.text}"
             raise Exception(error_msg)
@@ -1,8 +1,33 @@
 from .browser_scraper import BrowserScraper
-from .game_system_requirements import GameSystemRequirements, GameRequirements
+from .game_requirements import GameRequirements
+from .game_system_requirements import GameSystemRequirements
+from .steam_page_parser import parse_app_page, parse_search_results
+from .requirements_normalizer import (
+    NormalizedRequirements, normalize_requirements, normalize_game_requirements,
+    extract_cpu_models, extract_gpu_models
+)
+from .steam_http_fetcher import SteamHttpFetcher
+from .steam_ids import normalize_game_name, steam_app_id_from_url
+from .steam_app_index import SteamAppIndex
+from .webdriver_pool import WebDriverPool
+from .pool_daemon import PoolDaemon, PoolClient
 
 __all__ = [
     'BrowserScraper',
     'GameSystemRequirements',
-    'GameRequirements'
+    'GameRequirements',
+    'parse_app_page',
+    'parse_search_results',
+    'NormalizedRequirements',
+    'normalize_requirements',
+    'normalize_game_requirements',
+    'extract_cpu_models',
+    'extract_gpu_models',
+    'SteamHttpFetcher',
+    'normalize_game_name',
+    'steam_app_id_from_url',
+    'SteamAppIndex',
+    'WebDriverPool',
+    'PoolDaemon',
+    'PoolClient'
 ]
@@ -5,19 +5,142 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+from typing import Dict, List, Optional, Tuple
+import json
+import logging
 import time
 import random
 
+logger = logging.getLogger(__name__)
+
+# Recursos bloqueados no perfil "lean": imagens, fontes, mídia e rastreadores.
+# Os scripts da própria Steam continuam liberados (a verificação de idade depende deles).
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mpd", "*.m4s", "*.mp3", "*.ogg",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*youtube.com*", "*ytimg.com*", "*hotjar.com*",
+]
+
+# Recursos do Chrome que o scraping nunca usa
+LEAN_CHROME_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--no-first-run",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+]
+
+def apply_lean_profile(options: Options) -> Options:
+    """
+    Configura as opções do Chrome para o perfil "lean".
+
+    Usa carregamento "eager" (a página fica pronta no DOMContentLoaded),
+    desativa imagens e recursos não usados e habilita o log de rede usado
+    em `collect_navigation_metrics`.
+
+    Args:
+        options: Opções do Chrome a configurar
+
+    Returns:
+        As mesmas opções, para encadeamento
+    """
+    options.page_load_strategy = "eager"
+    for argument in LEAN_CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+def block_heavy_resources(driver):
+    """Bloqueia, via CDP, os recursos de LEAN_BLOCKED_URLS no driver já iniciado."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+
+def collect_navigation_metrics(driver) -> Dict[str, float]:
+    """
+    Coleta métricas da última navegação.
+
+    Os bytes vêm do log de rede do Chrome (habilitado por `apply_lean_profile`),
+    que é esvaziado a cada leitura; o tempo até a página ficar pronta vem da
+    Navigation Timing API.
+
+    Returns:
+        Dicionário com bytes transferidos, requisições, bloqueios e ready_ms
+    """
+    metrics = {"bytes": 0, "requests": 0, "blocked": 0, "ready_ms": None}
+    try:
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method")
+            if method == "Network.loadingFinished":
+                metrics["bytes"] += message["params"].get("encodedDataLength", 0)
+            elif method == "Network.requestWillBeSent":
+                metrics["requests"] += 1
+            elif method == "Network.loadingFailed" and message["params"].get("blockedReason"):
+                metrics["blocked"] += 1
+    except Exception:
+        # Sem log de performance (perfil normal): mantém apenas o tempo
+        pass
+
+    try:
+        metrics["ready_ms"] = driver.execute_script(
+            "const nav = performance.getEntriesByType('navigation')[0];"
+            "return nav ? nav.domContentLoadedEventEnd - nav.startTime : null;"
+        )
+    except Exception:
+        pass
+    return metrics
+
+def record_navigation(driver, url: str, start: float) -> Dict:
+    """
+    Monta e registra no log o resumo de uma navegação já concluída.
+
+    Args:
+        driver: WebDriver que fez a navegação
+        url: URL de destino
+        start: Instante (time.perf_counter) logo antes do `driver.get`
+
+    Returns:
+        Dicionário com a URL, elapsed_ms (até a página ficar pronta) e as
+        métricas de `collect_navigation_metrics`
+    """
+    elapsed_ms = round((time.perf_counter() - start) * 1000)
+    record = {"url": url, "elapsed_ms": elapsed_ms, **collect_navigation_metrics(driver)}
+    logger.info(
+        f"Navegação: {url} - {record['bytes'] / 1024:.0f} KB, "
+        f"{record['blocked']} bloqueados, pronta em {elapsed_ms} ms"
+    )
+    return record
+
 class BrowserScraper:
     """Base class para scrapers que usam navegador."""
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, politeness_delay: float = 0.0, page_timeout: float = 10.0,
+                 lean: bool = False):
         """
         Inicializa o scraper.
         
         Args:
             headless: Se True, executa o navegador sem interface gráfica
+            politeness_delay: Pausa média opcional (segundos) antes de cada navegação
+            page_timeout: Prazo máximo padrão para as condições de prontidão
+            lean: Se True, bloqueia imagens, fontes, mídia e rastreadores e usa
+                carregamento "eager"
         """
+        self.lean = lean
+        self.navigations: List[Dict] = []
+        self.politeness_delay = politeness_delay
+        self.page_timeout = page_timeout
         self.options = Options()
         if headless:
             self.options.add_argument('--headless')
@@ -28,6 +151,8 @@ class BrowserScraper:
         self.options.add_argument('--no-sandbox')
         self.options.add_experimental_option('excludeSwitches', ['enable-automation'])
         self.options.add_experimental_option('useAutomationExtension', False)
+        if lean:
+            apply_lean_profile(self.options)
         
         self.driver = None
 
@@ -38,6 +163,8 @@ class BrowserScraper:
             options=self.options
         )
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.lean:
+            block_heavy_resources(self.driver)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -49,15 +176,24 @@ class BrowserScraper:
         """Espera um tempo aleatório para simular comportamento humano."""
         time.sleep(random.uniform(min_seconds, max_seconds))
 
-    def navigate(self, url: str):
+    def navigate(self, url: str, ready_locator: Optional[Tuple[str, str]] = None,
+                 timeout: Optional[float] = None):
         """
-        Navega para uma URL.
+        Navega para uma URL e aguarda a página ficar pronta, aplicando a pausa
+        de cortesia se configurada e registrando as métricas da navegação.
         
         Args:
             url: URL para navegar
+            ready_locator: Elemento (by, valor) que indica que a página está pronta
+            timeout: Prazo máximo de espera (padrão: page_timeout)
         """
+        if self.politeness_delay > 0:
+            self._random_wait(self.politeness_delay * 0.5, self.politeness_delay * 1.5)
+        start = time.perf_counter()
         self.driver.get(url)
-        self._random_wait()
+        if ready_locator:
+            self.find_element(*ready_locator, timeout=timeout or self.page_timeout)
+        self.navigations.append(record_navigation(self.driver, url, start))
 
     def find_element(self, by: By, value: str, timeout: int = 10):
         """
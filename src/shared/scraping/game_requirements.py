@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+@dataclass
+class GameRequirements:
+    """Requisitos do jogo."""
+    minimum: Dict[str, str]
+    recommended: Dict[str, str]
+    source_url: str
+    price: Optional[str] = None
+    title: Optional[str] = None
+    app_id: Optional[int] = None
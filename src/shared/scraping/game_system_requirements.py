@@ -1,14 +1,23 @@
-from dataclasses import dataclass
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus
 import logging
+import os
+import random
 import time
 
+from src.shared.utils import PhaseTimer, TokenBucket
+from .browser_scraper import apply_lean_profile, block_heavy_resources, record_navigation
+from .game_requirements import GameRequirements
+from .steam_ids import steam_store_url
+from .steam_page_parser import parse_app_page
+
 # Configuração do logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,20 +26,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
-class GameRequirements:
-    """Requisitos do jogo."""
-    minimum: Dict[str, str]
-    recommended: Dict[str, str]
-    source_url: str
-    price: Optional[str] = None
-    title: Optional[str] = None
-
 class GameSystemRequirements:
     """Sistema automatizado de análise de requisitos de jogos."""
 
-    def __init__(self):
+    def __init__(self, page_timeout: Optional[float] = None, politeness_delay: Optional[float] = None,
+                 lean: Optional[bool] = None, rate_limiter: Optional[TokenBucket] = None,
+                 base_url: Optional[str] = None):
+        """
+        Inicializa o sistema.
+
+        Args:
+            page_timeout: Prazo máximo, em segundos, para cada página ficar pronta
+                (padrão: SCRAPER_PAGE_TIMEOUT ou 10)
+            politeness_delay: Pausa média opcional antes de cada navegação, para
+                não sobrecarregar a Steam (padrão: SCRAPER_POLITENESS_DELAY ou 0)
+            lean: Se True, bloqueia imagens, fontes, mídia e rastreadores e usa
+                carregamento "eager" (padrão: SCRAPER_LEAN, ativado)
+            rate_limiter: Limitador compartilhado aplicado antes de cada navegação
+            base_url: URL base da loja (padrão: STEAM_BASE_URL ou a loja da Steam)
+        """
         self.driver = None
+        self.base_url = (base_url or steam_store_url()).rstrip("/")
+        self.page_timeout = page_timeout if page_timeout is not None else float(
+            os.getenv("SCRAPER_PAGE_TIMEOUT", 10)
+        )
+        self.politeness_delay = politeness_delay if politeness_delay is not None else float(
+            os.getenv("SCRAPER_POLITENESS_DELAY", 0)
+        )
+        self.rate_limiter = rate_limiter
+        self.lean = lean if lean is not None else os.getenv("SCRAPER_LEAN", "1") != "0"
+        self.timings: Dict[str, float] = {}
+        self.navigations: List[Dict] = []
         print("\n=== Iniciando Sistema de Análise de Requisitos ===")
         logger.info("Inicializando sistema de análise")
 
@@ -42,6 +68,8 @@ class GameSystemRequirements:
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--no-sandbox")
+        if self.lean:
+            apply_lean_profile(chrome_options)
         
         # Inicializa sistema
         logger.info("Configurando subsistemas")
@@ -49,6 +77,8 @@ class GameSystemRequirements:
             service=Service(ChromeDriverManager().install()), 
             options=chrome_options
         )
+        if self.lean:
+            block_heavy_resources(self.driver)
         print("✓ Ambiente preparado com sucesso")
         return self
 
@@ -59,123 +89,65 @@ class GameSystemRequirements:
             print("✓ Sistema encerrado com sucesso")
             logger.info("Processo finalizado")
 
-    def get_game_requirements(self, game_name: str) -> Optional[GameRequirements]:
+    def get_game_requirements(self, game_name: str, app_id: Optional[int] = None) -> Optional[GameRequirements]:
         """
         Analisa e extrai requisitos técnicos do jogo especificado.
         
         Args:
             game_name: Nome do jogo para análise
+            app_id: Appid já conhecido; pula a busca e vai direto para a página do jogo
             
         Returns:
             GameRequirements se encontrado, None caso contrário
         """
+        timer = PhaseTimer()
+        self.timings = timer.timings
         try:
             print(f"\n=== Iniciando análise técnica: {game_name} ===")
             logger.info(f"Iniciando análise para: {game_name}")
             
-            # Fase 1: Inicialização e preparação
-            print("\n>> Fase 1: Preparação da análise...")
-            self.driver.get("https://store.steampowered.com/search/")
-            time.sleep(2)
-            logger.info("Fase 1 concluída: Ambiente preparado")
-
-            # Fase 2: Localização e acesso
-            print(">> Fase 2: Localizando especificações...")
-            search_box = self.driver.find_element(By.ID, "store_nav_search_term")
-            search_box.send_keys(game_name)
-            search_box.send_keys(Keys.RETURN)
-            time.sleep(2)
-            logger.info("Fase 2 concluída: Especificações localizadas")
-
-            # Fase 3: Extração de dados primários
-            print(">> Fase 3: Processando dados primários...")
-            first_result = self.driver.find_element(By.CLASS_NAME, "search_result_row")
-            game_url = first_result.get_attribute("href")
-            first_result.click()
-            time.sleep(3)
-            logger.info("Fase 3 concluída: Dados primários obtidos")
-
-            # Fase 4: Validação de acesso
-            try:
-                age_gate = self.driver.find_elements(By.ID, "ageYear")
-                if age_gate:
-                    print(">> Aplicando protocolo de validação...")
-                    self.driver.find_element(By.ID, "ageYear").send_keys("1990")
-                    self.driver.find_element(By.CLASS_NAME, "btnv6_blue_hoverfade").click()
-                    time.sleep(2)
-                    logger.info("Protocolo de validação concluído")
-            except:
-                pass
-
-            # Fase 5: Coleta de metadados
-            print("\n>> Fase 5: Coletando metadados...")
-            title = self.driver.find_element(By.ID, "appHubAppName").text
-            logger.info("Metadados básicos obtidos")
-
-            # Fase 6: Análise econômica
-            try:
-                discounted_price = self.driver.find_element(By.CLASS_NAME, "discount_final_price").text
-                original_price = self.driver.find_element(By.CLASS_NAME, "discount_original_price").text
-                price = f"{discounted_price} (Original: {original_price})"
-                logger.info("Análise econômica: Preço promocional detectado")
-            except:
-                try:
-                    price = self.driver.find_element(By.CLASS_NAME, "game_purchase_price").text
-                    if not price or "Free" in price:
-                        price = "Free"
-                    logger.info("Análise econômica: Preço padrão detectado")
-                except:
-                    price = "TBD"
-                    logger.warning("Análise econômica inconclusiva")
-
-            # Fase 7: Análise técnica detalhada
-            print(">> Fase 7: Analisando requisitos técnicos...")
-            min_reqs = {}
-            rec_reqs = {}
-
-            try:
-                sys_req = self.driver.find_element(By.CLASS_NAME, "sysreq_contents")
-                
-                # Análise de requisitos mínimos
+            # Fase 1: Busca direta pelo termo, aguardando os resultados
+            print("\n>> Fase 1: Localizando especificações...")
+            if app_id is not None:
+                game_url = f"{self.base_url}/app/{app_id}/"
+                logger.info(f"Fase 1 ignorada: appid {app_id} já conhecido")
+            else:
+                with timer.phase("busca"):
+                    first_result = self._navigate(
+                        f"{self.base_url}/search/?term={quote_plus(game_name)}",
+                        EC.presence_of_element_located((By.CLASS_NAME, "search_result_row"))
+                    )
+                    game_url = first_result.get_attribute("href")
+                logger.info("Fase 1 concluída: Especificações localizadas")
+
+            # Fase 2: Acesso à página do jogo
+            print(">> Fase 2: Processando dados primários...")
+            with timer.phase("pagina"):
+                self._navigate(game_url, EC.any_of(
+                    EC.presence_of_element_located((By.ID, "appHubAppName")),
+                    EC.presence_of_element_located((By.ID, "ageYear"))
+                ))
+            logger.info("Fase 2 concluída: Dados primários obtidos")
+
+            # Fase 3: Validação de acesso
+            with timer.phase("verificacao_idade"):
                 try:
-                    print("  > Processando especificações mínimas...")
-                    min_section = sys_req.find_element(By.CSS_SELECTOR, "div.game_area_sys_req_leftCol")
-                    min_reqs = self._parse_requirements_section(min_section)
-                    logger.info("Especificações mínimas processadas")
+                    age_gate = self.driver.find_elements(By.ID, "ageYear")
+                    if age_gate:
+                        print(">> Aplicando protocolo de validação...")
+                        age_gate[0].send_keys("1990")
+                        self.driver.find_element(By.CLASS_NAME, "btnv6_blue_hoverfade").click()
+                        self._wait_for(EC.presence_of_element_located((By.ID, "appHubAppName")))
+                        logger.info("Protocolo de validação concluído")
                 except:
-                    try:
-                        print("  > Processando especificações unificadas...")
-                        full_section = sys_req.find_element(By.CSS_SELECTOR, "div.game_area_sys_req_full")
-                        min_reqs = self._parse_requirements_section(full_section)
-                        logger.info("Especificações unificadas processadas")
-                    except:
-                        min_reqs = {"status": "Não disponível"}
-                        logger.warning("Especificações mínimas indisponíveis")
-
-                # Análise de requisitos recomendados
-                try:
-                    print("  > Processando especificações recomendadas...")
-                    rec_section = sys_req.find_element(By.CSS_SELECTOR, "div.game_area_sys_req_rightCol")
-                    rec_reqs = self._parse_requirements_section(rec_section)
-                    logger.info("Especificações recomendadas processadas")
-                except:
-                    rec_reqs = {"status": "Não disponível"}
-                    logger.warning("Especificações recomendadas indisponíveis")
+                    pass
 
-            except Exception as e:
-                logger.error(f"Falha na análise técnica: {str(e)}")
-                min_reqs = {"status": "Não disponível"}
-                rec_reqs = {"status": "Não disponível"}
-                print("✗ Falha na análise de requisitos técnicos")
+            with timer.phase("extracao"):
+                requirements = self._extract_requirements(game_url)
 
             print("\n✓ Análise técnica concluída com sucesso!")
-            return GameRequirements(
-                minimum=min_reqs,
-                recommended=rec_reqs,
-                source_url=game_url,
-                price=price,
-                title=title
-            )
+            logger.info(f"Tempos por fase: {timer.report()}")
+            return requirements
 
         except Exception as e:
             error_msg = f"Falha no processo de análise: {str(e)}"
@@ -183,31 +155,61 @@ class GameSystemRequirements:
             print(f"\n✗ {error_msg}")
             return None
 
-    def _parse_requirements_section(self, section) -> Dict[str, str]:
+    def _navigate(self, url: str, ready_condition):
         """
-        Processa e estrutura as especificações técnicas.
-        
+        Navega para a URL e aguarda a página ficar pronta, aplicando a pausa de
+        cortesia se configurada e registrando as métricas da navegação.
+
         Args:
-            section: Seção contendo especificações
-            
+            url: URL de destino
+            ready_condition: Condição do expected_conditions que indica a página pronta
+
         Returns:
-            Dicionário com especificações processadas
+            Resultado da condição (ex: o elemento encontrado)
         """
-        requirements = {}
-        
-        try:
-            text = section.text
-            lines = text.split('\n')
-            for line in lines:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    requirements[key.strip()] = value.strip()
-            
-            if not requirements:
-                requirements["raw"] = text.strip()
-            
-            return requirements
-            
-        except Exception as e:
-            logger.error(f"Erro no processamento: {str(e)}")
-            return {"status": "Não disponível"}
+        if self.politeness_delay > 0:
+            time.sleep(random.uniform(self.politeness_delay * 0.5, self.politeness_delay * 1.5))
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        start = time.perf_counter()
+        self.driver.get(url)
+        result = self._wait_for(ready_condition)
+        self.navigations.append(record_navigation(self.driver, url, start))
+        return result
+
+    def _wait_for(self, condition):
+        """
+        Aguarda uma condição de prontidão da página.
+
+        Args:
+            condition: Condição do expected_conditions
+
+        Returns:
+            Resultado da condição (ex: o elemento encontrado)
+        """
+        return WebDriverWait(self.driver, self.page_timeout, poll_frequency=0.1).until(condition)
+
+    def _extract_requirements(self, game_url: str) -> GameRequirements:
+        """
+        Extrai título, preço e requisitos da página do jogo já carregada.
+
+        Lê o `page_source` uma única vez e processa tudo com o lxml, em vez de
+        uma chamada ao WebDriver para cada elemento.
+
+        Args:
+            game_url: URL da página do jogo
+
+        Returns:
+            GameRequirements com os dados da página
+        """
+        print("\n>> Fase 4: Extraindo metadados e requisitos técnicos...")
+        requirements = parse_app_page(self.driver.page_source, game_url)
+        if requirements is None:
+            raise ValueError("Página do jogo sem título")
+
+        if requirements.minimum.get("status") == "Não disponível":
+            logger.warning("Especificações mínimas indisponíveis")
+        if requirements.recommended.get("status") == "Não disponível":
+            logger.warning("Especificações recomendadas indisponíveis")
+        logger.info(f"Dados extraídos da página (preço: {requirements.price})")
+        return requirements
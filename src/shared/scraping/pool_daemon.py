@@ -0,0 +1,227 @@
+from dataclasses import asdict
+from typing import Any, Dict, Optional
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+
+from .game_requirements import GameRequirements
+from .webdriver_pool import WebDriverPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "game-spec-analyzer-pool.sock")
+SCRAPE_TIMEOUT_MARGIN = 120.0  # segundos da busca na Steam depois de obter o navegador
+
+
+def default_socket_path() -> str:
+    """Caminho do socket do daemon (pode ser alterado via WEBDRIVER_POOL_SOCKET)."""
+    return os.getenv("WEBDRIVER_POOL_SOCKET") or DEFAULT_SOCKET_PATH
+
+
+def unix_sockets_supported() -> bool:
+    """Indica se a plataforma suporta sockets Unix."""
+    return hasattr(socket, "AF_UNIX") and hasattr(socketserver, "UnixStreamServer")
+
+
+class _PoolRequestHandler(socketserver.StreamRequestHandler):
+    """Processa uma requisição JSON por linha e responde com uma linha JSON."""
+
+    def handle(self):
+        daemon: "PoolDaemon" = self.server.pool_daemon
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            daemon.touch(active=1)
+            try:
+                response = daemon.dispatch(json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            finally:
+                daemon.touch(active=-1)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, getattr(socketserver, "UnixStreamServer", object)):
+    daemon_threads = True
+
+
+class PoolDaemon:
+    """
+    Daemon local que mantém um WebDriverPool aquecido e atende processos
+    curtos do `main.py` através de um socket Unix.
+
+    Cada requisição de requisitos pega um navegador emprestado do pool,
+    executa a busca e devolve o GameRequirements serializado em JSON.
+    """
+
+    def __init__(self, pool: WebDriverPool, socket_path: Optional[str] = None,
+                 max_idle: float = 900.0, health_interval: float = 60.0):
+        """
+        Inicializa o daemon.
+
+        Args:
+            pool: Pool de navegadores (ainda não iniciado)
+            socket_path: Caminho do socket Unix
+            max_idle: Segundos sem requisições até o daemon encerrar sozinho
+            health_interval: Intervalo do health check dos navegadores livres
+        """
+        if not unix_sockets_supported():
+            raise RuntimeError("Sockets Unix não são suportados nesta plataforma")
+        self.pool = pool
+        self.socket_path = socket_path or default_socket_path()
+        self.max_idle = max_idle
+        self.health_interval = health_interval
+        self._server: Optional[_ThreadingUnixServer] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._active = 0
+        self._last_activity = time.monotonic()
+        self._requests = 0
+
+    def touch(self, active: int = 0):
+        """Registra atividade (início ou fim de uma requisição)."""
+        with self._lock:
+            self._active += active
+            self._last_activity = time.monotonic()
+            if active > 0:
+                self._requests += 1
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executa uma operação do protocolo.
+
+        Operações: ping, stats, requirements (campo "game") e shutdown.
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True}
+        if op == "stats":
+            return {"ok": True, "result": {**self.pool.stats(), "requests": self._requests}}
+        if op == "shutdown":
+            self._stop.set()
+            return {"ok": True}
+        if op == "requirements":
+            with self.pool.lease(timeout=request.get("timeout")) as scraper:
+                requirements = scraper.get_game_requirements(request["game"], app_id=request.get("app_id"))
+            return {"ok": True, "result": asdict(requirements) if requirements else None}
+        return {"ok": False, "error": f"Operação desconhecida: {op}"}
+
+    def serve_forever(self):
+        """Inicia o pool e atende requisições até ficar ocioso ou receber shutdown."""
+        self._remove_stale_socket()
+        print(f"\n>> Iniciando pool com {self.pool.size} navegadores...")
+        self.pool.start()
+
+        self._server = _ThreadingUnixServer(self.socket_path, _PoolRequestHandler)
+        self._server.pool_daemon = self
+        # O socket fica no diretório temporário compartilhado: só o dono usa o pool
+        os.chmod(self.socket_path, 0o600)
+        server_thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        server_thread.start()
+        print(f"✓ Pool pronto em {self.socket_path}")
+
+        last_health_check = time.monotonic()
+        try:
+            while not self._stop.wait(1.0):
+                now = time.monotonic()
+                with self._lock:
+                    idle_for = now - self._last_activity if self._active == 0 else 0.0
+                if idle_for >= self.max_idle:
+                    logger.info(f"Daemon ocioso por {idle_for:.0f}s, encerrando")
+                    break
+                if now - last_health_check >= self.health_interval:
+                    self.pool.check_idle()
+                    last_health_check = now
+        except KeyboardInterrupt:
+            pass
+        finally:
+            print("\n>> Encerrando pool...")
+            self._server.shutdown()
+            self._server.server_close()
+            self.pool.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            print("✓ Pool encerrado")
+
+    def _remove_stale_socket(self):
+        if not os.path.exists(self.socket_path):
+            return
+        if PoolClient(self.socket_path).ping():
+            raise RuntimeError(f"Já existe um daemon ativo em {self.socket_path}")
+        os.unlink(self.socket_path)
+
+
+class PoolClient:
+    """Cliente do PoolDaemon usado pelos processos do CLI."""
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 120.0):
+        """
+        Inicializa o cliente.
+
+        Args:
+            socket_path: Caminho do socket Unix do daemon
+            timeout: Tempo máximo de espera por um navegador livre do pool; a
+                resposta de uma busca é aguardada por esse tempo mais
+                SCRAPE_TIMEOUT_MARGIN
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+
+    def is_available(self) -> bool:
+        """Indica se há um daemon escutando no socket."""
+        return unix_sockets_supported() and os.path.exists(self.socket_path) and self.ping()
+
+    def ping(self) -> bool:
+        """Verifica se o daemon responde."""
+        try:
+            return self._request({"op": "ping"}, timeout=2.0).get("ok", False)
+        except (OSError, ValueError):
+            # Sem daemon, ou outro processo respondendo algo que não é JSON
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores do pool."""
+        return self._request({"op": "stats"})["result"]
+
+    def shutdown(self):
+        """Pede ao daemon para encerrar."""
+        self._request({"op": "shutdown"})
+
+    def get_game_requirements(self, game_name: str, app_id: Optional[int] = None) -> Optional[GameRequirements]:
+        """
+        Busca os requisitos do jogo usando um navegador do daemon.
+
+        Args:
+            game_name: Nome do jogo
+            app_id: Appid já conhecido (opcional)
+
+        Returns:
+            GameRequirements se encontrado, None caso contrário
+        """
+        response = self._request({
+            "op": "requirements",
+            "game": game_name,
+            "app_id": app_id,
+            "timeout": self.timeout
+        }, timeout=self.timeout + SCRAPE_TIMEOUT_MARGIN)
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "Erro desconhecido no daemon"))
+        result = response.get("result")
+        return GameRequirements(**result) if result else None
+
+    def _request(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout or self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise ConnectionError("Daemon encerrou a conexão sem responder")
+        return json.loads(line)
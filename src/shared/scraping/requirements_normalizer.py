@@ -0,0 +1,241 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import re
+import unicodedata
+
+from .game_requirements import GameRequirements
+
+# Prefixos das chaves de requisitos nos idiomas em que a Steam é exibida
+_KEY_PATTERNS = [
+    ("os", re.compile(r"^(so|os|sistema operacional|sistema operativo|systeme d exploitation|betriebssystem)\b")),
+    ("cpu", re.compile(r"^(processador|processor|procesador|processeur|prozessor|cpu)\b")),
+    ("ram", re.compile(r"^(memoria|memory|memoire|arbeitsspeicher|ram)\b")),
+    ("gpu", re.compile(r"^(placa de video|video|graphics|graficos|tarjeta grafica|carte graphique|grafik|gpu|video card)\b")),
+    ("directx", re.compile(r"^(directx|dx)\b")),
+    ("storage", re.compile(
+        r"^(armazenamento|storage|hard drive|hard disk|disco rigido|almacenamiento|espace disque|stockage"
+        r"|speicherplatz|festplatte|disk space|hdd)\b"
+    )),
+]
+
+_SIZE_PATTERN = re.compile(r"(\d+(?:[.,]\d+)?)\s*(tb|to|gb|go|gib|mb|mo|mib)\b")
+_DIRECTX_PATTERN = re.compile(r"(?:directx|dx|versao|version|versión)?\s*:?\s*(\d{1,2})(?:\.\d)?\b")
+_RAW_RAM_PATTERN = re.compile(r"(\d+(?:[.,]\d+)?)\s*(gb|mb)\s*(?:de\s*)?(?:ram|memoria|memory)")
+
+_CPU_PATTERNS = [
+    (re.compile(r"\bcore\s*(?:tm\s*)?(i[3579])[\s-]*(\d{3,5}[a-z]{0,2})\b"), "{0}-{1}"),
+    (re.compile(r"\b(i[3579])[\s-](\d{3,5}[a-z]{0,2})\b"), "{0}-{1}"),
+    (re.compile(r"\bcore\s+ultra\s+([3579])\s+(\d{3}[a-z]{0,2})\b"), "core ultra {0} {1}"),
+    (re.compile(r"\bcore\s*2\s*(duo|quad)(?:\s+([a-z]?\d{3,4}))?"), "core 2 {0} {1}"),
+    (re.compile(r"\bryzen\s*([3579])\s*(?:pro\s*)?(\d{4}[a-z0-9]{0,3})\b"), "ryzen {0} {1}"),
+    (re.compile(r"\bfx[\s-]*(\d{4})\b"), "fx-{0}"),
+    (re.compile(r"\bphenom\s*(ii)?\s*x([2346])\s*(\d{3,4})?"), "phenom {0} x{1} {2}"),
+    (re.compile(r"\bathlon\s*(ii\s*)?(?:x([234])\s*)?(\d{3,4}[a-z]?)?"), "athlon {0}x{1} {2}"),
+    (re.compile(r"\b(pentium|celeron|xeon)\s*([a-z]?\d{3,5}[a-z]?)?"), "{0} {1}"),
+]
+
+_GPU_PATTERNS = [
+    (re.compile(r"\b(rtx|gtx|gts|gt)\s*(\d{3,4})\s*(ti|super)?\b"), "{0} {1} {2}"),
+    (re.compile(r"\bgeforce\s*(\d{3,4})\s*(gtx|gts|gt)?\b"), "geforce {0} {1}"),
+    (re.compile(r"\b(rx)\s*(\d{3,4})\s*(xtx|xt|gre)?\b"), "{0} {1} {2}"),
+    (re.compile(r"\b(r[579])\s*(\d{3})x?\b"), "{0} {1}"),
+    (re.compile(r"\bradeon\s*(?:rx\s*)?vega\s*(\d{1,2})\b"), "vega {0}"),
+    (re.compile(r"\b(?:radeon\s*)?(hd)\s*(?:graphics\s*)?(\d{3,4})\b"), "{0} {1}"),
+    (re.compile(r"\barc\s*(a\d{3}m?)\b"), "arc {0}"),
+    (re.compile(r"\b(uhd|iris\s*xe|iris\s*plus|iris)\s*(?:graphics\s*)?(\d{3,4})?\b"), "{0} {1}"),
+]
+
+
+@dataclass(frozen=True)
+class NormalizedRequirements:
+    """Requisitos de uma seção (mínimos ou recomendados) em campos comparáveis."""
+    os: Optional[str] = None
+    os_64bit: bool = False
+    ram_gb: Optional[float] = None
+    vram_gb: Optional[float] = None
+    storage_gb: Optional[float] = None
+    storage_ssd: bool = False
+    directx: Optional[int] = None
+    cpu_text: Optional[str] = None
+    gpu_text: Optional[str] = None
+    cpu_models: Tuple[str, ...] = ()   # ex: ("i5-3570k", "fx-8350")
+    gpu_models: Tuple[str, ...] = ()   # ex: ("gtx 970", "r9 290")
+
+    @property
+    def is_empty(self) -> bool:
+        """Indica se nenhum campo foi reconhecido."""
+        return self == EMPTY_REQUIREMENTS
+
+
+EMPTY_REQUIREMENTS = NormalizedRequirements()
+
+# Pares (campo, valor) imutáveis: as funções memoizadas devolvem o mesmo
+# objeto a todos os chamadores, então ele não pode ser um dict
+_Fields = Tuple[Tuple[str, object], ...]
+
+
+def _fold(text: str) -> str:
+    """Minúsculas sem acentos, com espaços simples."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    ascii_only = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(ascii_only.replace("®", " ").replace("™", " ").split())
+
+
+@lru_cache(maxsize=512)
+def classify_key(key: str) -> Optional[str]:
+    """
+    Identifica a categoria de uma chave de requisito em qualquer idioma.
+
+    Args:
+        key: Chave como aparece na Steam ("Memória", "Placa de vídeo", "OS *")
+
+    Returns:
+        "os", "cpu", "ram", "gpu", "directx", "storage" ou None
+    """
+    folded = re.sub(r"[^a-z ]", " ", _fold(key)).strip()
+    folded = " ".join(folded.split())
+    for category, pattern in _KEY_PATTERNS:
+        if pattern.match(folded):
+            return category
+    return None
+
+
+def _size_gb(text: str) -> Optional[float]:
+    match = _SIZE_PATTERN.search(text)
+    if not match:
+        return None
+    value = float(match.group(1).replace(",", "."))
+    unit = match.group(2)
+    if unit in ("tb", "to"):
+        return value * 1024
+    if unit in ("mb", "mo", "mib"):
+        return round(value / 1024, 2)
+    return value
+
+
+def _extract_models(text: str, patterns) -> Tuple[str, ...]:
+    models = []
+    for pattern, template in patterns:
+        for match in pattern.finditer(text):
+            groups = [group or "" for group in match.groups()]
+            model = " ".join(template.format(*groups).split()).replace(" -", "-")
+            if model and model not in models:
+                models.append(model)
+    return tuple(models)
+
+
+@lru_cache(maxsize=4096)
+def extract_cpu_models(text: str) -> Tuple[str, ...]:
+    """
+    Extrai modelos de processador de um texto livre.
+
+    Aceita tanto requisitos da Steam quanto nomes como os de SystemSpecs
+    ("13th Gen Intel(R) Core(TM) i7-13620H"), no mesmo formato de cpu_models.
+    """
+    return _extract_models(_fold(text), _CPU_PATTERNS)
+
+
+@lru_cache(maxsize=4096)
+def extract_gpu_models(text: str) -> Tuple[str, ...]:
+    """
+    Extrai modelos de placa de vídeo de um texto livre, no mesmo formato de
+    gpu_models (ex: "NVIDIA GeForce RTX 4050 Laptop GPU" -> ("rtx 4050",)).
+    """
+    return _extract_models(_fold(text), _GPU_PATTERNS)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_value(category: str, value: str) -> _Fields:
+    """Converte um valor de requisito nos campos da sua categoria (memoizado)."""
+    return tuple(_value_fields(category, value).items())
+
+
+def _value_fields(category: str, value: str) -> Dict[str, object]:
+    folded = _fold(value)
+    if category == "os":
+        return {"os": value.strip(), "os_64bit": "64" in folded}
+    if category == "ram":
+        return {"ram_gb": _size_gb(folded)}
+    if category == "storage":
+        return {"storage_gb": _size_gb(folded), "storage_ssd": "ssd" in folded}
+    if category == "directx":
+        match = _DIRECTX_PATTERN.search(folded)
+        return {"directx": int(match.group(1)) if match else None}
+    if category == "cpu":
+        return {"cpu_text": value.strip(), "cpu_models": _extract_models(folded, _CPU_PATTERNS)}
+    if category == "gpu":
+        fields = {"gpu_text": value.strip(), "gpu_models": _extract_models(folded, _GPU_PATTERNS)}
+        vram = _size_gb(folded)
+        if vram is not None and vram <= 48:
+            fields["vram_gb"] = vram
+        if "directx" in folded or "dx1" in folded:
+            match = re.search(r"(?:directx|dx)\s*(\d{1,2})", folded)
+            if match:
+                fields["directx"] = int(match.group(1))
+        return fields
+    return {}
+
+
+@lru_cache(maxsize=1024)
+def _normalize_raw(text: str) -> _Fields:
+    """Extrai o que for possível de uma seção sem chaves (campo "raw")."""
+    folded = _fold(text)
+    fields: Dict[str, object] = {
+        "cpu_models": _extract_models(folded, _CPU_PATTERNS),
+        "gpu_models": _extract_models(folded, _GPU_PATTERNS),
+    }
+    ram = _RAW_RAM_PATTERN.search(folded)
+    if ram:
+        fields["ram_gb"] = _size_gb(f"{ram.group(1)} {ram.group(2)}")
+    return tuple(fields.items())
+
+
+def normalize_requirements(section: Optional[Dict[str, str]]) -> NormalizedRequirements:
+    """
+    Converte um dicionário de requisitos da Steam em campos tipados.
+
+    Args:
+        section: Dicionário produzido pelo scraper (mínimos ou recomendados)
+
+    Returns:
+        NormalizedRequirements; vazio se a seção estiver indisponível
+    """
+    if not section:
+        return EMPTY_REQUIREMENTS
+
+    fields: Dict[str, object] = {}
+    for key, value in section.items():
+        if key == "status":
+            continue
+        if key == "raw":
+            parsed = _normalize_raw(value)
+        else:
+            category = classify_key(key)
+            if category is None:
+                continue
+            parsed = _normalize_value(category, value)
+        for name, parsed_value in parsed:
+            # O primeiro valor encontrado para cada campo prevalece
+            if parsed_value not in (None, (), False) and name not in fields:
+                fields[name] = parsed_value
+
+    return NormalizedRequirements(**fields) if fields else EMPTY_REQUIREMENTS
+
+
+def normalize_game_requirements(
+    requirements: GameRequirements
+) -> Tuple[NormalizedRequirements, NormalizedRequirements]:
+    """
+    Normaliza os requisitos mínimos e recomendados de um jogo.
+
+    Args:
+        requirements: Requisitos obtidos da Steam
+
+    Returns:
+        Tupla (mínimos, recomendados)
+    """
+    return (
+        normalize_requirements(requirements.minimum),
+        normalize_requirements(requirements.recommended)
+    )
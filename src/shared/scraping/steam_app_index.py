@@ -0,0 +1,188 @@
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import os
+import pickle
+
+from .steam_ids import normalize_game_name
+
+INDEX_FORMAT_VERSION = 2   # 2 salva também o índice de trigramas
+MIN_FUZZY_SCORE = 0.6
+
+
+def _trigrams(normalized: str) -> List[str]:
+    padded = f"  {normalized} "
+    return list({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+class SteamAppIndex:
+    """
+    Índice local de nomes de apps da Steam para appids.
+
+    Os appids ficam em um `array('I')` e os nomes normalizados em uma lista
+    paralela. A busca exata é um acesso a dicionário; a busca aproximada usa
+    um índice de trigramas com pontuação Dice e bônus para prefixos.
+    """
+
+    def __init__(self, app_ids: Iterable[int], names: Iterable[str]):
+        """
+        Inicializa o índice.
+
+        Args:
+            app_ids: Appids, na mesma ordem de `names`
+            names: Nomes originais dos apps
+        """
+        self.app_ids = array('I')
+        self.names: List[str] = []
+        self.normalized: List[str] = []
+        self._exact: Dict[str, int] = {}
+
+        # Ordena por appid: nomes repetidos ficam com o app mais antigo,
+        # que normalmente é o jogo base e não uma edição ou DLC
+        for app_id, name in sorted(zip(app_ids, names)):
+            normalized = normalize_game_name(name)
+            if not normalized:
+                continue
+            position = len(self.names)
+            self.app_ids.append(app_id)
+            self.names.append(name)
+            self.normalized.append(normalized)
+            self._exact.setdefault(normalized, position)
+
+        self._trigram_index: Optional[Dict[str, array]] = None
+
+    def __len__(self) -> int:
+        return len(self.app_ids)
+
+    @classmethod
+    def from_app_list(cls, path: str) -> "SteamAppIndex":
+        """
+        Cria o índice a partir de um arquivo JSON de lista de apps.
+
+        Aceita o formato da API GetAppList ({"applist": {"apps": [...]}}),
+        {"apps": [...]} ou uma lista de objetos com "appid" e "name".
+
+        Args:
+            path: Caminho do arquivo JSON
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("applist", data).get("apps", [])
+
+        app_ids, names = [], []
+        for app in data:
+            name = (app.get("name") or "").strip()
+            if name:
+                app_ids.append(int(app["appid"]))
+                names.append(name)
+        return cls(app_ids, names)
+
+    @classmethod
+    def load(cls, path: str) -> "SteamAppIndex":
+        """
+        Carrega um índice salvo com `save`.
+
+        O índice de trigramas vem pronto do arquivo; índices da versão 1,
+        salvos sem ele, ainda são aceitos e o constroem na primeira busca
+        aproximada.
+        """
+        with open(path, "rb") as f:
+            version, *fields = pickle.load(f)
+        if version == INDEX_FORMAT_VERSION:
+            app_ids, names, normalized, trigram_index = fields
+        elif version == 1:
+            (app_ids, names, normalized), trigram_index = fields, None
+        else:
+            raise ValueError(f"Versão de índice incompatível: {version}")
+
+        index = cls.__new__(cls)
+        index.app_ids = app_ids
+        index.names = names
+        index.normalized = normalized
+        index._exact = {}
+        for position, key in enumerate(normalized):
+            index._exact.setdefault(key, position)
+        index._trigram_index = trigram_index
+        return index
+
+    def save(self, path: str):
+        """Salva o índice em formato compacto, já com o índice de trigramas."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(
+                (INDEX_FORMAT_VERSION, self.app_ids, self.names, self.normalized, self._get_trigram_index()),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+    def lookup(self, game_name: str) -> Optional[Tuple[int, str]]:
+        """
+        Resolve o nome do jogo para (appid, nome_na_steam).
+
+        Tenta a correspondência exata do nome normalizado e, se não houver,
+        a melhor correspondência aproximada acima de MIN_FUZZY_SCORE.
+
+        Args:
+            game_name: Nome do jogo
+
+        Returns:
+            Tupla (appid, nome) ou None se não houver correspondência confiável
+        """
+        position = self._exact.get(normalize_game_name(game_name))
+        if position is not None:
+            return self.app_ids[position], self.names[position]
+
+        matches = self.search(game_name, limit=1)
+        if matches and matches[0][2] >= MIN_FUZZY_SCORE:
+            return matches[0][0], matches[0][1]
+        return None
+
+    def search(self, game_name: str, limit: int = 5) -> List[Tuple[int, str, float]]:
+        """
+        Busca aproximada por trigramas.
+
+        Args:
+            game_name: Nome do jogo
+            limit: Número máximo de resultados
+
+        Returns:
+            Lista de (appid, nome, pontuação entre 0 e 1), da melhor para a pior
+        """
+        query = normalize_game_name(game_name)
+        if not query:
+            return []
+        query_grams = _trigrams(query)
+        index = self._get_trigram_index()
+
+        hits: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for position in index.get(gram, ()):
+                hits[position] += 1
+
+        scored = []
+        for position, common in hits.items():
+            candidate = self.normalized[position]
+            score = 2 * common / (len(query) + len(candidate) + 2)
+            if candidate.startswith(query):
+                score = min(1.0, score + 0.1)
+            scored.append((score, -len(candidate), position))
+
+        scored.sort(reverse=True)
+        return [
+            (self.app_ids[position], self.names[position], round(score, 3))
+            for score, _, position in scored[:limit]
+        ]
+
+    def _get_trigram_index(self) -> Dict[str, array]:
+        # Construído na primeira busca aproximada ou ao salvar
+        if self._trigram_index is None:
+            index: Dict[str, array] = defaultdict(lambda: array('I'))
+            for position, normalized in enumerate(self.normalized):
+                for gram in _trigrams(normalized):
+                    index[gram].append(position)
+            self._trigram_index = dict(index)
+        return self._trigram_index
@@ -0,0 +1,143 @@
+from typing import Dict, Optional
+import logging
+
+import requests
+
+from src.shared.utils import TokenBucket
+from .game_requirements import GameRequirements
+from .steam_ids import steam_app_id_from_url, steam_store_url
+from .steam_page_parser import parse_app_page, parse_search_results
+
+logger = logging.getLogger(__name__)
+
+# Cookies que liberam a verificação de idade da Steam sem interação
+AGE_GATE_COOKIES = {
+    "birthtime": "631152001",          # 01/01/1990
+    "lastagecheckage": "1-0-1990",
+    "wants_mature_content": "1",
+    "mature_content": "1",
+}
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+    ),
+    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+}
+
+
+class SteamHttpFetcher:
+    """
+    Busca requisitos de jogos na Steam apenas via HTTP, sem navegador.
+
+    A busca e a página do app são HTML estático, então uma sessão `requests`
+    com os cookies da verificação de idade é suficiente na maioria dos casos.
+    Quando algo falha, retorna None para que o chamador use o navegador.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0,
+                 session: Optional[requests.Session] = None,
+                 rate_limiter: Optional[TokenBucket] = None):
+        """
+        Inicializa o fetcher.
+
+        Args:
+            base_url: URL base da loja (padrão: STEAM_BASE_URL ou a loja da Steam)
+            timeout: Tempo máximo de cada requisição em segundos
+            session: Sessão HTTP reutilizável (opcional)
+            rate_limiter: Limitador compartilhado aplicado antes de cada requisição
+        """
+        self.base_url = (base_url or steam_store_url()).rstrip("/")
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        for name, value in AGE_GATE_COOKIES.items():
+            self.session.cookies.set(name, value)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Fecha a sessão HTTP."""
+        self.session.close()
+
+    def _get(self, url: str, params: Optional[Dict[str, str]] = None) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        # A Steam sempre serve UTF-8; evita o fallback ISO-8859-1 do requests
+        if "charset" not in response.headers.get("Content-Type", ""):
+            response.encoding = "utf-8"
+        return response
+
+    def search_app_url(self, game_name: str) -> Optional[str]:
+        """
+        Busca o jogo na Steam e retorna a URL do primeiro resultado.
+
+        Args:
+            game_name: Nome do jogo
+
+        Returns:
+            URL da página do app ou None se não houver resultados
+        """
+        response = self._get(f"{self.base_url}/search/", params={"term": game_name})
+        results = parse_search_results(response.text, response.url)
+        return results[0] if results else None
+
+    def fetch_app_page(self, app_url: str) -> Optional[str]:
+        """
+        Carrega a página do app, contornando a verificação de idade.
+
+        Args:
+            app_url: URL da página do app
+
+        Returns:
+            HTML da página ou None se a verificação de idade persistir
+        """
+        response = self._get(app_url)
+        if "/agecheck/" in response.url:
+            # Alguns apps ignoram os cookies na primeira visita; tenta de novo
+            app_id = steam_app_id_from_url(app_url)
+            if app_id is None:
+                return None
+            response = self._get(f"{self.base_url}/app/{app_id}/")
+            if "/agecheck/" in response.url:
+                return None
+        return response.text
+
+    def get_game_requirements(self, game_name: str, app_id: Optional[int] = None) -> Optional[GameRequirements]:
+        """
+        Obtém os requisitos do jogo sem abrir o navegador.
+
+        Args:
+            game_name: Nome do jogo
+            app_id: Appid já conhecido; pula a busca e vai direto para a página do app
+
+        Returns:
+            GameRequirements se encontrado, None caso contrário
+        """
+        try:
+            if app_id is not None:
+                app_url = f"{self.base_url}/app/{app_id}/"
+            else:
+                app_url = self.search_app_url(game_name)
+            if not app_url:
+                logger.info(f"Busca HTTP sem resultados para: {game_name}")
+                return None
+
+            page_html = self.fetch_app_page(app_url)
+            if page_html is None:
+                logger.info(f"Verificação de idade bloqueou a busca HTTP: {app_url}")
+                return None
+
+            return parse_app_page(page_html, app_url)
+
+        except Exception as e:
+            logger.warning(f"Falha na busca HTTP de requisitos: {str(e)}")
+            return None
@@ -0,0 +1,33 @@
+from typing import Optional
+import os
+import re
+import unicodedata
+
+STEAM_STORE_URL = "https://store.steampowered.com"
+_APP_ID_PATTERN = re.compile(r"/app/(\d+)")
+_NON_ALNUM_PATTERN = re.compile(r"[^0-9a-z]+")
+
+
+def steam_store_url() -> str:
+    """URL base da loja Steam (pode ser alterada via STEAM_BASE_URL, ex: um servidor local)."""
+    return (os.getenv("STEAM_BASE_URL") or STEAM_STORE_URL).rstrip("/")
+
+
+def steam_app_id_from_url(url: Optional[str]) -> Optional[int]:
+    """Extrai o appid de uma URL da loja Steam (ex: /app/1091500/...)."""
+    if not url:
+        return None
+    match = _APP_ID_PATTERN.search(url)
+    return int(match.group(1)) if match else None
+
+
+def normalize_game_name(name: str) -> str:
+    """
+    Normaliza o nome de um jogo para comparação e uso como chave.
+
+    Remove acentos, símbolos (™, ®, :) e espaços repetidos:
+    "DOOM Eternal™" -> "doom eternal".
+    """
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    ascii_only = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM_PATTERN.sub(" ", ascii_only).strip()
@@ -0,0 +1,167 @@
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from lxml import etree, html as lxml_html
+
+from .game_requirements import GameRequirements
+from .steam_ids import steam_app_id_from_url
+
+UNAVAILABLE = {"status": "Não disponível"}
+
+# Rótulos de preço de jogos gratuitos ("Free to Play", "Gratuito para jogar")
+FREE_PRICE_LABELS = ("Free", "Gratuito")
+
+
+def _has_class(name: str) -> str:
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# XPaths pré-compiladas: cada página é percorrida uma única vez pelo lxml
+_TITLE = etree.XPath('//*[@id="appHubAppName"]')
+_DISCOUNT_FINAL = etree.XPath(f'(//*[{_has_class("discount_final_price")}])[1]')
+_DISCOUNT_ORIGINAL = etree.XPath(f'(//*[{_has_class("discount_original_price")}])[1]')
+_PURCHASE_PRICE = etree.XPath(f'(//*[{_has_class("game_purchase_price")}])[1]')
+_SYSREQ = etree.XPath(f'(//*[{_has_class("sysreq_contents")}])[1]')
+_SYSREQ_LEFT = etree.XPath(f'(.//div[{_has_class("game_area_sys_req_leftCol")}])[1]')
+_SYSREQ_RIGHT = etree.XPath(f'(.//div[{_has_class("game_area_sys_req_rightCol")}])[1]')
+_SYSREQ_FULL = etree.XPath(f'(.//div[{_has_class("game_area_sys_req_full")}])[1]')
+_LIST_ITEMS = etree.XPath('.//li')
+_LINE_BREAKS = etree.XPath('.//br')
+_SEARCH_RESULTS = etree.XPath(f'//a[{_has_class("search_result_row")}]/@href')
+
+
+def _text(element) -> str:
+    """Texto do elemento com espaços normalizados, como o `.text` do Selenium."""
+    if element is None:
+        return ""
+    return " ".join("".join(element.itertext()).split())
+
+
+def _first(xpath, node):
+    result = xpath(node)
+    return result[0] if result else None
+
+
+def parse_requirement_lines(lines: List[str]) -> Dict[str, str]:
+    """
+    Converte linhas "Chave: valor" em dicionário.
+
+    Linhas sem valor, como o título da coluna ("MINIMUM:", "MÍNIMOS:"), são
+    ignoradas.
+
+    Args:
+        lines: Linhas de texto da seção de requisitos
+
+    Returns:
+        Dicionário de requisitos; {"raw": texto} se nenhuma linha tiver ':'
+    """
+    requirements = {}
+    for line in lines:
+        if ':' in line:
+            key, value = line.split(':', 1)
+            if value.strip():
+                requirements[key.strip()] = value.strip()
+
+    if not requirements:
+        text = "\n".join(line for line in lines if line).strip()
+        if not text:
+            return dict(UNAVAILABLE)
+        requirements["raw"] = text
+    return requirements
+
+
+def parse_requirements_section(section) -> Dict[str, str]:
+    """
+    Processa uma coluna de requisitos (mínimos, recomendados ou unificada).
+
+    Args:
+        section: Elemento lxml da coluna, ou None
+
+    Returns:
+        Dicionário com as especificações processadas
+    """
+    if section is None:
+        return dict(UNAVAILABLE)
+
+    lines = [_text(item) for item in _LIST_ITEMS(section)]
+    if not lines:
+        # Sem lista: quebra o texto nos <br>, como o navegador faz
+        for br in _LINE_BREAKS(section):
+            br.tail = "\n" + (br.tail or "")
+        lines = [" ".join(line.split()) for line in "".join(section.itertext()).split("\n")]
+    return parse_requirement_lines(lines)
+
+
+def parse_price(document) -> str:
+    """Extrai o preço (promocional, padrão, "Free" ou "TBD") da página do app."""
+    discounted = _first(_DISCOUNT_FINAL, document)
+    original = _first(_DISCOUNT_ORIGINAL, document)
+    if discounted is not None and original is not None:
+        return f"{_text(discounted)} (Original: {_text(original)})"
+
+    price_element = _first(_PURCHASE_PRICE, document)
+    if price_element is None:
+        return "TBD"
+    price = _text(price_element)
+    if not price or any(label in price for label in FREE_PRICE_LABELS):
+        return "Free"
+    return price
+
+
+def parse_app_page(page_html: str, url: str) -> Optional[GameRequirements]:
+    """
+    Extrai título, preço e requisitos da página de um app da Steam em uma
+    única passada pelo HTML.
+
+    Função pura: não acessa rede nem navegador, então pode ser testada e
+    medida com páginas salvas.
+
+    Args:
+        page_html: HTML da página do app
+        url: URL da página (vira source_url e fornece o appid)
+
+    Returns:
+        GameRequirements, ou None se a página não for a de um app
+        (ex: verificação de idade)
+    """
+    document = lxml_html.fromstring(page_html)
+
+    title_element = _first(_TITLE, document)
+    if title_element is None:
+        return None
+
+    sys_req = _first(_SYSREQ, document)
+    if sys_req is None:
+        min_reqs = dict(UNAVAILABLE)
+        rec_reqs = dict(UNAVAILABLE)
+    else:
+        # Usa apenas o primeiro bloco (normalmente Windows)
+        min_section = _first(_SYSREQ_LEFT, sys_req)
+        if min_section is None:
+            min_section = _first(_SYSREQ_FULL, sys_req)
+        min_reqs = parse_requirements_section(min_section)
+        rec_reqs = parse_requirements_section(_first(_SYSREQ_RIGHT, sys_req))
+
+    return GameRequirements(
+        minimum=min_reqs,
+        recommended=rec_reqs,
+        source_url=url,
+        price=parse_price(document),
+        title=_text(title_element),
+        app_id=steam_app_id_from_url(url)
+    )
+
+
+def parse_search_results(page_html: str, base_url: str) -> List[str]:
+    """
+    Extrai as URLs dos resultados de uma página de busca da Steam.
+
+    Args:
+        page_html: HTML da página de busca
+        base_url: URL da página, para resolver links relativos
+
+    Returns:
+        URLs absolutas das páginas dos apps, na ordem da busca
+    """
+    document = lxml_html.fromstring(page_html)
+    return [urljoin(base_url, href) for href in _SEARCH_RESULTS(document)]
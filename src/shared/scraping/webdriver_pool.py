@@ -0,0 +1,187 @@
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+import logging
+import queue
+import threading
+import time
+
+from .game_system_requirements import GameSystemRequirements
+
+logger = logging.getLogger(__name__)
+
+
+class PooledBrowser:
+    """Navegador do pool com o contador de páginas usado na reciclagem."""
+
+    def __init__(self, scraper: GameSystemRequirements):
+        self.scraper = scraper
+        self.pages = 0
+        self.created_at = time.monotonic()
+
+
+class WebDriverPool:
+    """
+    Mantém N instâncias aquecidas de GameSystemRequirements (Chrome headless).
+
+    Cada instância é reciclada depois de `max_pages` usos, para limitar o
+    crescimento de memória do Chrome, ou quando falha no health check. Se a
+    recriação falhar, a vaga é preenchida no próximo `lease()`.
+    """
+
+    def __init__(self, size: int = 2, max_pages: int = 50,
+                 factory: Callable[[], GameSystemRequirements] = GameSystemRequirements):
+        """
+        Inicializa o pool.
+
+        Args:
+            size: Número de navegadores mantidos abertos
+            max_pages: Número de jogos processados antes de reciclar um navegador
+            factory: Cria um novo scraper (ainda não iniciado)
+        """
+        self.size = size
+        self.max_pages = max_pages
+        self.factory = factory
+        self._idle: "queue.Queue[PooledBrowser]" = queue.Queue()
+        self._all: List[PooledBrowser] = []
+        self._lock = threading.Lock()
+        self._recycled = 0
+        self._spawning = 0
+        self._closed = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(self):
+        """Abre todos os navegadores do pool."""
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def close(self):
+        """Fecha todos os navegadores."""
+        with self._lock:
+            self._closed = True
+            browsers, self._all = self._all, []
+        for browser in browsers:
+            self._quit(browser)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """
+        Empresta um navegador do pool durante o bloco `with`.
+
+        Args:
+            timeout: Tempo máximo de espera por um navegador livre
+
+        Yields:
+            GameSystemRequirements pronto para uso
+        """
+        try:
+            browser = self._idle.get_nowait()
+        except queue.Empty:
+            browser = self._fill_vacancy()
+        if browser is None:
+            try:
+                browser = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError("Nenhum navegador livre no pool")
+
+        try:
+            yield browser.scraper
+        finally:
+            # get_game_requirements engole exceções, então o health check
+            # roda sempre para detectar um Chrome que travou no meio do uso
+            browser.pages += 1
+            self._release(browser, self.is_healthy(browser))
+
+    def is_healthy(self, browser: PooledBrowser) -> bool:
+        """Verifica se o navegador ainda responde."""
+        try:
+            return browser.scraper.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def check_idle(self):
+        """Executa o health check nos navegadores livres, reciclando os que falharem."""
+        for _ in range(self._idle.qsize()):
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._release(browser, self.is_healthy(browser))
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna contadores do pool."""
+        with self._lock:
+            pages = sum(browser.pages for browser in self._all)
+            total = len(self._all)
+        return {
+            "size": total,
+            "idle": self._idle.qsize(),
+            "pages": pages,
+            "recycled": self._recycled,
+        }
+
+    def _release(self, browser: PooledBrowser, healthy: bool):
+        if self._closed:
+            self._quit(browser)
+            return
+        if not healthy or browser.pages >= self.max_pages:
+            reason = "health check falhou" if not healthy else f"{browser.pages} páginas"
+            logger.info(f"Reciclando navegador do pool ({reason})")
+            self._quit(browser)
+            self._recycled += 1
+            try:
+                browser = self._spawn()
+            except Exception as e:
+                logger.error(f"Falha ao recriar navegador do pool: {str(e)}")
+                return
+        self._idle.put(browser)
+
+    def _fill_vacancy(self) -> Optional[PooledBrowser]:
+        """
+        Abre um navegador se o pool estiver abaixo de `size` (recriação que falhou).
+
+        Returns:
+            O novo navegador, ou None se o pool estiver completo
+
+        Raises:
+            Exception: Se a criação falhar e o pool não tiver nenhum navegador
+                para emprestar
+        """
+        with self._lock:
+            if self._closed or len(self._all) + self._spawning >= self.size:
+                return None
+            self._spawning += 1
+        try:
+            return self._spawn()
+        except Exception as e:
+            logger.error(f"Falha ao recriar navegador do pool: {str(e)}")
+            with self._lock:
+                empty = not self._all
+            if empty:
+                raise
+            return None
+        finally:
+            with self._lock:
+                self._spawning -= 1
+
+    def _spawn(self) -> PooledBrowser:
+        scraper = self.factory()
+        scraper.__enter__()
+        browser = PooledBrowser(scraper)
+        with self._lock:
+            self._all.append(browser)
+        return browser
+
+    def _quit(self, browser: PooledBrowser):
+        with self._lock:
+            if browser in self._all:
+                self._all.remove(browser)
+        try:
+            browser.scraper.__exit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"Erro ao fechar navegador do pool: {str(e)}")
@@ -0,0 +1,9 @@
+from .timing import PhaseTimer
+from .rate_limiter import TokenBucket
+from .incremental_json import IncrementalJsonParser
+from .cpu_load import CpuLoadSampler, CpuLoadStats, get_cpu_load_sampler
+
+__all__ = [
+    'PhaseTimer', 'TokenBucket', 'IncrementalJsonParser',
+    'CpuLoadSampler', 'CpuLoadStats', 'get_cpu_load_sampler'
+]
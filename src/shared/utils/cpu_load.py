@@ -0,0 +1,139 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, Tuple
+import threading
+import time
+
+import psutil
+
+DEFAULT_SAMPLE_INTERVAL = 0.5   # segundos entre amostras
+DEFAULT_WINDOW = 30.0           # segundos cobertos pela janela
+
+
+@dataclass(frozen=True)
+class CpuLoadStats:
+    """Uso da CPU (%) na janela do amostrador."""
+    minimum: float
+    average: float
+    maximum: float
+    samples: int
+
+
+class CpuLoadSampler:
+    """
+    Amostra o uso da CPU em segundo plano, mantendo uma janela deslizante.
+
+    Cada amostra é o uso desde a anterior (psutil.cpu_percent sem intervalo),
+    então coletar não bloqueia ninguém; a primeira, registrada já em
+    `start()`, cobre o tempo desde a importação do psutil. A soma corrente e duas filas
+    monotônicas dão média, mínimo e máximo da janela em O(1).
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL, window: float = DEFAULT_WINDOW):
+        """
+        Inicializa o amostrador (sem iniciar a thread).
+
+        Args:
+            interval: Segundos entre amostras
+            window: Segundos de histórico considerados nas estatísticas
+        """
+        self.interval = interval
+        self.window = window
+        self._samples: Deque[Tuple[float, float]] = deque()
+        self._minimums: Deque[Tuple[float, float]] = deque()   # valores crescentes
+        self._maximums: Deque[Tuple[float, float]] = deque()   # valores decrescentes
+        self._total = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "CpuLoadSampler":
+        """Inicia a thread de amostragem (idempotente)."""
+        with self._lock:
+            if self.running:
+                return self
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="cpu-load-sampler", daemon=True)
+            self._thread.start()
+        # Amostra imediata: as especificações costumam ser lidas logo após o início
+        self.add(psutil.cpu_percent(interval=None))
+        return self
+
+    def stop(self):
+        """Interrompe a amostragem; as amostras coletadas continuam disponíveis."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.add(psutil.cpu_percent(interval=None))
+
+    def add(self, value: float, timestamp: Optional[float] = None):
+        """Registra uma amostra (usado pela thread; útil também para alimentar a janela manualmente)."""
+        now = time.monotonic() if timestamp is None else timestamp
+        with self._lock:
+            self._samples.append((now, value))
+            self._total += value
+            while self._minimums and self._minimums[-1][1] >= value:
+                self._minimums.pop()
+            self._minimums.append((now, value))
+            while self._maximums and self._maximums[-1][1] <= value:
+                self._maximums.pop()
+            self._maximums.append((now, value))
+            self._expire(now)
+
+    def _expire(self, now: float):
+        limit = now - self.window
+        while self._samples and self._samples[0][0] < limit:
+            _, value = self._samples.popleft()
+            self._total -= value
+        while self._minimums and self._minimums[0][0] < limit:
+            self._minimums.popleft()
+        while self._maximums and self._maximums[0][0] < limit:
+            self._maximums.popleft()
+
+    def stats(self) -> Optional[CpuLoadStats]:
+        """Mínimo, média e máximo da janela, ou None se ainda não há amostras."""
+        with self._lock:
+            self._expire(time.monotonic())
+            if not self._samples:
+                return None
+            return CpuLoadStats(
+                minimum=self._minimums[0][1],
+                average=round(self._total / len(self._samples), 1),
+                maximum=self._maximums[0][1],
+                samples=len(self._samples)
+            )
+
+    def current(self) -> float:
+        """
+        Uso médio da CPU na janela.
+
+        Sem amostras na janela (amostrador parado), registra uma amostra na
+        hora, sem bloquear.
+        """
+        stats = self.stats()
+        if stats is not None:
+            return stats.average
+        value = psutil.cpu_percent(interval=None)
+        self.add(value)
+        return value
+
+
+_sampler: Optional[CpuLoadSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_cpu_load_sampler() -> CpuLoadSampler:
+    """Amostrador do processo, iniciado na primeira chamada."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = CpuLoadSampler()
+        return _sampler.start()
@@ -0,0 +1,123 @@
+from typing import Any, List, Optional, Tuple
+import json
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Frame:
+    """Objeto ou lista aberta durante a leitura."""
+
+    __slots__ = ("kind", "start", "key", "expecting_key")
+
+    def __init__(self, kind: str, start: int):
+        self.kind = kind                            # "object" ou "array"
+        self.start = start
+        self.key: Any = None if kind == "object" else 0
+        self.expecting_key = kind == "object"
+
+
+class IncrementalJsonParser:
+    """
+    Lê um documento JSON recebido em pedaços e informa cada valor assim que
+    ele termina, sem esperar o documento inteiro.
+
+    Texto antes do primeiro "{" (ex: "```json") e depois do fechamento do
+    objeto raiz é ignorado, como faz a extração por regex da resposta completa.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._started = False
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._string_is_key = False
+        self._scalar_start: Optional[int] = None
+        self.done = False
+        self.value: Any = None
+
+    def feed(self, chunk: str) -> List[Tuple[Tuple[Any, ...], Any]]:
+        """
+        Processa mais um pedaço do texto.
+
+        Args:
+            chunk: Próximo trecho do documento
+
+        Returns:
+            Lista de (caminho, valor) dos valores concluídos neste pedaço, em
+            ordem. O caminho é uma tupla de chaves e índices; () é a raiz.
+
+        Raises:
+            ValueError: Se o texto não for JSON válido
+        """
+        if self.done:
+            return []
+        self._buffer += chunk
+        events: List[Tuple[Tuple[Any, ...], Any]] = []
+        buffer = self._buffer
+
+        while self._pos < len(buffer) and not self.done:
+            pos = self._pos
+            char = buffer[pos]
+            self._pos += 1
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._stack.append(_Frame("object", pos))
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    text = json.loads(buffer[self._string_start:pos + 1])
+                    if self._string_is_key:
+                        frame = self._stack[-1]
+                        frame.key = text
+                        frame.expecting_key = False
+                    else:
+                        self._complete(text, events)
+                continue
+
+            if self._scalar_start is not None:
+                if char not in _WHITESPACE and char not in ",]}":
+                    continue
+                self._complete(json.loads(buffer[self._scalar_start:pos]), events)
+                self._scalar_start = None
+
+            if char in _WHITESPACE or char == ":":
+                continue
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+                top = self._stack[-1]
+                self._string_is_key = top.kind == "object" and top.expecting_key
+            elif char == "{":
+                self._stack.append(_Frame("object", pos))
+            elif char == "[":
+                self._stack.append(_Frame("array", pos))
+            elif char in "}]":
+                frame = self._stack.pop()
+                self._complete(json.loads(buffer[frame.start:pos + 1]), events)
+            elif char == ",":
+                top = self._stack[-1]
+                if top.kind == "object":
+                    top.expecting_key = True
+                else:
+                    top.key += 1
+            else:
+                self._scalar_start = pos
+
+        return events
+
+    def _complete(self, value: Any, events: List[Tuple[Tuple[Any, ...], Any]]):
+        events.append((tuple(frame.key for frame in self._stack), value))
+        if not self._stack:
+            self.done = True
+            self.value = value
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Limitador de taxa por token bucket, seguro entre threads.
+
+    Libera até `capacity` operações em rajada e, depois, `rate` operações por
+    segundo. Pode ser compartilhado entre threads (`acquire`) e corrotinas
+    (`acquire_async`).
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Inicializa o limitador.
+
+        Args:
+            rate: Tokens repostos por segundo
+            capacity: Máximo de tokens acumulados (tamanho da rajada)
+        """
+        if rate <= 0:
+            raise ValueError("rate deve ser positivo")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Consome um token; retorna quanto esperar até ele ficar disponível."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Bloqueia a thread até haver um token disponível."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Aguarda, sem bloquear o event loop, até haver um token disponível."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
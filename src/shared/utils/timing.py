@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+from typing import Dict
+import time
+
+
+class PhaseTimer:
+    """Mede a duração de fases nomeadas de um processo."""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Mede o tempo do bloco `with` e registra em `timings[name]`.
+
+        Args:
+            name: Nome da fase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def total(self) -> float:
+        """Soma das durações de todas as fases, em segundos."""
+        return sum(self.timings.values())
+
+    def report(self) -> str:
+        """Resumo legível, ex: 'busca: 0.42s, página: 1.10s'."""
+        return ", ".join(f"{name}: {seconds:.2f}s" for name, seconds in self.timings.items())
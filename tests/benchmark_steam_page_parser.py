@@ -0,0 +1,42 @@
+"""
+Mede o tempo de parse_app_page nas páginas salvas em tests/fixtures/steam.
+
+Uso (na raiz do projeto):
+    python -m tests.benchmark_steam_page_parser [--iterations 500]
+"""
+from pathlib import Path
+import argparse
+import statistics
+import time
+
+from src.shared.scraping import parse_app_page
+
+FIXTURES = Path(__file__).parent / "fixtures" / "steam"
+APP_URL = "https://store.steampowered.com/app/4242/Test_Quest/"
+
+
+def benchmark(page_html: str, iterations: int) -> list:
+    """Tempos de cada chamada, em milissegundos."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        parse_app_page(page_html, APP_URL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de extração das páginas salvas da Steam")
+    parser.add_argument('--iterations', type=int, default=500, help="Execuções por página")
+    args = parser.parse_args()
+
+    for path in sorted(FIXTURES.glob("app_*.html")):
+        timings = benchmark(path.read_text(encoding="utf-8"), args.iterations)
+        print(
+            f"{path.name}: mediana {statistics.median(timings):.3f} ms, "
+            f"p95 {statistics.quantiles(timings, n=20)[-1]:.3f} ms ({args.iterations} execuções)"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+from dataclasses import replace
+import importlib
+
+import pytest
+
+from src.services.spec_collectors import StorageDevice, SystemSpecs
+from src.shared.scraping import GameRequirements
+
+module = importlib.import_module("src.services.analyze_game_compatibility")
+
+SPECS = SystemSpecs(
+    cpu_name="AMD Ryzen 5 5600", cpu_cores=6, cpu_threads=12, cpu_freq_base=3.5, cpu_freq_max=4.4,
+    ram_total=16, ram_free=9, ram_used=7, gpu_name="NVIDIA GeForce RTX 3060",
+    storage_devices=[StorageDevice(name="/dev/nvme0n1p2", type="NVMe SSD", total=500, free=200, mount_point="/")],
+    os_name="Windows", os_version="11", cpu_load=12.5, cpu_temp=48.0, gpu_memory_total=12,
+    ram_type="DDR4", ram_speed=3200, directx_version="12"
+)
+REQUIREMENTS = GameRequirements(
+    minimum={'Processor': "Intel Core i5-8400", 'Memory': "8 GB RAM"},
+    recommended={'Processor': "Intel Core i7-8700", 'Memory': "16 GB RAM"},
+    source_url="https://store.steampowered.com/app/4242/"
+)
+
+
+def key(specs=SPECS, requirements=REQUIREMENTS, model="modelo-a", **kwargs):
+    return module.analysis_cache_key(specs, requirements, model, **kwargs)
+
+
+@pytest.mark.parametrize("field, value", [
+    ('cpu_name', "Intel Core i5-12400F"),
+    ('cpu_cores', 8),
+    ('cpu_threads', 16),
+    ('gpu_name', "AMD Radeon RX 6600"),
+    ('gpu_memory_total', 8),
+    ('ram_total', 32),
+    ('ram_type', "DDR5"),
+    ('ram_speed', 3600),
+    ('os_name', "Linux"),
+    ('os_version', "10"),
+    ('directx_version', "11"),
+])
+def test_key_changes_with_spec_fields_in_the_prompt(field, value):
+    assert key(replace(SPECS, **{field: value})) != key()
+
+
+@pytest.mark.parametrize("changes", [
+    {'ram_free': 2, 'ram_used': 14},
+    {'cpu_load': 97.0},
+    {'cpu_temp': 91.0},
+    {'storage_devices': []},
+    {'probe_timings': {'memory': 0.01}, 'probe_timeouts': [], 'probe_failures': []},
+])
+def test_key_ignores_dynamic_fields(changes):
+    assert key(replace(SPECS, **changes)) == key()
+
+
+def test_key_changes_with_requirements():
+    assert key(requirements=replace(REQUIREMENTS, minimum={**REQUIREMENTS.minimum, 'Memory': "12 GB RAM"})) != key()
+    assert key(requirements=replace(REQUIREMENTS, recommended={})) != key()
+
+
+def test_key_ignores_where_the_requirements_came_from():
+    assert key(requirements=replace(REQUIREMENTS, source_url="cache", title="Outro título", app_id=1)) == key()
+
+
+def test_key_changes_with_model_and_temperature():
+    assert key(model="modelo-b") != key()
+    assert key(model="modelo-a,modelo-b") != key()
+    assert key(temperature=0.7) != key()
+    assert key(temperature=module.ANALYSIS_TEMPERATURE) == key()
+
+
+def test_key_changes_with_prompt_version(monkeypatch):
+    before = key()
+    monkeypatch.setattr(module, "PROMPT_VERSION", module.PROMPT_VERSION + "-novo")
+    assert key() != before
+
+
+def test_batch_answers_have_their_own_key():
+    assert key(batch=True) != key()
+    assert key(batch=False) == key()
@@ -0,0 +1,244 @@
+from dataclasses import asdict, replace
+from types import SimpleNamespace
+import asyncio
+import json
+import re
+import threading
+import time
+
+from aiohttp import web
+import pytest
+
+from src.services.analyze_game_compatibility import (
+    CompatibilityAnalysis, PerformanceDetails, iter_analyses_concurrent
+)
+from src.shared.providers import AsyncLLMProvider, get_model_rate_limiter
+from src.shared.providers import async_llm_provider, llm_provider
+from src.shared.scraping import GameRequirements
+
+SPECS = SimpleNamespace(
+    cpu_name="AMD Ryzen 5 5600", cpu_cores=6, cpu_threads=12, gpu_name="NVIDIA GeForce RTX 3060",
+    gpu_memory_total=12, ram_total=16, ram_type="DDR4", ram_speed=3200, os_name="Windows",
+    os_version="11", directx_version="12"
+)
+
+ANALYSIS = CompatibilityAnalysis(
+    can_run=True, performance_level="Alto", expected_issues=[], recommended_settings="Alto",
+    upgrade_suggestions=[],
+    performance_details=PerformanceDetails(cpu_analysis="ok", gpu_analysis="ok", ram_analysis="ok",
+                                           storage_impact="ok", estimated_fps={})
+)
+
+
+def requirements(title):
+    return GameRequirements(minimum={'Memory': "8 GB RAM", 'Processor': f"CPU {title}"},
+                            recommended={}, source_url=f"https://store.steampowered.com/app/{title}/", title=title)
+
+
+def analysis_reply(delays):
+    """Responde com a análise do jogo do prompt (`recommended_settings` = título), após delays[título]."""
+    def reply(payload, number):
+        title = re.search(r"CPU (\w+)", payload["messages"][-1]["content"]).group(1)
+        return {"delay": delays.get(title, 0.0),
+                "content": json.dumps(asdict(replace(ANALYSIS, recommended_settings=title)))}
+    return reply
+
+
+class OpenRouterStub:
+    """
+    API do OpenRouter local, em aiohttp, rodando em um event loop próprio.
+
+    `reply(payload, número da requisição)` devolve delay, status, headers e
+    content. Registra o horário de cada requisição e o máximo de
+    requisições em andamento ao mesmo tempo.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.reply = lambda payload, number: {}
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    async def handle(self, request):
+        payload = await request.json()
+        self.requests.append((time.monotonic(), payload))
+        reply = self.reply(payload, len(self.requests))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(reply.get("delay", 0.0))
+        finally:
+            self.in_flight -= 1
+        return web.json_response({
+            "choices": [{"message": {"content": reply.get("content", payload["model"])}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+        }, status=reply.get("status", 200), headers=reply.get("headers"))
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post("/chat/completions", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return self.runner.addresses[0][1]
+
+    def start(self) -> int:
+        self.thread.start()
+        return asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def times(self, model):
+        return [timestamp for timestamp, payload in self.requests if payload["model"] == model]
+
+
+@pytest.fixture
+def openrouter(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "teste")
+    monkeypatch.setenv("OPENROUTER_MODEL", "lento")
+    monkeypatch.setenv("OPENROUTER_RATE_LIMIT", "1000")
+    monkeypatch.setenv("GAME_SPEC_CACHE_DIR", str(tmp_path))
+    for variable in ("OPENROUTER_MODELS", "OPENROUTER_RATE_LIMITS", "OPENROUTER_MAX_CONCURRENCY",
+                     "OPENROUTER_DEADLINE", "OPENROUTER_HEDGE_DELAY", "OPENROUTER_MODEL_TIMEOUTS"):
+        monkeypatch.delenv(variable, raising=False)
+    monkeypatch.setattr(async_llm_provider, "_rate_limiters", {})
+    llm_provider.get_latency_store.cache_clear()
+    monkeypatch.setattr(llm_provider, "_latency_history", {})
+
+    server = OpenRouterStub()
+    monkeypatch.setenv("OPENROUTER_API_URL", f"http://127.0.0.1:{server.start()}/chat/completions")
+    yield server
+    server.stop()
+    llm_provider.get_latency_store().close()
+    llm_provider.get_latency_store.cache_clear()
+
+
+def generate_all(calls, **kwargs):
+    """Faz as chamadas (modelo por chamada) ao mesmo tempo com um único provider."""
+    async def run():
+        async with AsyncLLMProvider(**kwargs) as llm:
+            return await asyncio.gather(*(llm.generate_response_async("prompt", model=model) for model in calls))
+    return asyncio.run(run())
+
+
+def test_semaphore_limits_calls_in_flight(openrouter):
+    openrouter.reply = lambda payload, number: {"delay": 0.2}
+
+    start = time.perf_counter()
+    assert generate_all(["lento"] * 6, max_concurrency=2) == ["lento"] * 6
+    assert openrouter.max_in_flight == 2
+    assert time.perf_counter() - start >= 0.6
+
+
+def test_max_concurrency_from_environment(openrouter, monkeypatch):
+    monkeypatch.setenv("OPENROUTER_MAX_CONCURRENCY", "3")
+    openrouter.reply = lambda payload, number: {"delay": 0.2}
+
+    generate_all(["lento"] * 6)
+    assert openrouter.max_in_flight == 3
+
+
+def test_token_bucket_is_per_model(openrouter, monkeypatch):
+    monkeypatch.setenv("OPENROUTER_RATE_LIMITS", "lento=2")
+
+    generate_all(["lento"] * 4 + ["rapido"] * 4, max_concurrency=8)
+    slow, fast = openrouter.times("lento"), openrouter.times("rapido")
+    # Rajada de 2 e depois 2 por segundo; o outro modelo não espera na fila
+    assert slow[-1] - slow[0] >= 0.9
+    assert fast[-1] - fast[0] < 0.3
+    assert get_model_rate_limiter("lento").rate == 2.0
+    assert get_model_rate_limiter("rapido").rate == 1000.0
+
+
+def test_rate_limiter_is_shared_across_providers(openrouter, monkeypatch):
+    monkeypatch.setenv("OPENROUTER_RATE_LIMITS", "lento=2")
+    assert get_model_rate_limiter("lento") is get_model_rate_limiter("lento")
+
+    generate_all(["lento"] * 2)
+    generate_all(["lento"] * 2)
+    slow = openrouter.times("lento")
+    assert slow[-1] - slow[0] >= 0.9
+
+
+def test_retries_then_records_metrics(openrouter):
+    openrouter.reply = lambda payload, number: {"status": 503 if number == 1 else 200}
+
+    async def run():
+        async with AsyncLLMProvider(max_retries=2) as llm:
+            return await llm.generate_response_async("prompt"), llm.metrics
+
+    text, metrics = asyncio.run(run())
+    assert text == "lento"
+    assert (metrics[-1].attempts, metrics[-1].status_code) == (2, 200)
+
+
+def test_client_error_is_not_retried(openrouter):
+    openrouter.reply = lambda payload, number: {"status": 400}
+
+    with pytest.raises(Exception, match="400"):
+        generate_all(["lento"], max_retries=3)
+    assert len(openrouter.requests) == 1
+
+
+def test_bridge_yields_in_completion_order(openrouter):
+    openrouter.reply = analysis_reply({"Demorado": 0.5})
+    games = [("Demorado", requirements("Demorado")), ("Ausente", None), ("Ligeiro", requirements("Ligeiro"))]
+
+    results = list(iter_analyses_concurrent(SPECS, games, use_cache=False, max_concurrency=2))
+    assert [(name, error) for name, _, _, error in results] == [
+        ("Ausente", None), ("Ligeiro", None), ("Demorado", None)
+    ]
+    assert [analysis.recommended_settings for _, _, analysis, _ in results[1:]] == ["Ligeiro", "Demorado"]
+    assert results[0][1:] == (None, None, None)
+
+
+def test_bridge_overlaps_analyses_with_requirement_fetching(openrouter):
+    openrouter.reply = analysis_reply({"Primeiro": 0.4, "Segundo": 0.4})
+    fetched = {}
+
+    def fetch():
+        yield "Primeiro", requirements("Primeiro")
+        time.sleep(0.4)   # busca lenta dos próximos requisitos
+        fetched["Segundo"] = time.monotonic()
+        yield "Segundo", requirements("Segundo")
+
+    start = time.perf_counter()
+    results = list(iter_analyses_concurrent(SPECS, fetch(), use_cache=False))
+    assert {name for name, *_ in results} == {"Primeiro", "Segundo"}
+    # A análise do primeiro já estava em andamento durante a busca do segundo
+    assert openrouter.requests[0][0] < fetched["Segundo"]
+    assert time.perf_counter() - start < 1.1
+
+
+def test_bridge_reports_errors_per_game(openrouter):
+    def reply(payload, number):
+        if "CPU Quebrado" in payload["messages"][-1]["content"]:
+            return {"status": 400}
+        return analysis_reply({})(payload, number)
+    openrouter.reply = reply
+
+    results = {name: (analysis, error) for name, _, analysis, error in iter_analyses_concurrent(
+        SPECS, [("Quebrado", requirements("Quebrado")), ("Inteiro", requirements("Inteiro"))], use_cache=False
+    )}
+    assert results["Quebrado"][0] is None and "400" in str(results["Quebrado"][1])
+    assert results["Inteiro"][0].recommended_settings == "Inteiro" and results["Inteiro"][1] is None
+
+
+def test_bridge_stops_its_loop_when_abandoned(openrouter):
+    openrouter.reply = analysis_reply({"Lento": 2.0})
+    threads = threading.active_count()
+    games = [("Lento", requirements("Lento")), ("Ausente", None)]
+
+    analyses = iter_analyses_concurrent(SPECS, games, use_cache=False)
+    assert next(analyses)[0] == "Ausente"
+    start = time.perf_counter()
+    analyses.close()
+    assert time.perf_counter() - start < 1.0
+    assert threading.active_count() == threads
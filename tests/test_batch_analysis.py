@@ -0,0 +1,134 @@
+from dataclasses import asdict, replace
+from types import SimpleNamespace
+import importlib
+import json
+import re
+
+import pytest
+
+from src.services.analyze_game_compatibility import (
+    CompatibilityAnalysis, PerformanceDetails, analysis_cache_key, parse_batch_response
+)
+from src.shared.cache import DiskCache
+from src.shared.scraping import GameRequirements
+
+module = importlib.import_module("src.services.analyze_game_compatibility")
+
+SPECS = SimpleNamespace(
+    cpu_name="AMD Ryzen 5 5600", cpu_cores=6, cpu_threads=12, gpu_name="NVIDIA GeForce RTX 3060",
+    gpu_memory_total=12, ram_total=16, ram_type="DDR4", ram_speed=3200, os_name="Windows",
+    os_version="11", directx_version="12"
+)
+
+ANALYSIS = CompatibilityAnalysis(
+    can_run=True, performance_level="Alto", expected_issues=[], recommended_settings="Alto",
+    upgrade_suggestions=[],
+    performance_details=PerformanceDetails(cpu_analysis="ok", gpu_analysis="ok", ram_analysis="ok",
+                                           storage_impact="ok", estimated_fps={})
+)
+
+
+def requirements(title):
+    return GameRequirements(minimum={'Memory': "8 GB RAM", 'Processor': f"CPU {title}"},
+                            recommended={'Memory': "16 GB RAM"}, source_url=f"https://store.steampowered.com/app/{title}/", title=title)
+
+
+class FakeProvider:
+    """Responde aos prompts em lote com as análises de `answered` e aos individuais com "Individual"."""
+
+    models = ["modelo-rapido"]
+    model = "modelo-rapido"
+
+    def __init__(self, answered=None):
+        self.answered = answered
+        self.batches = []
+        self.singles = 0
+        self.metrics = []
+
+    def generate_response(self, prompt, system_prompt=None, temperature=0.7, model=None, validate=None):
+        self.metrics.append(SimpleNamespace(model=self.model))
+        if system_prompt is not module.BATCH_SYSTEM_PROMPT:
+            self.singles += 1
+            return json.dumps(asdict(replace(ANALYSIS, performance_level="Individual")))
+        games = re.findall(r"=== Jogo (g\d+): (.+?) ===", prompt)
+        self.batches.append([title for _, title in games])
+        return json.dumps({
+            key: asdict(replace(ANALYSIS, recommended_settings=title))
+            for key, title in games if self.answered is None or title in self.answered
+        })
+
+
+@pytest.fixture
+def analyze(monkeypatch, tmp_path):
+    cache = DiskCache("analyses", cache_dir=str(tmp_path))
+    monkeypatch.setattr(module, "get_analysis_cache", lambda: cache)
+
+    def run(titles, provider, pack_size=2):
+        monkeypatch.setattr(module, "LLMProvider", lambda: provider)
+        results = module.analyze_games_batched(
+            SPECS, [(title, requirements(title)) for title in titles], pack_size=pack_size
+        )
+        return {name: analysis for name, _, analysis, error in results}
+
+    run.cache = cache
+    yield run
+    cache.close()
+
+
+def test_games_are_split_into_packs(analyze):
+    provider = FakeProvider()
+    results = analyze(["A", "B", "C", "D", "E"], provider, pack_size=2)
+
+    # O último grupo tem um jogo só: ele vai direto para a análise individual
+    assert provider.batches == [["A", "B"], ["C", "D"]]
+    assert provider.singles == 1
+    assert [results[title].recommended_settings for title in "ABCD"] == list("ABCD")
+    assert results["E"].performance_level == "Individual"
+
+
+def test_missing_games_fall_back_to_individual_analysis(analyze):
+    provider = FakeProvider(answered={"A"})
+    results = analyze(["A", "B"], provider)
+
+    assert results["A"].recommended_settings == "A"
+    assert results["B"].performance_level == "Individual"
+    assert provider.singles == 1
+
+
+def test_batch_answers_use_their_own_cache_key(analyze):
+    analyze(["A", "B"], FakeProvider())
+    tiered_key = analysis_cache_key(SPECS, requirements("A"), "modelo-rapido")
+    batch_key = analysis_cache_key(SPECS, requirements("A"), "modelo-rapido", batch=True)
+
+    assert tiered_key != batch_key
+    assert analyze.cache.get(tiered_key) is None
+    assert analyze.cache.get(batch_key)["recommended_settings"] == "A"
+
+    # Uma nova análise em lote reaproveita as respostas em lote, sem chamar o LLM
+    provider = FakeProvider()
+    results = analyze(["A", "B"], provider)
+    assert provider.batches == [] and provider.singles == 0
+    assert results["B"].recommended_settings == "B"
+
+
+def test_individual_fallback_is_stored_under_the_tiered_key(analyze):
+    analyze(["A", "B"], FakeProvider(answered={"A"}))
+    cached = analyze.cache.get(analysis_cache_key(SPECS, requirements("B"), "modelo-rapido"))
+    assert cached["performance_level"] == "Individual"
+
+
+def test_parse_batch_response_with_missing_and_malformed_keys():
+    result = json.dumps({"g1": asdict(ANALYSIS), "g3": {"can_run": True}})
+    analyses = parse_batch_response(result, ["g1", "g2", "g3"])
+
+    assert analyses["g1"] == ANALYSIS
+    assert isinstance(analyses["g2"], ValueError) and "ausente" in str(analyses["g2"])
+    assert isinstance(analyses["g3"], ValueError) and "incompleta" in str(analyses["g3"])
+
+
+def test_parse_batch_response_keeps_games_before_truncation():
+    result = json.dumps({"g1": asdict(ANALYSIS), "g2": asdict(ANALYSIS)})[:-40]
+    analyses = parse_batch_response(result, ["g1", "g2"])
+
+    assert analyses["g1"] == ANALYSIS
+    assert isinstance(analyses["g2"], ValueError)
@@ -0,0 +1,63 @@
+import pytest
+
+from src.shared.scraping import BrowserScraper, GameSystemRequirements
+
+
+class FakeDriver:
+    """WebDriver que registra as navegações em uma lista de eventos."""
+
+    def __init__(self, events):
+        self.events = events
+
+    def get(self, url):
+        self.events.append(("get", url))
+
+    def get_log(self, kind):
+        return []
+
+    def execute_script(self, script):
+        return 12.5
+
+    def find_element(self, by, value):
+        return object()
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+def browser_scraper(events):
+    scraper = BrowserScraper(politeness_delay=1.0)
+    scraper.driver = FakeDriver(events)
+    scraper._random_wait = lambda low, high: events.append(("pausa", (low, high)))
+    return scraper
+
+
+def game_system_requirements(events, monkeypatch):
+    scraper = GameSystemRequirements(politeness_delay=1.0, lean=False)
+    scraper.driver = FakeDriver(events)
+    monkeypatch.setattr("src.shared.scraping.game_system_requirements.time.sleep",
+                        lambda seconds: events.append(("pausa", seconds)))
+    monkeypatch.setattr(scraper, "_wait_for", lambda condition: True)
+    return scraper
+
+
+def test_browser_scraper_pauses_before_navigating(events):
+    browser_scraper(events).navigate("http://steam.local/app/1/")
+    assert [event for event, _ in events] == ["pausa", "get"]
+
+
+def test_game_system_requirements_pauses_before_navigating(events, monkeypatch):
+    game_system_requirements(events, monkeypatch)._navigate("http://steam.local/app/1/", None)
+    assert [event for event, _ in events] == ["pausa", "get"]
+
+
+def test_both_scrapers_record_the_same_metrics(events, monkeypatch):
+    scrapers = [browser_scraper(events), game_system_requirements(events, monkeypatch)]
+    scrapers[0].navigate("http://steam.local/app/1/")
+    scrapers[1]._navigate("http://steam.local/app/1/", None)
+
+    first, second = (scraper.navigations[0] for scraper in scrapers)
+    assert first.keys() == second.keys()
+    assert {"url", "elapsed_ms", "bytes", "requests", "blocked", "ready_ms"} <= first.keys()
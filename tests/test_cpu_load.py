@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from src.shared.utils import CpuLoadSampler, CpuLoadStats
+from src.shared.utils import cpu_load
+
+
+@pytest.fixture
+def cpu_percent(monkeypatch):
+    readings = []
+
+    def fake(interval=None):
+        return readings.pop(0) if readings else 0.0
+
+    monkeypatch.setattr(cpu_load.psutil, "cpu_percent", fake)
+    return readings
+
+
+def test_stats_report_minimum_average_and_maximum():
+    sampler = CpuLoadSampler(window=30.0)
+    now = time.monotonic()
+    for offset, value in enumerate([40.0, 10.0, 70.0, 20.0]):
+        sampler.add(value, timestamp=now - 4 + offset)
+
+    assert sampler.stats() == CpuLoadStats(minimum=10.0, average=35.0, maximum=70.0, samples=4)
+
+
+def test_samples_older_than_the_window_expire():
+    sampler = CpuLoadSampler(window=10.0)
+    now = time.monotonic()
+    sampler.add(90.0, timestamp=now - 20)
+    sampler.add(5.0, timestamp=now - 15)
+    sampler.add(30.0, timestamp=now - 2)
+    sampler.add(50.0, timestamp=now - 1)
+
+    assert sampler.stats() == CpuLoadStats(minimum=30.0, average=40.0, maximum=50.0, samples=2)
+
+
+def test_stats_empty_after_every_sample_expires():
+    sampler = CpuLoadSampler(window=1.0)
+    sampler.add(50.0, timestamp=time.monotonic() - 5)
+    assert sampler.stats() is None
+
+
+def test_current_is_the_window_average(cpu_percent):
+    sampler = CpuLoadSampler()
+    now = time.monotonic()
+    sampler.add(20.0, timestamp=now - 1)
+    sampler.add(30.0, timestamp=now)
+    assert sampler.current() == 25.0
+
+
+def test_current_without_samples_measures_instead_of_guessing(cpu_percent):
+    cpu_percent.append(42.0)
+    sampler = CpuLoadSampler()
+    assert sampler.current() == 42.0
+    assert sampler.stats().samples == 1
+
+
+def test_start_records_a_sample_immediately(cpu_percent):
+    cpu_percent.append(17.0)
+    sampler = CpuLoadSampler(interval=60.0).start()
+    try:
+        assert sampler.stats() == CpuLoadStats(minimum=17.0, average=17.0, maximum=17.0, samples=1)
+        assert sampler.current() == 17.0
+    finally:
+        sampler.stop()
@@ -0,0 +1,146 @@
+import importlib
+import socket
+import threading
+import time
+
+import pytest
+
+from src.shared.scraping import GameRequirements
+
+# src.services reexporta a função get_requirements com o mesmo nome do módulo
+module = importlib.import_module("src.services.get_requirements")
+
+REQUIREMENTS = GameRequirements(minimum={'OS': "Windows 10"}, recommended={}, source_url="local")
+
+
+class EmptyFetcher:
+    """SteamHttpFetcher que nunca encontra o jogo, forçando o navegador."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        pass
+
+    def get_game_requirements(self, game_name, app_id=None):
+        return None
+
+
+class LocalScraper(EmptyFetcher):
+    """GameSystemRequirements que sempre encontra o jogo."""
+
+    def get_game_requirements(self, game_name, app_id=None):
+        return REQUIREMENTS
+
+
+class BrokenPoolClient:
+    """Daemon que responde ao ping mas falha na busca."""
+
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    def is_available(self):
+        return True
+
+    def get_game_requirements(self, game_name, app_id=None):
+        self.calls += 1
+        raise self.error
+
+
+@pytest.fixture(params=[socket.timeout("timed out"), ConnectionRefusedError(), RuntimeError("daemon reiniciado")],
+                ids=["timeout", "restart", "error"])
+def pool_client(request, monkeypatch):
+    client = BrokenPoolClient(request.param)
+    monkeypatch.setattr(module, "PoolClient", lambda: client)
+    monkeypatch.setattr(module, "SteamHttpFetcher", EmptyFetcher)
+    monkeypatch.setattr(module, "GameSystemRequirements", LocalScraper)
+    monkeypatch.setattr(module, "resolve_app_id", lambda game_name: None)
+    return client
+
+
+def test_fetch_falls_back_to_local_browser(pool_client):
+    assert module.fetch_requirements("Jogo") is REQUIREMENTS
+
+
+def test_iter_stops_using_failed_daemon(pool_client):
+    results = dict(module.iter_requirements(["A", "B"], use_cache=False))
+    assert results == {"A": REQUIREMENTS, "B": REQUIREMENTS}
+    assert pool_client.calls == 1
+
+
+def test_concurrent_stops_using_failed_daemon(pool_client):
+    results = dict(module.iter_requirements_concurrent(["A", "B", "C"], workers=1,
+                                                       requests_per_second=100, use_cache=False))
+    assert results == {"A": REQUIREMENTS, "B": REQUIREMENTS, "C": REQUIREMENTS}
+    assert pool_client.calls == 1
+
+
+class SlowFetcher(EmptyFetcher):
+    """SteamHttpFetcher que leva DELAYS[nome] segundos e registra a concorrência."""
+
+    DELAYS = {"A": 0.3, "B": 0.1, "C": 0.2}
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    calls = []
+
+    def get_game_requirements(self, game_name, app_id=None):
+        cls = SlowFetcher
+        with cls.lock:
+            cls.calls.append(game_name)
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(cls.DELAYS.get(game_name, 0.1))
+        with cls.lock:
+            cls.active -= 1
+        return REQUIREMENTS
+
+
+@pytest.fixture
+def slow_fetcher(monkeypatch):
+    monkeypatch.setattr(module, "PoolClient", lambda: BrokenPoolClient(RuntimeError("sem daemon")))
+    monkeypatch.setattr(BrokenPoolClient, "is_available", lambda self: False)
+    monkeypatch.setattr(module, "SteamHttpFetcher", SlowFetcher)
+    monkeypatch.setattr(module, "resolve_app_id", lambda game_name: None)
+    monkeypatch.setattr(SlowFetcher, "calls", [])
+    monkeypatch.setattr(SlowFetcher, "peak", 0)
+    return SlowFetcher
+
+
+def test_concurrent_results_arrive_as_each_fetch_finishes(slow_fetcher):
+    started = []
+    start = time.perf_counter()
+    results = module.iter_requirements_concurrent(["A", "B", "C"], workers=3, requests_per_second=100,
+                                                  use_cache=False, on_start=started.append)
+
+    assert [name for name, _ in results] == ["B", "C", "A"]
+    assert time.perf_counter() - start < 0.5
+    assert slow_fetcher.peak == 3
+    assert sorted(started) == ["A", "B", "C"]
+
+
+def test_concurrent_respects_the_worker_limit(slow_fetcher):
+    names = [f"jogo {index}" for index in range(6)]
+    results = dict(module.iter_requirements_concurrent(names, workers=2, requests_per_second=100,
+                                                       use_cache=False))
+    assert set(results) == set(names)
+    assert slow_fetcher.peak == 2
+
+
+def test_abandoned_generator_cancels_pending_fetches(slow_fetcher):
+    names = [f"jogo {index}" for index in range(10)]
+    results = module.iter_requirements_concurrent(names, workers=1, requests_per_second=100, use_cache=False)
+
+    assert next(results)[0] == "jogo 0"
+    start = time.perf_counter()
+    results.close()
+    # Só a busca já em andamento termina; as da fila são canceladas
+    assert time.perf_counter() - start < 0.3
+    assert len(slow_fetcher.calls) <= 2
@@ -0,0 +1,100 @@
+import os
+import pickle
+
+import pytest
+
+from src.shared.hardware import HardwareCatalog
+from src.shared.hardware.hardware_catalog import DEFAULT_CATALOG_PATH, INDEX_FORMAT_VERSION, _index_path
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("GAME_SPEC_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _write_index(payload: bytes):
+    index_path = _index_path(DEFAULT_CATALOG_PATH)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    with open(index_path, "wb") as f:
+        f.write(payload)
+    return index_path
+
+
+@pytest.mark.parametrize("payload", [
+    b"not a pickle",
+    # Módulo e classe de layouts antigos: ModuleNotFoundError e AttributeError ao carregar
+    b"cold_catalog\nCatalog\n.",
+    b"csrc.shared.hardware.hardware_catalog\n_OldModelTable\n.",
+    pickle.dumps((INDEX_FORMAT_VERSION, {"not": "a catalog"})),
+    pickle.dumps("wrong shape"),
+])
+def test_stale_index_is_rebuilt(payload):
+    index_path = _write_index(payload)
+
+    catalog = HardwareCatalog.load(DEFAULT_CATALOG_PATH)
+
+    assert catalog.match_gpu("NVIDIA GeForce RTX 4070 Laptop GPU").mobile
+    with open(index_path, "rb") as f:
+        version, saved = pickle.load(f)
+    assert version == INDEX_FORMAT_VERSION and isinstance(saved, HardwareCatalog)
+
+
+def test_compiled_index_is_reused():
+    first = HardwareCatalog.load(DEFAULT_CATALOG_PATH)
+    second = HardwareCatalog.load(DEFAULT_CATALOG_PATH)
+
+    assert second is not first
+    assert second.match_gpu("Radeon RX 6800M").name == "AMD Radeon RX 6800M"
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return HardwareCatalog.from_json(DEFAULT_CATALOG_PATH)
+
+
+@pytest.mark.parametrize("name, expected, mobile", [
+    ("NVIDIA GeForce RTX 4070", "NVIDIA GeForce RTX 4070", False),
+    ("NVIDIA GeForce RTX 4070 Laptop GPU", "NVIDIA GeForce RTX 4070 Laptop GPU", True),
+    ("GeForce RTX 4070 Max-Q", "NVIDIA GeForce RTX 4070 Laptop GPU", True),
+    ("NVIDIA GeForce GTX 1060 with Max-Q Design", "NVIDIA GeForce GTX 1060 with Max-Q Design", True),
+    ("AMD Radeon(TM) RX 6600", "AMD Radeon RX 6600", False),
+    ("AMD Radeon RX 6600M", "AMD Radeon RX 6600M", True),
+])
+def test_desktop_and_laptop_variants(catalog, name, expected, mobile):
+    model = catalog.match_gpu(name)
+    assert (model.name, model.mobile) == (expected, mobile)
+
+
+@pytest.mark.parametrize("name, expected", [
+    # O número 580 existe na NVIDIA e na AMD: o fabricante no nome decide
+    ("GeForce 580", "NVIDIA GeForce GTX 580"),
+    ("Radeon 580", "AMD Radeon RX 580"),
+    ("GT 730", "NVIDIA GeForce GT 730"),
+    ("Intel(R) UHD Graphics 730", "Intel UHD Graphics 730"),
+])
+def test_vendor_and_model_number_index(catalog, name, expected):
+    assert catalog.match_gpu(name).name == expected
+
+
+@pytest.mark.parametrize("name, expected, vram_gb", [
+    ("NVIDIA GeForce GTX 1060 3GB", "NVIDIA GeForce GTX 1060 3GB", 3),
+    ("NVIDIA GeForce GTX 1060 6GB", "NVIDIA GeForce GTX 1060", 6),
+    ("NVIDIA GeForce GTX 1060", "NVIDIA GeForce GTX 1060", 6),
+    ("NVIDIA GeForce RTX 4060 Ti 16GB", "NVIDIA GeForce RTX 4060 Ti 16GB", 16),
+    ("NVIDIA GeForce RTX 3050 6GB Laptop GPU", "NVIDIA GeForce RTX 3050 6GB Laptop GPU", 6),
+    ("NVIDIA GeForce RTX 3050 Laptop GPU", "NVIDIA GeForce RTX 3050 Laptop GPU", 4),
+    ("NVIDIA GeForce RTX 3080 12 GB", "NVIDIA GeForce RTX 3080 12GB", 12),
+    ("Radeon RX 580 2048SP 4GB", "AMD Radeon RX 580 4GB", 4),
+    # Sem variante no catálogo, a memória declarada no nome prevalece
+    ("NVIDIA GeForce GTX 970 3.5GB", "NVIDIA GeForce GTX 970", 3.5),
+])
+def test_memory_size_selects_variant(catalog, name, expected, vram_gb):
+    model = catalog.match_gpu(name)
+    assert (model.name, model.vram_gb) == (expected, vram_gb)
+
+
+def test_memory_variant_survives_the_index(cache_dir):
+    HardwareCatalog.load(DEFAULT_CATALOG_PATH)
+    catalog = HardwareCatalog.load(DEFAULT_CATALOG_PATH)
+    assert catalog.match_gpu("NVIDIA GeForce RTX 4060 Ti 16GB").vram_gb == 16
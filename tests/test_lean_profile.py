@@ -0,0 +1,186 @@
+from fnmatch import fnmatch
+import json
+import time
+
+import pytest
+from selenium.webdriver.chrome.options import Options
+
+from src.shared.scraping import BrowserScraper, GameSystemRequirements
+from src.shared.scraping import browser_scraper, game_system_requirements
+from src.shared.scraping.browser_scraper import (
+    LEAN_BLOCKED_URLS, LEAN_CHROME_ARGUMENTS, apply_lean_profile, block_heavy_resources,
+    collect_navigation_metrics, record_navigation
+)
+
+
+def blocked(url):
+    return any(fnmatch(url, pattern) for pattern in LEAN_BLOCKED_URLS)
+
+
+def performance_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class FakeDriver:
+    """WebDriver com log de performance e comandos CDP registrados."""
+
+    def __init__(self, log=None, ready_ms=12.5):
+        self.log = log
+        self.ready_ms = ready_ms
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+
+    def get_log(self, kind):
+        if self.log is None:
+            raise ValueError(f"log '{kind}' indisponível")
+        entries, self.log = self.log, []
+        return entries
+
+    def execute_script(self, script):
+        if isinstance(self.ready_ms, Exception):
+            raise self.ready_ms
+        return self.ready_ms
+
+    def quit(self):
+        pass
+
+
+def test_lean_profile_uses_eager_page_load():
+    options = Options()
+    assert apply_lean_profile(options) is options
+    assert options.page_load_strategy == "eager"
+    assert options.to_capabilities()["pageLoadStrategy"] == "eager"
+
+
+def test_lean_profile_disables_unused_chrome_features():
+    options = apply_lean_profile(Options())
+
+    assert set(LEAN_CHROME_ARGUMENTS) <= set(options.arguments)
+    assert options.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+    # Log de rede, lido por collect_navigation_metrics
+    assert options.to_capabilities()["goog:loggingPrefs"] == {"performance": "ALL"}
+
+
+@pytest.mark.parametrize("url", [
+    "https://shared.akamai.steamstatic.com/store_item_assets/steam/apps/4242/header.jpg",
+    "https://store.akamai.steamstatic.com/public/images/v6/logo.png",
+    "https://store.akamai.steamstatic.com/public/shared/fonts/MotivaSans-Regular.woff2",
+    "https://video.akamai.steamstatic.com/store_trailers/4242/movie480.webm",
+    "https://www.google-analytics.com/analytics.js",
+    "https://www.youtube.com/embed/abc",
+])
+def test_heavy_resources_are_blocked(url):
+    assert blocked(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://store.steampowered.com/app/4242/Test_Quest/",
+    "https://store.steampowered.com/search/?term=test",
+    "https://store.akamai.steamstatic.com/public/javascript/agecheck.js",
+    "https://store.akamai.steamstatic.com/public/css/v6/store.css",
+])
+def test_pages_and_steam_scripts_are_not_blocked(url):
+    assert not blocked(url)
+
+
+def test_block_heavy_resources_sends_the_blocked_urls():
+    driver = FakeDriver()
+    block_heavy_resources(driver)
+    assert driver.cdp_commands == [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS}),
+    ]
+
+
+def test_navigation_metrics_count_bytes_requests_and_blocks():
+    driver = FakeDriver(log=[
+        performance_entry("Network.requestWillBeSent", requestId="1"),
+        performance_entry("Network.requestWillBeSent", requestId="2"),
+        performance_entry("Network.requestWillBeSent", requestId="3"),
+        performance_entry("Network.loadingFinished", requestId="1", encodedDataLength=30000),
+        performance_entry("Network.loadingFinished", requestId="2", encodedDataLength=1200),
+        performance_entry("Network.loadingFailed", requestId="3", blockedReason="inspector"),
+        performance_entry("Network.loadingFailed", requestId="4", errorText="net::ERR_ABORTED"),
+        performance_entry("Page.loadEventFired"),
+    ])
+
+    assert collect_navigation_metrics(driver) == {"bytes": 31200, "requests": 3, "blocked": 1, "ready_ms": 12.5}
+    # O log é esvaziado a cada leitura: a próxima navegação começa do zero
+    assert collect_navigation_metrics(driver)["bytes"] == 0
+
+
+def test_navigation_metrics_without_performance_log():
+    metrics = collect_navigation_metrics(FakeDriver(log=None))
+    assert metrics == {"bytes": 0, "requests": 0, "blocked": 0, "ready_ms": 12.5}
+
+
+def test_navigation_metrics_without_navigation_timing():
+    assert collect_navigation_metrics(FakeDriver(log=[], ready_ms=RuntimeError("sem página")))["ready_ms"] is None
+
+
+def test_record_navigation():
+    driver = FakeDriver(log=[performance_entry("Network.loadingFinished", encodedDataLength=2048)])
+    record = record_navigation(driver, "https://store.steampowered.com/app/4242/", time.perf_counter() - 0.05)
+
+    assert record["url"] == "https://store.steampowered.com/app/4242/"
+    assert record["elapsed_ms"] >= 50
+    assert record["bytes"] == 2048
+
+
+def test_browser_scraper_applies_the_lean_profile_only_when_asked():
+    lean = BrowserScraper(lean=True).options
+    normal = BrowserScraper().options
+
+    assert lean.page_load_strategy == "eager"
+    assert normal.page_load_strategy == "normal"
+    assert "--blink-settings=imagesEnabled=false" not in normal.arguments
+    assert "goog:loggingPrefs" not in normal.to_capabilities()
+
+
+@pytest.fixture
+def chrome(monkeypatch):
+    """Substitui o Chrome por FakeDriver e registra as opções recebidas."""
+    started = []
+
+    def fake_chrome(service=None, options=None):
+        driver = FakeDriver()
+        started.append((options, driver))
+        return driver
+
+    class FakeManager:
+        def install(self):
+            return "chromedriver"
+
+    for module in (browser_scraper, game_system_requirements):
+        monkeypatch.setattr(module.webdriver, "Chrome", fake_chrome)
+        monkeypatch.setattr(module, "ChromeDriverManager", FakeManager)
+        monkeypatch.setattr(module, "Service", lambda path: path)
+    return started
+
+
+@pytest.mark.parametrize("lean, setting, expected", [
+    (None, None, True),      # ativado por padrão
+    (None, "0", False),
+    (False, None, False),
+    (True, "0", True),       # o argumento vale mais que a variável
+])
+def test_game_system_requirements_lean_setting(chrome, monkeypatch, lean, setting, expected):
+    if setting is None:
+        monkeypatch.delenv("SCRAPER_LEAN", raising=False)
+    else:
+        monkeypatch.setenv("SCRAPER_LEAN", setting)
+
+    with GameSystemRequirements(lean=lean):
+        pass
+    (options, driver), = chrome
+    assert (options.page_load_strategy == "eager") is expected
+    assert bool(driver.cdp_commands) is expected
+
+
+def test_browser_scraper_blocks_resources_once_started(chrome):
+    with BrowserScraper(lean=True):
+        pass
+    (options, driver), = chrome
+    assert ("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS}) in driver.cdp_commands
@@ -0,0 +1,124 @@
+from pathlib import Path
+import os
+
+import pytest
+
+from src.services.spec_collectors import linux
+from src.services.spec_collectors.linux import LinuxSpecCollector
+
+FIXTURES = Path(__file__).parent / "fixtures" / "linux"
+
+
+def load(fixture: str) -> str:
+    return (FIXTURES / fixture).read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def proc(monkeypatch):
+    """Troca arquivos de /proc pelos das fixtures: proc({"/proc/cpuinfo": "cpuinfo_arm.txt"})."""
+    def use(files):
+        monkeypatch.setattr(linux, "_read", lambda path: load(files[path]) if path in files else None)
+    return use
+
+
+@pytest.mark.parametrize("fixture, expected", [
+    ("cpuinfo_intel_4c8t.txt", ("Intel(R) Core(TM) i7-7700HQ CPU @ 2.80GHz", 4, 8)),
+    ("cpuinfo_dual_socket.txt", ("AMD Opteron(tm) Processor 2218", 4, 4)),
+    ("cpuinfo_arm.txt", ("ARMv7 Processor rev 3 (v7l)", 0, 4)),
+])
+def test_parse_cpuinfo(fixture, expected):
+    assert linux._parse_cpuinfo(load(fixture)) == expected
+
+
+def test_cpu_info_without_core_ids_falls_back_to_psutil(proc, monkeypatch):
+    proc({"/proc/cpuinfo": "cpuinfo_arm.txt"})
+    monkeypatch.setattr(linux.psutil, "cpu_count", lambda logical=True: 4)
+    assert LinuxSpecCollector()._cpu_info() == ("ARMv7 Processor rev 3 (v7l)", 4, 4)
+
+
+def test_cpu_info_counts_hyperthreads_once(proc):
+    proc({"/proc/cpuinfo": "cpuinfo_intel_4c8t.txt"})
+    assert LinuxSpecCollector()._cpu_info()[1:] == (4, 8)
+
+
+@pytest.mark.parametrize("fixture, expected", [
+    ("meminfo.txt", (16, 9, 6)),
+    # Kernels antigos: disponível = livre + buffers + cache
+    ("meminfo_without_memavailable.txt", (8, 4, 4)),
+])
+def test_memory_from_meminfo(proc, fixture, expected):
+    proc({"/proc/meminfo": fixture})
+    assert LinuxSpecCollector()._memory() == expected
+
+
+@pytest.mark.parametrize("fixture, expected", [
+    ("smbios17_ddr4.bin", ("DDR4", 2933)),      # velocidade configurada prevalece
+    ("smbios17_ddr3_v23.bin", ("DDR3", 1600)),  # SMBIOS 2.3: sem velocidade configurada
+    ("smbios17_empty_slot.bin", None),
+])
+def test_parse_smbios_memory_device(fixture, expected):
+    assert linux._parse_smbios_memory_device((FIXTURES / fixture).read_bytes()) == expected
+
+
+def test_memory_modules_skip_empty_slots(tmp_path, monkeypatch):
+    for index, fixture in enumerate(["smbios17_empty_slot.bin", "smbios17_ddr4.bin"]):
+        entry = tmp_path / f"17-{index}"
+        entry.mkdir()
+        (entry / "raw").write_bytes((FIXTURES / fixture).read_bytes())
+    monkeypatch.setattr(linux, "SMBIOS_MEMORY_ENTRIES", str(tmp_path / "17-*" / "raw"))
+
+    assert LinuxSpecCollector()._memory_modules() == ("DDR4", 2933)
+
+
+def test_memory_modules_without_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(linux, "SMBIOS_MEMORY_ENTRIES", str(tmp_path / "17-*" / "raw"))
+    assert LinuxSpecCollector()._memory_modules() == (None, None)
+
+
+@pytest.mark.parametrize("vendor_id, device_id, expected", [
+    (0x10de, 0x25a2, "GeForce RTX 3050 Mobile"),          # nome comercial entre colchetes
+    (0x10de, 0x2f00, "Experimental Device"),              # sem colchetes: o nome inteiro
+    (0x1002, 0x67df, "Radeon RX 470/480/570/570X/580/580X/590"),
+    (0x8086, 0x3e9b, "UHD Graphics 630"),
+    (0x10de, 0x1ae5, None),                               # só existe no fabricante seguinte
+    (0x1234, 0x0001, None),
+])
+def test_pci_device_name(monkeypatch, vendor_id, device_id, expected):
+    monkeypatch.setattr(linux, "PCI_IDS_PATHS", ("/nao/existe/pci.ids", str(FIXTURES / "pci.ids")))
+    assert linux._pci_device_name(vendor_id, device_id) == expected
+
+
+@pytest.fixture
+def sys_block(tmp_path, monkeypatch):
+    """Árvore /sys/class/block mínima: links para os dispositivos, como no kernel."""
+    devices = tmp_path / "devices"
+    block = tmp_path / "class" / "block"
+    block.mkdir(parents=True)
+
+    def disk(name, rotational=None, partitions=()):
+        path = devices / name
+        (path / "queue").mkdir(parents=True)
+        if rotational is not None:
+            (path / "queue" / "rotational").write_text(f"{rotational}\n")
+        os.symlink(path, block / name)
+        for partition in partitions:
+            (path / partition).mkdir()
+            (path / partition / "partition").write_text("1\n")
+            os.symlink(path / partition, block / partition)
+
+    disk("nvme0n1", 0, ["nvme0n1p1", "nvme0n1p2"])
+    disk("sda", 1, ["sda1"])
+    disk("sdb", 0)
+    disk("zram0")
+    monkeypatch.setattr(linux, "SYS_CLASS_BLOCK", str(block))
+
+
+@pytest.mark.parametrize("device, expected", [
+    ("/dev/nvme0n1p2", "NVMe SSD"),
+    ("/dev/sda1", "HDD"),
+    ("/dev/sdb", "SSD"),
+    ("/dev/zram0", "Unknown"),
+    ("/dev/mmcblk9p1", "Unknown"),
+])
+def test_disk_type(sys_block, device, expected):
+    assert LinuxSpecCollector()._disk_type(device) == expected
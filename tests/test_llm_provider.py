@@ -0,0 +1,171 @@
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+from src.shared.providers import LLMProvider
+from src.shared.providers import llm_provider
+
+
+class OpenRouterStub(http.server.BaseHTTPRequestHandler):
+    """
+    API do OpenRouter local. `server.reply(payload, número da requisição)`
+    devolve a resposta: delay, status, headers e content, ou events (SSE)
+    com event_delay entre eles.
+    """
+
+    protocol_version = "HTTP/1.1"   # SSE em chunks, como a API real
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.requests.append((time.monotonic(), payload))
+            number = len(self.server.requests)
+        reply = self.server.reply(payload, number)
+        time.sleep(reply.get("delay", 0.0))
+
+        self.send_response(reply.get("status", 200))
+        for name, value in reply.get("headers", {}).items():
+            self.send_header(name, value)
+        if "events" in reply:
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for event in reply["events"]:
+                time.sleep(reply.get("event_delay", 0.0))
+                self._write_chunk(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self._write_chunk(b"data: [DONE]\n\n")
+            self._write_chunk(b"")
+            return
+
+        body = json.dumps({
+            "choices": [{"message": {"content": reply.get("content", payload["model"])}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+        }).encode("utf-8")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubServer(http.server.ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        pass   # cliente desistiu (timeout ou requisição de reserva cancelada)
+
+
+@pytest.fixture
+def openrouter(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "teste")
+    monkeypatch.setenv("OPENROUTER_MODEL", "lento")
+    monkeypatch.setenv("GAME_SPEC_CACHE_DIR", str(tmp_path))
+    for variable in ("OPENROUTER_MODELS", "OPENROUTER_DEADLINE", "OPENROUTER_HEDGE_DELAY",
+                     "OPENROUTER_HEDGE_PERCENTILE", "OPENROUTER_HEDGE_MODEL", "OPENROUTER_MODEL_TIMEOUTS"):
+        monkeypatch.delenv(variable, raising=False)
+    llm_provider.get_latency_store.cache_clear()
+    monkeypatch.setattr(llm_provider, "_latency_history", {})
+
+    server = _StubServer(("127.0.0.1", 0), OpenRouterStub)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.reply = lambda payload, number: {}
+    monkeypatch.setenv("OPENROUTER_API_URL", f"http://127.0.0.1:{server.server_port}/chat/completions")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    llm_provider.get_latency_store().close()
+    llm_provider.get_latency_store.cache_clear()
+
+
+def test_hedged_metrics_use_the_winning_request_start(openrouter):
+    openrouter.reply = lambda payload, number: {"delay": 2.0 if payload["model"] == "lento" else 0.0}
+    provider = LLMProvider(hedge_delay=0.3, hedge_model="rapido")
+
+    assert provider.generate_response("prompt") == "rapido"
+    assert provider.metrics[-1].model == "rapido"
+    assert provider.metrics[-1].latency < 0.2
+
+
+def test_stream_response_respects_deadline(openrouter):
+    event = {"choices": [{"delta": {"content": "x"}}]}
+    openrouter.reply = lambda payload, number: {"events": [event] * 20, "event_delay": 0.05}
+    provider = LLMProvider(deadline=0.3)
+
+    received = []
+    with pytest.raises(Exception, match="prazo"):
+        for text in provider.stream_response("prompt"):
+            received.append(text)
+    assert 0 < len(received) < 20
+
+
+def test_latency_history_survives_between_runs(openrouter, monkeypatch):
+    provider = LLMProvider()
+    for _ in range(llm_provider.MIN_HEDGE_SAMPLES):
+        provider.generate_response("prompt")
+    assert llm_provider.latency_percentile("lento", 95) is not None
+
+    # Nova execução do CLI: memória vazia, mesmo diretório de cache
+    monkeypatch.setattr(llm_provider, "_latency_history", {})
+    llm_provider.get_latency_store.cache_clear()
+    fast = llm_provider.latency_percentile("lento", 95)
+    assert fast is not None and fast < 1.0
+
+    # Com o percentil herdado, a reserva sai bem antes da espera padrão de 10s
+    openrouter.reply = lambda payload, number: {"delay": 3.0 if number == 21 else 0.0}
+    hedged = LLMProvider(hedge_percentile=95)
+    start = time.perf_counter()
+    assert hedged.generate_response("prompt") == "lento"
+    assert time.perf_counter() - start < 2.0
+    assert len(openrouter.requests) == 22
+
+
+def test_429_waits_for_retry_after(openrouter):
+    openrouter.reply = lambda payload, number: (
+        {"status": 429, "headers": {"Retry-After": "1"}} if number == 1 else {}
+    )
+    provider = LLMProvider(max_retries=3)
+
+    assert provider.generate_response("prompt") == "lento"
+    (first, _), (second, _) = openrouter.requests
+    assert second - first >= 1.0
+    assert provider.metrics[-1].attempts == 2
+
+
+def test_5xx_then_success(openrouter):
+    openrouter.reply = lambda payload, number: {"status": 502 if number < 3 else 200}
+    provider = LLMProvider(max_retries=3)
+
+    assert provider.generate_response("prompt") == "lento"
+    assert len(openrouter.requests) == 3
+    assert provider.metrics[-1].attempts == 3
+    assert provider.metrics[-1].status_code == 200
+
+
+def test_retries_exhausted_raise_the_last_status(openrouter):
+    openrouter.reply = lambda payload, number: {"status": 503}
+    provider = LLMProvider(max_retries=2)
+
+    with pytest.raises(Exception, match="503"):
+        provider.generate_response("prompt")
+    assert len(openrouter.requests) == 3
+    assert provider.metrics == []
+
+
+def test_read_timeout_is_retried_then_raised(openrouter):
+    openrouter.reply = lambda payload, number: {"delay": 1.0}
+    provider = LLMProvider(read_timeout=0.2, max_retries=1)
+
+    start = time.perf_counter()
+    with pytest.raises(Exception, match="[Tt]imed out"):
+        provider.generate_response("prompt")
+    assert time.perf_counter() - start < 1.5
+    assert len(openrouter.requests) == 2
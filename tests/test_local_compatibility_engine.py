@@ -0,0 +1,172 @@
+from dataclasses import replace
+
+import pytest
+
+import main
+from src.services import local_compatibility_engine as engine
+from src.services.spec_collectors import StorageDevice, SystemSpecs
+from src.shared.scraping import GameRequirements
+
+SPECS = SystemSpecs(
+    cpu_name="AMD Ryzen 5 5600", cpu_cores=6, cpu_threads=12, cpu_freq_base=3.5, cpu_freq_max=4.4,
+    ram_total=16, ram_free=9, ram_used=7, gpu_name="NVIDIA GeForce RTX 3060",
+    storage_devices=[StorageDevice(name="/dev/nvme0n1p2", type="NVMe SSD", total=500, free=200, mount_point="/")],
+    os_name="Windows", os_version="11", cpu_load=12.5, cpu_temp=48.0, gpu_memory_total=12,
+    ram_type="DDR4", ram_speed=3200, directx_version="12"
+)
+
+
+def requirements(minimum, recommended=None):
+    return GameRequirements(minimum=minimum, recommended=recommended or {}, source_url="https://steam.local/app/1/")
+
+
+# Bem acima: o sistema passa com folga até dos recomendados
+ABOVE = requirements(
+    {'Processor': "Intel Core i3-6100", 'Memory': "8 GB RAM", 'Graphics': "NVIDIA GeForce GTX 960"},
+    {'Processor': "Intel Core i5-8400", 'Memory': "16 GB RAM", 'Graphics': "NVIDIA GeForce GTX 1070"},
+)
+# Bem abaixo: todos os componentes longe do mínimo
+BELOW = requirements(
+    {'Processor': "Intel Core i9-13900K", 'Memory': "32 GB RAM", 'Graphics': "NVIDIA GeForce RTX 4090"},
+)
+# Limítrofe: o sistema é exatamente o requisito mínimo
+BORDERLINE = requirements(
+    {'Processor': "AMD Ryzen 5 5600", 'Memory': "16 GB RAM", 'Graphics': "NVIDIA GeForce RTX 3060"},
+)
+
+
+def test_clearly_above_runs_at_high_settings():
+    analysis = engine.evaluate_compatibility(SPECS, ABOVE)
+
+    assert analysis.can_run is True
+    assert analysis.performance_level == 'Alto'
+    assert analysis.expected_issues == []
+    assert {check.status for check in engine.component_checks(SPECS, ABOVE).values()} == {engine.STATUS_RECOMMENDED}
+
+
+def test_clearly_below_does_not_run():
+    analysis = engine.evaluate_compatibility(SPECS, BELOW)
+
+    assert analysis.can_run is False
+    assert analysis.performance_level == 'Baixo'
+    assert "Placa de vídeo abaixo dos requisitos mínimos." in analysis.expected_issues
+    assert all(check.status == engine.STATUS_BELOW for check in engine.component_checks(SPECS, BELOW).values())
+
+
+def test_borderline_meets_the_minimum():
+    analysis = engine.evaluate_compatibility(SPECS, BORDERLINE)
+
+    assert analysis.can_run is True
+    assert analysis.performance_level == 'Médio'
+    assert all(check.minimum_ratio == 1.0 for check in engine.component_checks(SPECS, BORDERLINE).values())
+
+
+def test_evaluation_is_deterministic():
+    assert engine.evaluate_compatibility(SPECS, ABOVE) == engine.evaluate_compatibility(SPECS, ABOVE)
+
+
+def test_ram_tolerance_absorbs_rounding():
+    assert engine.component_checks(replace(SPECS, ram_total=15.8), BORDERLINE)['ram'].status == engine.STATUS_MINIMUM
+
+
+def test_missing_ssd_and_space_are_reported():
+    specs = replace(SPECS, storage_devices=[
+        StorageDevice(name="/dev/sda1", type="HDD", total=1000, free=20, mount_point="/"),
+    ])
+    game = requirements({**ABOVE.minimum, 'Storage': "50 GB available space (SSD required)"})
+
+    issues = engine.evaluate_compatibility(specs, game).expected_issues
+    assert any(issue.startswith("Espaço livre insuficiente") for issue in issues)
+    assert any("requer SSD" in issue for issue in issues)
+
+
+@pytest.mark.parametrize("game, can_run, expected", [
+    (ABOVE, True, False),        # folga confortável e veredito coerente
+    (BELOW, False, False),       # longe do mínimo e veredito coerente
+    (BORDERLINE, True, True),    # perto do mínimo
+    (ABOVE, False, True),        # veredito contradiz a comparação local
+    (BELOW, True, True),
+])
+def test_is_borderline(game, can_run, expected):
+    analysis = replace(engine.evaluate_compatibility(SPECS, game), can_run=can_run)
+    assert engine.is_borderline(SPECS, game, analysis) is expected
+    assert engine.is_borderline_verdict(SPECS, game, can_run) is expected
+
+
+def test_is_borderline_accepts_when_nothing_is_comparable():
+    game = requirements({'OS': "Windows 10", 'Processor': "2 GHz"})
+    assert engine.is_borderline_verdict(replace(SPECS, ram_total=None), game, True) is False
+    assert engine.is_borderline_verdict(replace(SPECS, ram_total=None), game, False) is False
+
+
+def test_engines():
+    assert engine.ENGINES == ('llm', 'local', 'hybrid')
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    def fake_llm(system_specs, game_requirements, use_cache=True):
+        calls.append(game_requirements)
+        analysis = engine.evaluate_compatibility(system_specs, BELOW)
+        return replace(analysis, upgrade_suggestions=["texto do LLM"])
+
+    monkeypatch.setattr(engine, "analyze_game_compatibility", fake_llm)
+    return calls
+
+
+def test_local_engine_never_calls_the_llm(llm_calls):
+    analysis = engine.analyze_with_engine(SPECS, ABOVE, engine='local')
+    assert analysis == engine.evaluate_compatibility(SPECS, ABOVE)
+    assert llm_calls == []
+
+
+def test_llm_engine_calls_the_llm(llm_calls):
+    engine.analyze_with_engine(SPECS, ABOVE, engine='llm')
+    assert llm_calls == [ABOVE]
+
+
+def test_hybrid_takes_the_verdict_from_the_local_engine(llm_calls):
+    analysis = engine.analyze_with_engine(SPECS, ABOVE, engine='hybrid')
+
+    assert llm_calls == [ABOVE]
+    assert (analysis.can_run, analysis.performance_level) == (True, 'Alto')
+    assert analysis.upgrade_suggestions == ["texto do LLM"]
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="desconhecido"):
+        engine.analyze_with_engine(SPECS, ABOVE, engine='oraculo')
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["analyze", "Hades"], 'llm'),
+    (["analyze", "--offline", "Hades"], 'local'),
+    (["analyze", "--engine", "hybrid", "Hades"], 'hybrid'),
+])
+def test_offline_flag_selects_the_local_engine(monkeypatch, argv, expected):
+    received = {}
+    monkeypatch.setattr(main.sys, "argv", ["main.py"] + argv)
+    monkeypatch.setattr(main, "get_cpu_load_sampler", lambda: None)
+    monkeypatch.setattr(main, "print_game_analysis", lambda game_name, **kwargs: received.update(kwargs))
+
+    main.main()
+    assert received['engine'] == expected
+
+
+def test_offline_batch_analyses_without_the_llm(monkeypatch, capsys, llm_calls):
+    def fetch(game_names, on_start=None, **kwargs):
+        for title in game_names:
+            on_start(title)
+            yield title, ABOVE
+
+    monkeypatch.setattr(main.sys, "argv", ["main.py", "analyze-batch", "--offline", "Hades", "Celeste"])
+    monkeypatch.setattr(main, "get_cpu_load_sampler", lambda: None)
+    monkeypatch.setattr(main, "get_system_specs", lambda refresh=False: SPECS)
+    monkeypatch.setattr(main, "iter_requirements", fetch)
+    monkeypatch.setattr(main, "iter_requirements_concurrent", fetch)
+
+    main.main()
+    assert capsys.readouterr().out.count("Pode rodar: Sim | Performance: Alto") == 4   # jogos e resumo
+    assert llm_calls == []
@@ -0,0 +1,73 @@
+import io
+import re
+import time
+
+import pytest
+
+import main
+from src.shared.scraping import GameRequirements
+
+
+class FakeStdin(io.StringIO):
+    def __init__(self, text, tty=False):
+        super().__init__(text)
+        self.tty = tty
+
+    def isatty(self):
+        return self.tty
+
+
+@pytest.fixture
+def stdin(monkeypatch):
+    def use(text, tty=False):
+        monkeypatch.setattr(main.sys, "stdin", FakeStdin(text, tty))
+    use("", tty=True)
+    return use
+
+
+def test_titles_from_arguments(stdin):
+    assert main.read_batch_titles(["Elden Ring", " Hades "], None) == ["Elden Ring", "Hades"]
+
+
+def test_titles_from_file_skip_blank_and_comment_lines(stdin, tmp_path):
+    path = tmp_path / "jogos.txt"
+    path.write_text("# favoritos\nElden Ring\n\n   \n  # comentário indentado\nHades\n", encoding="utf-8")
+    assert main.read_batch_titles(["Celeste"], str(path)) == ["Celeste", "Elden Ring", "Hades"]
+
+
+def test_titles_from_stdin_with_dash(stdin):
+    stdin("Elden Ring\n#ignorado\nHades\n", tty=True)
+    assert main.read_batch_titles([], "-") == ["Elden Ring", "Hades"]
+
+
+def test_titles_from_piped_stdin_only_without_arguments(stdin):
+    stdin("Hades\n")
+    assert main.read_batch_titles([], None) == ["Hades"]
+    stdin("Hades\n")
+    assert main.read_batch_titles(["Celeste"], None) == ["Celeste"]
+
+
+def test_interactive_stdin_is_not_read(stdin):
+    stdin("Hades\n", tty=True)
+    assert main.read_batch_titles([], None) == []
+
+
+def test_batch_elapsed_is_measured_per_title(monkeypatch, capsys):
+    def fetch_concurrently(game_names, on_start=None, **kwargs):
+        # As duas buscas começam juntas; a segunda termina 0.4s depois
+        for name in game_names:
+            on_start(name)
+        for name, delay in zip(game_names, (0.2, 0.2)):
+            time.sleep(delay)
+            yield name, GameRequirements(minimum={}, recommended={}, source_url="", title=name)
+
+    monkeypatch.setattr(main, "get_system_specs", lambda refresh=False: None)
+    monkeypatch.setattr(main, "iter_requirements_concurrent", fetch_concurrently)
+    monkeypatch.setattr(main, "analyze_with_engine",
+                        lambda *args, **kwargs: type("Analysis", (), {"can_run": True, "performance_level": "Alto"}))
+
+    main.print_batch_analysis(["A", "B"], workers=2, engine='local')
+    elapsed = [float(seconds) for seconds in re.findall(r"^\[\d/2\] \w: .*\((\d+\.\d)s\)$",
+                                                        capsys.readouterr().out, re.MULTILINE)]
+    assert elapsed[0] == pytest.approx(0.2, abs=0.1)
+    assert elapsed[1] == pytest.approx(0.4, abs=0.1)
@@ -0,0 +1,101 @@
+import os
+import socket
+import stat
+import threading
+import time
+
+import pytest
+
+from src.shared.scraping import GameRequirements, PoolClient
+from src.shared.scraping import pool_daemon
+from src.shared.scraping.pool_daemon import PoolDaemon, unix_sockets_supported
+from src.shared.scraping.webdriver_pool import WebDriverPool
+
+pytestmark = pytest.mark.skipif(not unix_sockets_supported(), reason="sem sockets Unix")
+
+REQUIREMENTS = GameRequirements(minimum={'Memory': "8 GB RAM"}, recommended={},
+                                source_url="https://store.steampowered.com/app/4242/", app_id=4242)
+
+
+class FakeScraper:
+    """GameSystemRequirements sem Chrome."""
+
+    def __init__(self):
+        self.driver = self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        pass
+
+    def get_game_requirements(self, game_name, app_id=None):
+        return REQUIREMENTS
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "pool.sock")
+
+
+@pytest.fixture
+def daemon(socket_path):
+    daemon = PoolDaemon(WebDriverPool(size=1, factory=FakeScraper), socket_path=socket_path)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    client = PoolClient(socket_path)
+    deadline = time.monotonic() + 5
+    while not client.is_available():
+        assert time.monotonic() < deadline, "daemon não subiu"
+        time.sleep(0.05)
+    yield daemon
+    client.shutdown()
+    thread.join(5)
+
+
+def test_requirements_through_the_daemon(daemon, socket_path):
+    assert PoolClient(socket_path).get_game_requirements("Test Quest") == REQUIREMENTS
+
+
+def test_socket_is_private_to_the_owner(daemon, socket_path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_requirements_wait_for_the_lease_plus_a_margin(socket_path, monkeypatch):
+    client = PoolClient(socket_path, timeout=30.0)
+    sent = []
+    monkeypatch.setattr(client, "_request",
+                        lambda payload, timeout=None: sent.append((payload, timeout)) or {"ok": True})
+
+    client.get_game_requirements("Test Quest")
+    (payload, timeout), = sent
+    assert payload["timeout"] == 30.0
+    assert timeout == 30.0 + pool_daemon.SCRAPE_TIMEOUT_MARGIN
+
+
+def test_ping_is_false_when_the_socket_answers_garbage(socket_path):
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+
+    def answer():
+        connection, _ = server.accept()
+        with connection:
+            connection.recv(1024)
+            connection.sendall(b"HTTP/1.1 400 Bad Request\n")
+
+    threading.Thread(target=answer, daemon=True).start()
+    try:
+        assert PoolClient(socket_path).ping() is False
+    finally:
+        server.close()
+
+
+def test_ping_is_false_without_daemon(socket_path):
+    assert PoolClient(socket_path).ping() is False
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.shared.utils import TokenBucket
+
+
+def test_burst_up_to_capacity_is_immediate():
+    bucket = TokenBucket(rate=1, capacity=3)
+    start = time.perf_counter()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.perf_counter() - start < 0.05
+
+
+def test_rate_after_the_burst():
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.perf_counter()
+    for _ in range(6):
+        bucket.acquire()
+    # 2 tokens na rajada, os outros 4 a 20 por segundo
+    assert time.perf_counter() - start == pytest.approx(0.2, abs=0.06)
+
+
+def test_rate_is_shared_between_threads():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.perf_counter()
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 20 tokens: 1 na rajada e 19 a 50 por segundo, somando as threads
+    assert time.perf_counter() - start == pytest.approx(19 / 50, abs=0.1)
+
+
+def test_acquire_async_waits_without_blocking_the_loop():
+    bucket = TokenBucket(rate=20, capacity=1)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async def consume():
+        for _ in range(3):
+            await bucket.acquire_async()
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(consume(), ticker())
+        return time.perf_counter() - start
+
+    assert asyncio.run(main()) == pytest.approx(0.1, abs=0.05)
+    # Enquanto o consumidor espera os tokens, as outras corrotinas seguem rodando
+    assert max(later - earlier for earlier, later in zip(ticks, ticks[1:])) < 0.04
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
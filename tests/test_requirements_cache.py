@@ -0,0 +1,123 @@
+from dataclasses import asdict
+import itertools
+import threading
+
+import pytest
+
+from src.shared.cache import DiskCache, RequirementsCache
+from src.shared.cache import disk_cache
+from src.shared.scraping import GameRequirements
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Relógio do DiskCache controlado pelo teste."""
+    now = [1000.0]
+    monkeypatch.setattr(disk_cache.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskCache("requirements", cache_dir=str(tmp_path), max_entries=3)
+    yield cache
+    cache.close()
+
+
+def requirements(title="Test Quest", app_id=4242, memory="8 GB RAM"):
+    return GameRequirements(minimum={'Memory': memory}, recommended={},
+                            source_url=f"https://store.steampowered.com/app/{app_id}/",
+                            title=title, app_id=app_id)
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.set("a", {"valor": 1}, ttl=60)
+    clock[0] += 59
+    assert cache.get("a") == {"valor": 1}
+
+    clock[0] += 2
+    assert cache.get("a") is None
+    assert cache.get_entry("a") == ({"valor": 1}, True)
+
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    for key in ("a", "b", "c"):
+        clock[0] += 1
+        cache.set(key, key)
+    clock[0] += 1
+    cache.get("a")
+
+    clock[0] += 1
+    cache.set("d", "d")
+    assert [cache.get(key) for key in "abcd"] == ["a", None, "c", "d"]
+
+
+def test_max_bytes_evicts_until_under_the_limit(tmp_path, clock):
+    cache = DiskCache("bytes", cache_dir=str(tmp_path), max_bytes=25)
+    try:
+        for key in ("a", "b", "c"):
+            clock[0] += 1
+            cache.set(key, "x" * 8)   # 10 bytes serializados
+        assert [cache.get(key) for key in "abc"] == [None, "x" * 8, "x" * 8]
+    finally:
+        cache.close()
+
+
+def test_name_and_title_share_the_app_entry(cache):
+    requirements_cache = RequirementsCache(cache=cache, ttl=60)
+    requirements_cache.store("test quest goty", requirements())
+
+    assert requirements_cache.lookup("Test Quest GOTY") == (requirements(), False)
+    assert requirements_cache.lookup("Test Quest") == (requirements(), False)
+
+
+def test_old_schema_is_a_miss(cache):
+    value = asdict(requirements())
+    value['system_requirements'] = value.pop('minimum')   # formato antigo
+    cache.set("app:4242", value)
+    cache.set("name:test quest", {"app_id": 4242})
+
+    requirements_cache = RequirementsCache(cache=cache)
+    assert requirements_cache.lookup("Test Quest") is None
+    assert requirements_cache.get_or_fetch("Test Quest", lambda name: requirements()) == requirements()
+    assert requirements_cache.lookup("Test Quest") == (requirements(), False)
+
+
+def test_stale_entry_is_returned_while_refreshing(cache, clock):
+    requirements_cache = RequirementsCache(cache=cache, ttl=60, stale_while_revalidate=True)
+    requirements_cache.store("Test Quest", requirements())
+    clock[0] += 120
+
+    fetched = threading.Event()
+    release = threading.Event()
+    calls = itertools.count()
+
+    def fetch(name):
+        next(calls)
+        release.wait(5)
+        fetched.set()
+        return requirements(memory="16 GB RAM")
+
+    # Devolve a entrada antiga sem esperar a busca, e só dispara uma atualização
+    assert requirements_cache.get_or_fetch("Test Quest", fetch) == requirements()
+    assert requirements_cache.get_or_fetch("Test Quest", fetch) == requirements()
+    threads = [thread for thread in threading.enumerate() if thread.name == "refresh-test quest"]
+    assert len(threads) == 1 and threads[0].daemon
+
+    release.set()
+    assert fetched.wait(5)
+    threads[0].join(5)
+    assert next(calls) == 1
+    assert requirements_cache.lookup("Test Quest") == (requirements(memory="16 GB RAM"), False)
+
+
+def test_without_swr_expired_entry_is_fetched_synchronously(cache, clock):
+    requirements_cache = RequirementsCache(cache=cache, ttl=60, stale_while_revalidate=False)
+    requirements_cache.store("Test Quest", requirements())
+    clock[0] += 120
+
+    assert requirements_cache.get_or_fetch("Test Quest", lambda name: requirements(memory="16 GB RAM")) \
+        == requirements(memory="16 GB RAM")
+    # Se a busca falhar, o resultado antigo é melhor que nenhum
+    clock[0] += 120
+    assert requirements_cache.get_or_fetch("Test Quest", lambda name: None) == requirements(memory="16 GB RAM")
@@ -0,0 +1,96 @@
+import pytest
+
+from src.shared.scraping import (
+    NormalizedRequirements, extract_cpu_models, extract_gpu_models, normalize_requirements
+)
+from src.shared.scraping.requirements_normalizer import (
+    EMPTY_REQUIREMENTS, _normalize_raw, _normalize_value, classify_key
+)
+
+
+@pytest.mark.parametrize("key, category", [
+    ("OS *", "os"),
+    ("SO", "os"),
+    ("Sistema operativo", "os"),
+    ("Betriebssystem", "os"),
+    ("Processador", "cpu"),
+    ("Processeur", "cpu"),
+    ("Memória", "ram"),
+    ("Arbeitsspeicher", "ram"),
+    ("Placa de vídeo", "gpu"),
+    ("Tarjeta gráfica", "gpu"),
+    ("Carte graphique", "gpu"),
+    ("DirectX®", "directx"),
+    ("Armazenamento", "storage"),
+    ("Espace disque", "storage"),
+    ("Hard Drive", "storage"),
+    ("Additional Notes", None),
+    ("Placa de som", None),
+])
+def test_key_aliases_in_every_language(key, category):
+    assert classify_key(key) == category
+
+
+@pytest.mark.parametrize("key, value, field, expected", [
+    ("Memory", "8 GB RAM", "ram_gb", 8),
+    ("Memória", "8 GB de RAM", "ram_gb", 8),
+    ("Mémoire", "6 Go de mémoire", "ram_gb", 6),
+    ("Memory", "512 MB RAM", "ram_gb", 0.5),
+    ("Memory", "1,5 GB RAM", "ram_gb", 1.5),
+    ("Storage", "1 TB available space", "storage_gb", 1024),
+    ("Espace disque", "70 Go d'espace disque disponible", "storage_gb", 70),
+    ("Storage", "500 MB available space", "storage_gb", 0.49),
+    ("Storage", "60 GB SSD", "storage_ssd", True),
+    ("DirectX", "Version 12", "directx", 12),
+    ("DirectX", "Versión 11", "directx", 11),
+    ("Graphics", "NVIDIA GeForce GTX 1060 6GB", "vram_gb", 6),
+    ("Graphics", "GTX 970, DirectX 12 compatible", "directx", 12),
+    ("OS", "Windows 10 64-bit", "os_64bit", True),
+])
+def test_units_and_values(key, value, field, expected):
+    assert getattr(normalize_requirements({key: value}), field) == expected
+
+
+def test_models_are_extracted_from_free_text():
+    normalized = normalize_requirements({
+        'Processor': "Intel Core i5-3570K or AMD FX-8350",
+        'Graphics': "NVIDIA GeForce GTX 970 / AMD Radeon R9 290X (4 GB)",
+    })
+    assert normalized.cpu_models == ("i5-3570k", "fx-8350")
+    assert normalized.gpu_models == ("gtx 970", "r9 290")
+    assert normalized.vram_gb == 4
+
+
+def test_system_names_use_the_same_model_format():
+    assert extract_cpu_models("13th Gen Intel(R) Core(TM) i7-13620H") == ("i7-13620h",)
+    assert extract_gpu_models("NVIDIA GeForce RTX 4050 Laptop GPU") == ("rtx 4050",)
+
+
+def test_first_value_of_each_field_wins():
+    normalized = normalize_requirements({'Graphics': "GTX 970, DirectX 11", 'DirectX': "Version 12"})
+    assert normalized.directx == 11
+
+
+def test_raw_section_without_keys():
+    normalized = normalize_requirements({'raw': "Core i5-2400, 8 GB RAM, GeForce GTX 660"})
+    assert (normalized.cpu_models, normalized.gpu_models, normalized.ram_gb) == (("i5-2400",), ("gtx 660",), 8)
+
+
+@pytest.mark.parametrize("section", [None, {}, {'status': "Não disponível"}, {'Additional Notes': "Nenhuma"}])
+def test_unavailable_sections_are_empty(section):
+    assert normalize_requirements(section) is EMPTY_REQUIREMENTS
+    assert EMPTY_REQUIREMENTS.is_empty
+
+
+def test_memoized_fields_are_immutable():
+    # O mesmo objeto é devolvido a todos os chamadores: um dict poderia ser alterado por um deles
+    fields = _normalize_value("gpu", "GTX 1060 6GB")
+    assert fields is _normalize_value("gpu", "GTX 1060 6GB")
+    assert isinstance(fields, tuple)
+    assert isinstance(_normalize_raw("8 GB RAM"), tuple)
+    with pytest.raises(TypeError):
+        fields[0] = ("gpu_text", "outra")
+
+    assert normalize_requirements({'Graphics': "GTX 1060 6GB"}) == NormalizedRequirements(
+        gpu_text="GTX 1060 6GB", gpu_models=("gtx 1060",), vram_gb=6
+    )
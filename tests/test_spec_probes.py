@@ -0,0 +1,184 @@
+from types import SimpleNamespace
+import time
+
+import pytest
+
+from src.services.spec_collectors import SpecCollector, SpecsSnapshotCache, StorageDevice, SystemSpecs
+from src.services.spec_collectors import base
+from src.services.spec_collectors.probes import run_probes
+from src.shared.cache import DiskCache
+
+
+class FakeCollector(SpecCollector):
+    """Backend com sondas controladas pelo teste."""
+
+    name = "fake"
+
+    def __init__(self, gpu_probe):
+        self.gpu_probe = gpu_probe
+        self.collections = 0
+
+    def fingerprint(self):
+        return {'collector': self.name}
+
+    def refresh(self, specs):
+        return specs
+
+    def collect(self) -> SystemSpecs:
+        self.collections += 1
+        probes = run_probes({'cpu': lambda: "Fake CPU", 'gpu': self.gpu_probe}, timeouts={'gpu': 0.2})
+        return SystemSpecs(
+            cpu_name=probes.get('cpu'), cpu_cores=4, cpu_threads=8, cpu_freq_base=3.0, cpu_freq_max=4.0,
+            ram_total=16, ram_free=8, ram_used=8, gpu_name=probes.get('gpu', "GPU não detectada"),
+            storage_devices=[], os_name="Linux", os_version="test",
+            probe_timings=probes.timings, probe_timeouts=probes.timeouts, probe_failures=probes.failures
+        )
+
+
+def failing_probe():
+    raise RuntimeError("falha transitória do WMI")
+
+
+def hanging_probe():
+    time.sleep(5)
+
+
+@pytest.fixture
+def snapshot_cache(tmp_path):
+    cache = DiskCache("system_specs", cache_dir=str(tmp_path))
+    yield SpecsSnapshotCache(cache=cache)
+    cache.close()
+
+
+def test_run_probes_reports_failures_and_timeouts():
+    results = run_probes(
+        {'ok': lambda: 1, 'bad': failing_probe, 'hang': hanging_probe},
+        timeouts={'hang': 0.2}
+    )
+    assert results.values == {'ok': 1}
+    assert results.failures == ['bad']
+    assert results.timeouts == ['hang']
+    assert set(results.timings) == {'ok', 'bad', 'hang'}
+    assert not results.complete
+
+
+@pytest.mark.parametrize("gpu_probe, field", [(failing_probe, 'probe_failures'), (hanging_probe, 'probe_timeouts')])
+def test_partial_snapshot_is_not_cached(snapshot_cache, gpu_probe, field):
+    collector = FakeCollector(gpu_probe)
+
+    specs = snapshot_cache.get_specs(collector)
+    assert specs.gpu_name == "GPU não detectada"
+    assert getattr(specs, field) == ['gpu']
+    assert snapshot_cache.cache.get(snapshot_cache.key(collector)) is None
+
+    snapshot_cache.get_specs(collector)
+    assert collector.collections == 2
+
+
+def test_complete_snapshot_is_cached(snapshot_cache):
+    collector = FakeCollector(lambda: "Fake GPU")
+
+    snapshot_cache.get_specs(collector)
+    specs = snapshot_cache.get_specs(collector)
+
+    assert collector.collections == 1
+    assert specs.gpu_name == "Fake GPU"
+    assert specs.probe_failures is None and specs.probe_timeouts is None
+
+
+class WarmCollector(FakeCollector):
+    """Backend com a atualização real dos campos dinâmicos e identificação alterável."""
+
+    refresh = SpecCollector.refresh
+
+    def __init__(self, gpu_probe=lambda: "Fake GPU"):
+        super().__init__(gpu_probe)
+        self.hardware = {'collector': self.name}
+
+    def fingerprint(self):
+        return dict(self.hardware)
+
+    def collect(self) -> SystemSpecs:
+        specs = super().collect()
+        specs.storage_devices = [StorageDevice(name="sda", type="SSD", total=500, free=100, mount_point="/")]
+        return specs
+
+
+@pytest.fixture
+def dynamic_values(monkeypatch):
+    """psutil e amostrador de carga falsos; o teste altera os valores retornados."""
+    values = {'available': 4, 'total': 16, 'free': {"/": 250}, 'cpu_load': 12.5}
+    gb = 1024**3
+    monkeypatch.setattr(base.psutil, "virtual_memory",
+                        lambda: SimpleNamespace(available=values['available'] * gb, total=values['total'] * gb))
+
+    def disk_usage(mount_point):
+        free = values['free'][mount_point]
+        if free is None:
+            time.sleep(5)   # ponto de montagem travado
+        return SimpleNamespace(free=free * gb)
+
+    monkeypatch.setattr(base.psutil, "disk_usage", disk_usage)
+    monkeypatch.setattr(base, "get_cpu_load_sampler",
+                        lambda: SimpleNamespace(current=lambda: values['cpu_load']))
+    return values
+
+
+def test_warm_path_updates_only_dynamic_fields(snapshot_cache, dynamic_values):
+    collector = WarmCollector()
+    snapshot_cache.get_specs(collector)
+
+    specs = snapshot_cache.get_specs(collector)
+    assert collector.collections == 1
+    assert (specs.cpu_name, specs.gpu_name, specs.ram_total) == ("Fake CPU", "Fake GPU", 16)
+    assert (specs.ram_free, specs.ram_used, specs.cpu_load) == (4, 12, 12.5)
+    assert specs.storage_devices[0].free == 250
+    assert specs.probe_timeouts == [] and specs.probe_failures == []
+
+
+def test_fingerprint_change_recollects(snapshot_cache, dynamic_values):
+    collector = WarmCollector()
+    snapshot_cache.get_specs(collector)
+
+    collector.hardware['gpu'] = ["10de:2684"]
+    snapshot_cache.get_specs(collector)
+    snapshot_cache.get_specs(collector)
+    assert collector.collections == 2
+
+
+def test_refresh_specs_skips_the_snapshot(snapshot_cache, dynamic_values):
+    collector = WarmCollector()
+    snapshot_cache.get_specs(collector)
+
+    snapshot_cache.get_specs(collector, refresh=True)
+    assert collector.collections == 2
+
+
+def test_expired_snapshot_recollects(tmp_path, dynamic_values):
+    cache = DiskCache("system_specs", cache_dir=str(tmp_path))
+    snapshot_cache = SpecsSnapshotCache(cache=cache, ttl=0.2)
+    collector = WarmCollector()
+    try:
+        snapshot_cache.get_specs(collector)
+        snapshot_cache.get_specs(collector)
+        assert collector.collections == 1
+
+        time.sleep(0.3)
+        snapshot_cache.get_specs(collector)
+        assert collector.collections == 2
+    finally:
+        cache.close()
+
+
+def test_hung_mount_keeps_the_snapshot_value(snapshot_cache, dynamic_values, monkeypatch):
+    monkeypatch.setenv("SYSTEM_SPECS_PROBE_TIMEOUT", "0.2")
+    collector = WarmCollector()
+    snapshot_cache.get_specs(collector)
+    dynamic_values['free']["/"] = None
+
+    start = time.perf_counter()
+    specs = snapshot_cache.get_specs(collector)
+    assert time.perf_counter() - start < 1.0
+    assert specs.probe_timeouts == ["disk:/"]
+    assert specs.storage_devices[0].free == 100
+    assert specs.ram_free == 4
@@ -0,0 +1,76 @@
+import json
+import pickle
+
+import pytest
+
+from src.shared.scraping import SteamAppIndex
+
+APPS = [
+    (1245620, "ELDEN RING"),
+    (292030, "The Witcher® 3: Wild Hunt"),
+    (1091500, "Cyberpunk 2077"),
+    (2138330, "Cyberpunk 2077: Phantom Liberty"),
+    (782330, "DOOM Eternal"),
+    (379720, "DOOM"),
+]
+
+
+@pytest.fixture
+def index():
+    app_ids, names = zip(*APPS)
+    return SteamAppIndex(app_ids, names)
+
+
+def test_exact_lookup_ignores_symbols_and_case(index):
+    assert index.lookup("the witcher 3 wild hunt") == (292030, "The Witcher® 3: Wild Hunt")
+    assert index.lookup("Elden Ring") == (1245620, "ELDEN RING")
+
+
+def test_duplicate_names_keep_the_oldest_app():
+    index = SteamAppIndex([900, 100], ["Portal", "Portal"])
+    assert index.lookup("Portal") == (100, "Portal")
+
+
+def test_fuzzy_lookup(index):
+    assert index.lookup("Cyberpunk 2077 Phantom") == (2138330, "Cyberpunk 2077: Phantom Liberty")
+    assert index.search("doom etrnal", limit=1)[0][0] == 782330
+    assert index.lookup("Completely Unrelated Game") is None
+
+
+def test_from_app_list(tmp_path):
+    path = tmp_path / "apps.json"
+    path.write_text(json.dumps({"applist": {"apps": [
+        {"appid": appid, "name": name} for appid, name in APPS
+    ] + [{"appid": 5, "name": "  "}]}}), encoding="utf-8")
+
+    assert len(SteamAppIndex.from_app_list(str(path))) == len(APPS)
+
+
+def test_load_after_save_uses_the_saved_trigram_index(index, tmp_path):
+    path = tmp_path / "index" / "apps.pickle"
+    index.save(str(path))
+    loaded = SteamAppIndex.load(str(path))
+
+    # O índice de trigramas vem pronto do arquivo, sem esperar a primeira busca
+    assert loaded._trigram_index == index._get_trigram_index()
+    assert list(loaded.app_ids) == list(index.app_ids)
+    assert loaded.lookup("doom eternal") == (782330, "DOOM Eternal")
+    assert loaded.lookup("Cyberpunk 2077 Phantom") == (2138330, "Cyberpunk 2077: Phantom Liberty")
+
+
+def test_load_version_1_builds_trigrams_on_demand(index, tmp_path):
+    path = tmp_path / "apps.pickle"
+    with open(path, "wb") as f:
+        pickle.dump((1, index.app_ids, index.names, index.normalized), f)
+
+    loaded = SteamAppIndex.load(str(path))
+    assert loaded._trigram_index is None
+    assert loaded.lookup("Cyberpunk 2077 Phantom")[0] == 2138330
+
+
+def test_load_rejects_unknown_version(tmp_path):
+    path = tmp_path / "apps.pickle"
+    with open(path, "wb") as f:
+        pickle.dump((99, [], [], [], {}), f)
+    with pytest.raises(ValueError):
+        SteamAppIndex.load(str(path))
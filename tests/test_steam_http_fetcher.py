@@ -0,0 +1,98 @@
+import http.server
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.shared.scraping import SteamHttpFetcher
+
+FIXTURES = Path(__file__).parent / "fixtures" / "steam"
+
+
+class FakeSteamHandler(http.server.BaseHTTPRequestHandler):
+    """Loja Steam local: busca, página do app e verificação de idade salvas."""
+
+    # Quantas visitas à página do app são desviadas para a verificação de idade
+    age_gate_visits = 0
+
+    def do_GET(self):
+        if self.path.startswith("/search/"):
+            self._send("search.html")
+        elif self.path.startswith("/agecheck/"):
+            self._send("age_gate.html")
+        elif self.path.startswith("/app/4242/"):
+            if self.server.app_visits < self.age_gate_visits:
+                self.server.app_visits += 1
+                self.send_response(302)
+                self.send_header("Location", "/agecheck/app/4242/")
+                self.end_headers()
+            else:
+                self._send("app_page.html")
+        else:
+            self.send_error(404)
+
+    def _send(self, fixture: str):
+        body = (FIXTURES / fixture).read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def steam_store(monkeypatch):
+    def start(age_gate_visits: int = 0):
+        handler = type("Handler", (FakeSteamHandler,), {"age_gate_visits": age_gate_visits})
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.app_visits = 0
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        monkeypatch.setenv("STEAM_BASE_URL", f"http://127.0.0.1:{server.server_port}/")
+        return server
+
+    servers = []
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetcher_uses_steam_base_url(steam_store):
+    server = steam_store()
+    with SteamHttpFetcher() as fetcher:
+        assert fetcher.base_url == f"http://127.0.0.1:{server.server_port}"
+        requirements = fetcher.get_game_requirements("Test Quest")
+
+    assert requirements.title == "Test Quest™"
+    assert requirements.app_id == 4242
+    assert requirements.price == "R$ 199,99"
+    assert requirements.minimum == {
+        'OS': "Windows 10 64-bit",
+        'Processor': "Intel Core i5-8400 or AMD Ryzen 5 2600",
+        'Memory': "8 GB RAM",
+        'Graphics': "NVIDIA GeForce GTX 1060 6GB or AMD Radeon RX 580 8GB",
+        'DirectX': "Version 12",
+        'Storage': "70 GB available space",
+    }
+    assert requirements.recommended['Processor'] == "Intel Core i7-10700K or AMD Ryzen 7 3700X"
+    assert requirements.recommended['Additional Notes'] == "SSD required"
+
+
+def test_fetcher_retries_through_age_gate(steam_store):
+    server = steam_store(age_gate_visits=1)
+    with SteamHttpFetcher() as fetcher:
+        requirements = fetcher.get_game_requirements("Test Quest", app_id=4242)
+
+    assert server.app_visits == 1
+    assert requirements.minimum['Memory'] == "8 GB RAM"
+    assert requirements.recommended['Memory'] == "16 GB RAM"
+
+
+def test_fetcher_gives_up_on_persistent_age_gate(steam_store):
+    steam_store(age_gate_visits=2)
+    with SteamHttpFetcher() as fetcher:
+        assert fetcher.get_game_requirements("Test Quest") is None
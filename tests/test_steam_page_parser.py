@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from src.shared.scraping import normalize_game_requirements, parse_app_page, parse_search_results
+from src.shared.scraping.steam_page_parser import UNAVAILABLE
+
+FIXTURES = Path(__file__).parent / "fixtures" / "steam"
+APP_URL = "https://store.steampowered.com/app/4242/Test_Quest/"
+
+
+def load(fixture: str) -> str:
+    return (FIXTURES / fixture).read_text(encoding="utf-8")
+
+
+def test_parses_minimum_and_recommended_columns():
+    requirements = parse_app_page(load("app_page.html"), APP_URL)
+
+    assert requirements.title == "Test Quest™"
+    assert requirements.app_id == 4242
+    assert requirements.source_url == APP_URL
+    assert requirements.price == "R$ 199,99"
+    assert requirements.minimum['Graphics'] == "NVIDIA GeForce GTX 1060 6GB or AMD Radeon RX 580 8GB"
+    assert requirements.recommended['Memory'] == "16 GB RAM"
+    # Só o primeiro bloco (Windows) é lido
+    assert requirements.minimum['OS'] == "Windows 10 64-bit"
+
+
+def test_page_without_recommended_section():
+    requirements = parse_app_page(load("app_no_recommended.html"), APP_URL)
+
+    assert requirements.minimum == {
+        'OS': "Windows 7",
+        'Processor': "2 GHz",
+        'Memory': "2 GB RAM",
+        'Graphics': "256 MB video memory, OpenGL 3.0+",
+        'Storage': "500 MB available space",
+    }
+    assert requirements.recommended == UNAVAILABLE
+    assert requirements.price == "R$ 23,99 (Original: R$ 59,99)"
+
+
+def test_age_gate_is_not_an_app_page():
+    assert parse_app_page(load("age_gate.html"), APP_URL) is None
+
+
+def test_non_english_labels():
+    requirements = parse_app_page(load("app_localized.html"), APP_URL)
+
+    assert requirements.price == "Free"
+    assert requirements.minimum == {
+        'SO': "Windows 10 (64 bits)",
+        'Processador': "Intel Core i3-6100 / AMD FX-8350",
+        'Memória': "8 GB de RAM",
+        'Placa de vídeo': "GeForce GTX 960 / Radeon R9 380",
+        'Armazenamento': "30 GB de espaço disponível",
+    }
+    minimum, recommended = normalize_game_requirements(requirements)
+    assert (minimum.ram_gb, minimum.storage_gb) == (8, 30)
+    assert recommended.ram_gb == 16
+
+
+@pytest.mark.parametrize("fixture", ["app_page.html", "app_no_recommended.html", "app_localized.html"])
+def test_section_titles_are_not_requirements(fixture):
+    requirements = parse_app_page(load(fixture), APP_URL)
+    for section in (requirements.minimum, requirements.recommended):
+        assert all(value for value in section.values())
+
+
+def test_search_results_are_absolute_urls():
+    results = parse_search_results(load("search.html"), "https://store.steampowered.com/search/?term=test")
+    assert results[0] == "https://store.steampowered.com/app/4242/Test_Quest/?snr=1_7_7_151_150_1"
+    assert len(results) == 2
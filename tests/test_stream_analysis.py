@@ -0,0 +1,103 @@
+from dataclasses import asdict
+import importlib
+import json
+
+import pytest
+
+from src.services.analyze_game_compatibility import (
+    CompatibilityAnalysis, PerformanceDetails, analysis_fields
+)
+
+module = importlib.import_module("src.services.analyze_game_compatibility")
+
+FALLBACK = CompatibilityAnalysis(
+    can_run=False, performance_level="Baixo", expected_issues=[], recommended_settings="",
+    upgrade_suggestions=[],
+    performance_details=PerformanceDetails(cpu_analysis="", gpu_analysis="", ram_analysis="",
+                                           storage_impact="", estimated_fps={})
+)
+
+STREAMED = CompatibilityAnalysis(
+    can_run=True, performance_level="Alto", expected_issues=["nenhum"], recommended_settings="Ultra",
+    upgrade_suggestions=[],
+    performance_details=PerformanceDetails(cpu_analysis="ok", gpu_analysis="ok", ram_analysis="ok",
+                                           storage_impact="ok", estimated_fps={})
+)
+
+
+class StreamProvider:
+    """Provider de streaming com trechos fixos, que pode cair no fim da resposta."""
+
+    def __init__(self, chunks, models, broken):
+        self.chunks = chunks
+        self.models = models
+        self.broken = broken
+        self.delivered = 0
+        self.closed = False
+
+    def stream_response(self, **kwargs):
+        try:
+            for chunk in self.chunks:
+                self.delivered += 1
+                yield chunk
+            if self.broken:
+                raise ConnectionError("conexão encerrada no meio da resposta")
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    """
+    Executa stream_game_compatibility; `accepts(outcome)` substitui a decisão
+    de nível (outcome é o veredito, a análise ou a exceção).
+    """
+    def run(chunks, accepts=lambda outcome: False, models=("modelo-rapido", "modelo-forte"), broken=True):
+        provider = StreamProvider(chunks, list(models), broken)
+        monkeypatch.setattr(module, "LLMProvider", lambda: provider)
+        monkeypatch.setattr(module, "build_analysis_prompt", lambda *args: "prompt")
+        monkeypatch.setattr(module, "_tier_accepts", lambda *args: accepts(args[4]))
+        monkeypatch.setattr(module, "_analyze_tiered", lambda *args, **kwargs: FALLBACK)
+        return provider, list(module.stream_game_compatibility(None, None, use_cache=False))
+    return run
+
+
+def accept_verdicts(outcome):
+    return isinstance(outcome, bool)
+
+
+def test_fallback_resets_fields_already_streamed(stream):
+    _, events = stream(['{"can_run": true, "performance_level": "Alto", "expected'], accepts=accept_verdicts)
+    assert events == [('can_run', True), ('performance_level', "Alto"), ('reset', None),
+                      *analysis_fields(FALLBACK), ('analysis', FALLBACK)]
+
+
+def test_fallback_without_streamed_fields_has_no_reset(stream):
+    _, events = stream(['{"can_'])
+    assert events == [*analysis_fields(FALLBACK), ('analysis', FALLBACK)]
+
+
+def test_borderline_verdict_escalates_before_showing_the_first_tier(stream):
+    chunks = ['{"can_run": true, ', '"performance_level": "Alto", ', '"expected_issues": []']
+    provider, events = stream(chunks, accepts=lambda outcome: False)
+
+    assert events == [*analysis_fields(FALLBACK), ('analysis', FALLBACK)]
+    # A resposta do primeiro nível é abandonada assim que o veredito chega
+    assert provider.delivered == 1
+    assert provider.closed
+
+
+def test_accepted_verdict_releases_the_held_fields(stream):
+    text = json.dumps(asdict(STREAMED))
+    _, events = stream([text[:40], text[40:]], accepts=accept_verdicts, broken=False)
+    assert dict(events[:-1]) == dict(analysis_fields(STREAMED))
+    assert events[-1] == ('analysis', STREAMED)
+
+
+def test_single_tier_is_never_held(stream):
+    text = json.dumps(asdict(STREAMED))
+    verdicts = []
+    _, events = stream([text], accepts=verdicts.append, models=("unico",), broken=False)
+    assert dict(events[:-1]) == dict(analysis_fields(STREAMED))
+    assert events[-1] == ('analysis', STREAMED)
+    assert verdicts == []
@@ -0,0 +1,63 @@
+import pytest
+
+from src.shared.scraping.webdriver_pool import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise ConnectionError("Chrome travou")
+        return 1
+
+
+class FakeScraper:
+    """GameSystemRequirements sem Chrome."""
+
+    def __init__(self):
+        self.driver = FakeDriver()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class FlakyFactory:
+    """Cria scrapers, falhando nas chamadas indicadas (a partir de 1)."""
+
+    def __init__(self, failures=()):
+        self.failures = set(failures)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls in self.failures:
+            raise OSError("chromedriver não iniciou")
+        return FakeScraper()
+
+
+def test_failed_respawn_is_retried_on_next_lease():
+    factory = FlakyFactory(failures={3})
+    with WebDriverPool(size=2, factory=factory) as pool:
+        with pool.lease(timeout=1) as scraper:
+            scraper.driver.alive = False
+        assert pool.stats()["size"] == 1
+
+        with pool.lease(timeout=1):
+            with pool.lease(timeout=1):
+                assert pool.stats()["size"] == 2
+        assert factory.calls == 4
+
+
+def test_lease_raises_when_pool_cannot_spawn_any_browser():
+    factory = FlakyFactory(failures={2, 3})
+    with WebDriverPool(size=1, factory=factory) as pool:
+        with pool.lease(timeout=1) as scraper:
+            scraper.driver.alive = False
+        with pytest.raises(OSError):
+            with pool.lease(timeout=1):
+                pass